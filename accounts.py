@@ -0,0 +1,299 @@
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+import multiprocessing
+from datetime import datetime
+
+from core import load_settings, configure
+from batch import parse_args as batch_args, load_batch, run_batch, ResultStream
+from checkpoint import Checkpoint
+from store import AppliedJobsStore
+from metrics import finish_run
+
+# Runs several LinkedIn accounts side by side, one process per account.
+# Example accounts file:
+# {
+#     "workers": 3,
+#     "defaults": {"performance_mode": true, "export_dir": "exports"},
+#     "accounts": [
+#         {"name": "alice", "username": "alice@example.com", "password": "...",
+#          "spec": "alice_spec.json", "settings": {"rate_limits": {"apply_submit": {"per_minute": 2}}}},
+#         {"name": "bob", "username": "bob@example.com", "password": "...",
+#          "searches": [{"keyword": "data analyst", "location": "Jakarta"}], "apply": {"enabled": true}}
+#     ]
+# }
+# Each account gets settings.json + defaults + its own "settings", and a
+# directory <root>/<name>/ for everything it writes: Chrome profile, cookies,
+# applied-jobs database, answers, logs, metrics and results.jsonl. Rate
+# budgets are per process, so every account paces itself independently.
+
+DEFAULT_ROOT = "accounts"
+RESULTS_FILE = "results.jsonl"
+CONSOLE_FILE = "console.log"
+# Settings that name a per-account file or directory, and their default name in it
+ACCOUNT_PATHS = {
+    "chrome_profile_dir": "chrome_profile",
+    "cookie_file": "linkedin_cookies.json",
+    "applied_jobs_db": "applied_jobs.db",
+    "answers_file": "easy_apply_answers.json",
+    "resume_documents_file": "resume_documents.json",
+    "geo_cache_file": "geo_cache.json",
+    "log_file": "linkedin_activity.log",
+    "metrics_file": "metrics.jsonl",
+    "checkpoint_file": "batch_checkpoint.json",
+}
+# Optional outputs that move into the account directory only when enabled
+OPTIONAL_PATHS = {
+    "prometheus_file": "metrics.prom",
+    "record_dir": "recordings",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run batch searches/applications for several accounts in parallel.")
+    parser.add_argument("accounts", help="JSON file with 'accounts' (and optional 'defaults', 'workers')")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="directory holding one subdirectory per account")
+    parser.add_argument("--workers", type=int, default=None, help="accounts running at once (default: CPU cores)")
+    parser.add_argument("--only", action="append", default=[], help="run only this account (repeatable)")
+    parser.add_argument("--timeout", type=float, default=None, help="stop an account after N minutes")
+    parser.add_argument("--full-scan", action="store_true", help="ignore the seen-jobs index")
+    parser.add_argument("--resume-run", action="store_true",
+                        help="continue each account's interrupted run from its checkpoint")
+    parser.add_argument("--report", default=None, help="write the combined report as JSON to this file")
+    return parser.parse_args(argv)
+
+
+# Settings for one account: settings.json, then the shared defaults, then the
+# account's own overrides; per-account files are placed in its directory
+# unless the account sets them explicitly
+def account_settings(base, defaults, account, directory):
+    settings = dict(base)
+    settings.update(defaults or {})
+    overrides = account.get("settings", {})
+    settings.update(overrides)
+    for key in ("username", "password"):
+        if account.get(key):
+            settings[key] = account[key]
+    for key, name in ACCOUNT_PATHS.items():
+        if key not in overrides:
+            settings[key] = os.path.join(directory, name)
+    for key, name in OPTIONAL_PATHS.items():
+        if settings.get(key) and key not in overrides:
+            settings[key] = os.path.join(directory, name)
+    settings["export_run_prefix"] = f"{account['name']}-"
+    return settings
+
+
+# Batch description for one account: its spec file, inline searches/apply
+# rules, or else the keyword/location in its settings, like batch.py
+def account_batch(account, settings):
+    if account.get("searches"):
+        defaults = {"location": "", "easy_apply": settings.get("easy_apply", True),
+                    "job_type": settings.get("job_type", "remote")}
+        batch = {"searches": [dict(defaults, **search) for search in account["searches"]], "apply": {}}
+    else:
+        batch = load_batch(batch_args(["--spec", account["spec"]] if account.get("spec") else []), settings)
+    batch["apply"].update(account.get("apply", {}))
+    return batch
+
+
+# Child process: one account, start to finish. It leads its own process
+# group so the scheduler can stop it together with its Chrome processes.
+def run_account(name, settings, batch, directory, resume=False):
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    # Progress text goes to the account's console log instead of the shared terminal
+    sys.stdout = sys.stderr = open(os.path.join(directory, CONSOLE_FILE), "a", buffering=1)
+    configure(settings)
+    store = AppliedJobsStore(settings["applied_jobs_db"])
+    results = ResultStream(os.path.join(directory, RESULTS_FILE))
+    checkpoint = Checkpoint(settings["checkpoint_file"])
+    if resume and checkpoint.resume(batch):
+        results.emit("resume", account=name, completed=len(checkpoint.state["completed"]),
+                     processed=len(checkpoint.state["processed"]))
+    else:
+        checkpoint.start(batch)
+    started = time.time()
+    code = 0
+    try:
+        results.emit("start", account=name, searches=len(batch["searches"]))
+        applied = run_batch(batch, settings, store, results, checkpoint)
+        results.emit("done", account=name, applied=applied, seconds=round(time.time() - started, 1))
+    except Exception as e:
+        logging.error(f"Account {name} failed: {e}")
+        results.emit("error", account=name, message=str(e))
+        code = 1
+    finally:
+        results.close()
+        store.close()
+        finish_run(settings)
+    sys.exit(code)
+
+
+def _stop(process):
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+    except (ProcessLookupError, PermissionError):
+        pass
+    process.join(10)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+# Start up to `workers` account processes at a time, the accounts with the
+# most searches first so long runs do not end up last. A process that
+# crashes, hangs past timeout or is locked out only ends its own account.
+# Ctrl-C stops every running account. Returns {name: {"status", "exitcode", "seconds"}}.
+def run_accounts(jobs, workers, timeout=None, poll=1.0):
+    context = multiprocessing.get_context("spawn")
+    pending = sorted(jobs, key=lambda job: -len(job["batch"]["searches"]))
+    running = {}
+    finished = {}
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                job = pending.pop(0)
+                process = context.Process(target=run_account, name=f"account-{job['name']}",
+                                          args=(job["name"], job["settings"], job["batch"], job["directory"],
+                                                job.get("resume", False)))
+                process.start()
+                running[job["name"]] = (process, time.monotonic())
+                print(f"Started account {job['name']} (pid {process.pid}).")
+            time.sleep(poll)
+            for name, (process, started) in list(running.items()):
+                elapsed = time.monotonic() - started
+                if not process.is_alive():
+                    process.join()
+                    status = "finished" if process.exitcode == 0 else "failed"
+                elif timeout and elapsed > timeout * 60:
+                    logging.warning(f"Account {name} exceeded {timeout} minutes, stopping it.")
+                    _stop(process)
+                    status = "timeout"
+                else:
+                    continue
+                del running[name]
+                finished[name] = {"status": status, "exitcode": process.exitcode, "seconds": round(elapsed, 1)}
+                print(f"Account {name} {status} after {elapsed:.0f}s.")
+    except KeyboardInterrupt:
+        # Children lead their own process groups, so Ctrl-C does not reach
+        # them; stop each one explicitly before reporting
+        print("Interrupted, stopping running accounts.")
+        for name, (process, started) in list(running.items()):
+            _stop(process)
+            del running[name]
+            finished[name] = {"status": "interrupted", "exitcode": process.exitcode,
+                              "seconds": round(time.monotonic() - started, 1)}
+        for job in pending:
+            finished[job["name"]] = {"status": "not_started", "exitcode": None, "seconds": 0}
+    return finished
+
+
+# Result events an account wrote since offset (its results file is appended to across runs)
+def read_results(path, offset=0):
+    events = []
+    if not os.path.exists(path):
+        return events
+    with open(path, "r", encoding="utf-8") as file:
+        file.seek(offset)
+        for line in file:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def summarize(name, events, process):
+    outcomes = {}
+    for event in events:
+        if event.get("event") == "apply":
+            outcomes[event.get("outcome")] = outcomes.get(event.get("outcome"), 0) + 1
+    done = [event for event in events if event.get("event") == "done"]
+    errors = [event.get("message") for event in events if event.get("event") == "error"]
+    status = process["status"]
+    if status == "finished" and errors:
+        status = "error"
+    elif status == "failed" and not errors:
+        status = "crashed"
+    return {
+        "account": name,
+        "status": status,
+        "exitcode": process["exitcode"],
+        "seconds": process["seconds"],
+        "searches": sum(1 for event in events if event.get("event") == "search"),
+        "jobs": sum(event.get("jobs", 0) for event in events if event.get("event") == "search"),
+        "applied": done[-1].get("applied", 0) if done else outcomes.get("applied", 0),
+        "outcomes": outcomes,
+        "errors": errors,
+    }
+
+
+def print_report(report):
+    print(f"\n{'account':<20}{'status':<12}{'searches':>9}{'jobs':>7}{'applied':>9}{'seconds':>9}")
+    for row in report["accounts"]:
+        print(f"{row['account'][:19]:<20}{row['status']:<12}{row['searches']:>9}{row['jobs']:>7}"
+              f"{row['applied']:>9}{row['seconds']:>9}")
+        for message in row["errors"]:
+            print(f"    error: {message}")
+    totals = report["totals"]
+    print(f"{'total':<32}{totals['searches']:>9}{totals['jobs']:>7}{totals['applied']:>9}{report['seconds']:>9}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with open(args.accounts, "r") as file:
+        config = json.load(file)
+    base = load_settings()
+    accounts = [account for account in config.get("accounts", []) if not args.only or account["name"] in args.only]
+    if not accounts:
+        print("No accounts to run.", file=sys.stderr)
+        return 2
+
+    jobs, offsets = [], {}
+    for account in accounts:
+        if not account.get("name") or not (account.get("username") or base.get("username")):
+            print(f"Skipping account without name or username: {account.get('name')}", file=sys.stderr)
+            continue
+        directory = os.path.abspath(os.path.join(args.root, account["name"]))
+        os.makedirs(directory, exist_ok=True)
+        settings = account_settings(base, config.get("defaults"), account, directory)
+        if args.full_scan:
+            settings["incremental_search"] = False
+        batch = account_batch(account, settings)
+        if not batch["searches"]:
+            print(f"Skipping account {account['name']}: no searches.", file=sys.stderr)
+            continue
+        results = os.path.join(directory, RESULTS_FILE)
+        offsets[account["name"]] = os.path.getsize(results) if os.path.exists(results) else 0
+        jobs.append({"name": account["name"], "settings": settings, "batch": batch, "directory": directory,
+                     "resume": args.resume_run})
+
+    workers = args.workers or config.get("workers") or min(len(jobs), os.cpu_count() or 1)
+    started = time.time()
+    finished = run_accounts(jobs, max(1, workers), args.timeout)
+
+    rows = [summarize(job["name"], read_results(os.path.join(job["directory"], RESULTS_FILE),
+                                                offsets[job["name"]]), finished[job["name"]]) for job in jobs]
+    report = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "seconds": round(time.time() - started, 1),
+        "accounts": rows,
+        "totals": {key: sum(row[key] for row in rows) for key in ("searches", "jobs", "applied")},
+    }
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(report, file, indent=4)
+    return 0 if all(row["status"] == "finished" for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+import os
+import gzip
+import json
+import time
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+from datetime import datetime
+
+DEFAULT_LOG_FILE = "linkedin_activity.log"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 30
+# Rotated files are named <log file>.<rotation time>.gz
+ROTATED_TIME_FORMAT = "%Y%m%d-%H%M%S-%f"
+
+# Fields copied from a record's extra= into the JSON event
+EVENT_FIELDS = ("event", "stage", "job_id", "title", "company", "location", "search", "outcome", "duration")
+
+_listener = None
+
+
+# One JSON object per line. "time" is always the first key so tools can
+# compare the timestamp as a plain string before decoding the line.
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        event = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in EVENT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                event[field] = value
+        event.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            event["exception"] = self.formatException(record.exc_info)
+        return json.dumps(event, default=str, ensure_ascii=False)
+
+
+# Rotates when the file exceeds max_bytes or at local midnight, gzips the
+# rotated file and keeps the newest backup_count of them. Only the listener
+# thread writes here, so compression never blocks the caller.
+class CompressingRotatingHandler(logging.handlers.RotatingFileHandler):
+    def __init__(self, filename, max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT, daily=True):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.daily = daily
+        self.rollover_at = self._next_midnight()
+
+    @staticmethod
+    def _next_midnight():
+        now = datetime.now()
+        return datetime(now.year, now.month, now.day).timestamp() + 24 * 3600
+
+    def shouldRollover(self, record):
+        if self.daily and record.created >= self.rollover_at and os.path.exists(self.baseFilename) \
+                and os.path.getsize(self.baseFilename) > 0:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.rollover_at = self._next_midnight()
+        if os.path.exists(self.baseFilename):
+            # backup_count 0 keeps no history, as with RotatingFileHandler:
+            # the log just starts over
+            if self.backupCount <= 0:
+                os.remove(self.baseFilename)
+            else:
+                target = f"{self.baseFilename}.{datetime.now().strftime(ROTATED_TIME_FORMAT)}.gz"
+                rotating = self.baseFilename + ".rotating"
+                os.replace(self.baseFilename, rotating)
+                with open(rotating, "rb") as source, gzip.open(target, "wb") as compressed:
+                    shutil.copyfileobj(source, compressed)
+                os.remove(rotating)
+                for stale in rotated_files(self.baseFilename)[:-self.backupCount]:
+                    os.remove(stale)
+        self.stream = self._open()
+
+
+# Rotated files for a log, oldest first
+def rotated_files(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    prefix = os.path.basename(path) + "."
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.startswith(prefix) and name.endswith(".gz"))
+
+
+# Route all logging through a queue to a listener thread that writes JSON
+# lines to the rotating file, so the hot path never waits on disk I/O.
+def configure_logging(settings=None, level=logging.INFO):
+    global _listener
+    settings = settings or {}
+    if _listener is not None:
+        return _listener
+    handler = CompressingRotatingHandler(
+        settings.get("log_file", DEFAULT_LOG_FILE),
+        int(settings.get("log_max_bytes", DEFAULT_MAX_BYTES)),
+        int(settings.get("log_backup_count", DEFAULT_BACKUP_COUNT)),
+        settings.get("log_rotate_daily", True),
+    )
+    handler.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+# Flush queued records and stop the listener thread
+def stop_logging():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# Log a structured event, e.g. log_event("job", stage="apply_jobs", job_id=..., outcome="applied")
+def log_event(event, message=None, level=logging.INFO, **fields):
+    extra = {"event": event}
+    extra.update({key: value for key, value in fields.items() if key in EVENT_FIELDS})
+    other = {key: value for key, value in fields.items() if key not in EVENT_FIELDS}
+    if other:
+        extra["fields"] = other
+    logging.log(level, message or event, extra=extra)
+
+
+# Log the outcome of one job with its duration
+def log_job(job, outcome, stage, search=None, started=None):
+    log_event(
+        "job",
+        f"{outcome}: {job.get('Job Title')} at {job.get('Company')}",
+        stage=stage,
+        job_id=job.get("Job ID"),
+        title=job.get("Job Title"),
+        company=job.get("Company"),
+        location=job.get("Location"),
+        search=search,
+        outcome=outcome,
+        duration=round(time.perf_counter() - started, 3) if started else None,
+    )
@@ -0,0 +1,132 @@
+import os
+import re
+import sys
+import glob
+import argparse
+
+from export import SEARCHED, OUTCOME, DEFAULT_EXPORT_DIR
+
+# Outcomes where an Easy Apply form was actually attempted
+ATTEMPTED = ("applied", "failed", "unconfirmed", "needs_answers")
+COLUMNS = ["time", "event", "keyword", "job_id", "title", "company", "outcome"]
+PARTITION = re.compile(r"date=(\d{4}-\d{2}-\d{2})[\\/]run=([^\\/]+)[\\/]part-\d+\.(parquet|csv)$")
+
+# Example: python analytics.py --dir exports --since 2026-07-01 --report companies --min-attempts 5
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Hit rates, apply success and duplicate postings from the export.")
+    parser.add_argument("--dir", default=DEFAULT_EXPORT_DIR, help="export_dir the runs were written to")
+    parser.add_argument("--since", help="first day to include (YYYY-MM-DD)")
+    parser.add_argument("--until", help="last day to include (YYYY-MM-DD, inclusive)")
+    parser.add_argument("--report", choices=["keywords", "companies", "duplicates", "all"], default="all")
+    parser.add_argument("--top", type=int, default=20, help="rows to print per report")
+    parser.add_argument("--min-attempts", type=int, default=3, help="companies with fewer attempts are left out")
+    parser.add_argument("--csv", help="directory to write each full report to as CSV")
+    return parser.parse_args(argv)
+
+
+# Part files between since and until; days outside the range are skipped by
+# their partition directory without being opened
+def partition_files(directory, since=None, until=None):
+    files = []
+    for path in sorted(glob.glob(os.path.join(directory, "date=*", "run=*", "part-*"))):
+        match = PARTITION.search(path)
+        if not match:
+            continue
+        day = match.group(1)
+        if (since and day < since[:10]) or (until and day > until[:10]):
+            continue
+        files.append((path, match.group(2), match.group(3)))
+    return files
+
+
+# One frame with the columns the reports need; repeated strings are stored
+# as categoricals, which keeps months of history small in memory
+def load_results(directory, since=None, until=None):
+    import pandas as pd
+    frames = []
+    for path, run, fmt in partition_files(directory, since, until):
+        if fmt == "parquet":
+            frame = pd.read_parquet(path, columns=COLUMNS)
+        else:
+            frame = pd.read_csv(path, usecols=COLUMNS, dtype=str, keep_default_na=False)
+        frame["run"] = run
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=COLUMNS + ["run"])
+    frame = pd.concat(frames, ignore_index=True)
+    for column in ("event", "keyword", "company", "outcome", "run"):
+        frame[column] = frame[column].fillna("").astype("category")
+    frame["job_id"] = frame["job_id"].astype(str)
+    return frame
+
+
+# Lower-cased, whitespace-collapsed copy of a text column; each distinct
+# value is normalized once and mapped back through its factorized codes
+def normalized(series):
+    import pandas as pd
+    codes, uniques = pd.factorize(series.astype(str).fillna(""))
+    keys = pd.Series(uniques, dtype=str).str.lower().str.replace(r"\s+", " ", regex=True).str.strip().to_numpy()
+    return pd.Series(keys[codes], index=series.index)
+
+
+# Per keyword: result rows, unique jobs found, jobs applied to and the share applied
+def keyword_hit_rates(frame):
+    searched = frame[frame["event"] == SEARCHED]
+    applied = frame[(frame["event"] == OUTCOME) & (frame["outcome"] == "applied")]
+    report = searched.groupby("keyword", observed=True).agg(
+        runs=("run", "nunique"), results=("job_id", "size"), unique_jobs=("job_id", "nunique"))
+    report["applied"] = applied.groupby("keyword", observed=True)["job_id"].nunique()
+    report["applied"] = report["applied"].fillna(0).astype(int)
+    report["hit_rate"] = (report["applied"] / report["unique_jobs"]).round(3)
+    return report.sort_values(["unique_jobs", "hit_rate"], ascending=False)
+
+
+# Per company: Easy Apply attempts, how many were submitted and the success rate
+def company_success(frame, min_attempts=1):
+    attempts = frame[(frame["event"] == OUTCOME) & frame["outcome"].isin(ATTEMPTED)]
+    report = attempts.assign(submitted=attempts["outcome"] == "applied").groupby("company", observed=True).agg(
+        attempts=("submitted", "size"), applied=("submitted", "sum"))
+    report = report[report["attempts"] >= min_attempts]
+    report["success_rate"] = (report["applied"] / report["attempts"]).round(3)
+    return report.sort_values(["attempts", "success_rate"], ascending=False)
+
+
+# The same title at the same company listed under several job ids
+def duplicate_postings(frame):
+    searched = frame[frame["event"] == SEARCHED]
+    keys = searched.assign(company_key=normalized(searched["company"]), title_key=normalized(searched["title"]))
+    report = keys.groupby(["company_key", "title_key"], observed=True).agg(
+        postings=("job_id", "nunique"), first_seen=("time", "min"), last_seen=("time", "max"),
+        company=("company", "first"), title=("title", "first"))
+    report = report[report["postings"] > 1].reset_index(drop=True)
+    return report[["company", "title", "postings", "first_seen", "last_seen"]].sort_values("postings", ascending=False)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    frame = load_results(args.dir, args.since, args.until)
+    if frame.empty:
+        print(f"No exported results in {args.dir}.", file=sys.stderr)
+        return 1
+    print(f"{len(frame)} rows from {frame['run'].nunique()} runs")
+    reports = {
+        "keywords": lambda: keyword_hit_rates(frame),
+        "companies": lambda: company_success(frame, args.min_attempts),
+        "duplicates": lambda: duplicate_postings(frame),
+    }
+    for name, build in reports.items():
+        if args.report not in (name, "all"):
+            continue
+        report = build()
+        print(f"\n== {name} ({len(report)} rows) ==")
+        print(report.head(args.top).to_string() if len(report) else "(none)")
+        if args.csv:
+            os.makedirs(args.csv, exist_ok=True)
+            report.to_csv(os.path.join(args.csv, f"{name}.csv"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+import json
+import time
+import asyncio
+import logging
+from urllib.parse import urlparse
+from selenium.webdriver.common.by import By
+from extract import EXTRACT_JOB_CARDS_JS
+from pagination import page_url, PAGE_SIZE, MAX_PAGES
+from ratelimit import default_limiter, PAGE_LOAD
+
+# Asyncio facade over the W3C WebDriver HTTP protocol. One event loop can
+# drive many browser sessions (a single chromedriver process hosts them all),
+# and the method names mirror Selenium's so the existing flows port to
+# coroutines by adding "await". No third-party HTTP client is needed: the
+# protocol is plain JSON over keep-alive HTTP/1.1.
+#
+# Only login and search are ported. Applying stays on the Selenium path in
+# core.apply_jobs: EasyApplyForm and ResumeManager are synchronous, and
+# submissions are rate limited to a few per minute anyway, so concurrent
+# sessions would not speed them up.
+
+ELEMENT_KEY = "element-6066-11e4-a52f-4d7b23b5bd3e"
+
+
+class WebDriverError(Exception):
+    def __init__(self, error, message, status):
+        super().__init__(f"{error}: {message}")
+        self.error = error
+        self.status = status
+
+
+# Minimal keep-alive HTTP/1.1 JSON client; one connection per session
+class _Connection:
+    def __init__(self, endpoint):
+        parts = urlparse(endpoint)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.reader = None
+        self.writer = None
+        self.lock = asyncio.Lock()
+
+    async def _connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload if payload is not None else {}).encode() if method == "POST" else b""
+        head = (f"{method} {self.base_path}{path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(body)}\r\n"
+                f"Connection: keep-alive\r\n\r\n").encode()
+        async with self.lock:
+            for attempt in range(2):
+                if self.writer is None:
+                    await self._connect()
+                try:
+                    self.writer.write(head + body)
+                    await self.writer.drain()
+                    return await self._read_response()
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The server closed an idle keep-alive connection; reconnect once
+                    self.close()
+                    if attempt:
+                        raise
+
+    async def _read_response(self):
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            raw = b"".join(chunks)
+        else:
+            raw = await self.reader.readexactly(int(headers.get("content-length", "0")))
+
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, json.loads(raw) if raw else {}
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+# Translate Selenium locator strategies into the W3C ones
+def _locator(by, value):
+    if by == By.ID:
+        return "css selector", f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css selector", f".{value}"
+    if by == By.NAME:
+        return "css selector", f'[name="{value}"]'
+    return by, value
+
+
+class AsyncElement:
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    def _path(self, suffix=""):
+        return f"/element/{self.id}{suffix}"
+
+    async def click(self):
+        await self.driver.command("POST", self._path("/click"))
+
+    async def send_keys(self, text):
+        await self.driver.command("POST", self._path("/value"), {"text": str(text)})
+
+    async def text(self):
+        return await self.driver.command("GET", self._path("/text"))
+
+    async def get_attribute(self, name):
+        return await self.driver.command("GET", self._path(f"/attribute/{name}"))
+
+    async def is_selected(self):
+        return await self.driver.command("GET", self._path("/selected"))
+
+    async def find_element(self, by, value):
+        using, value = _locator(by, value)
+        return await self.driver.command("POST", self._path("/element"), {"using": using, "value": value})
+
+    def to_json(self):
+        return {ELEMENT_KEY: self.id}
+
+
+class AsyncWebDriver:
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.connection = _Connection(endpoint)
+        self.session_id = None
+        self.round_trips = 0
+
+    @classmethod
+    async def create(cls, endpoint, capabilities=None):
+        driver = cls(endpoint)
+        await driver.start_session(capabilities or {})
+        return driver
+
+    async def start_session(self, capabilities):
+        status, response = await self.connection.request(
+            "POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        value = response.get("value", {})
+        if status >= 400:
+            raise WebDriverError(value.get("error"), value.get("message"), status)
+        self.session_id = value.get("sessionId") or response.get("sessionId")
+        return value
+
+    async def command(self, method, path, payload=None):
+        self.round_trips += 1
+        status, response = await self.connection.request(method, f"/session/{self.session_id}{path}", payload)
+        value = response.get("value")
+        if status >= 400:
+            value = value or {}
+            raise WebDriverError(value.get("error"), value.get("message"), status)
+        return self._unwrap(value)
+
+    def _unwrap(self, value):
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    def _wrap(self, value):
+        if isinstance(value, AsyncElement):
+            return value.to_json()
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    async def get(self, url):
+        await self.command("POST", "/url", {"url": url})
+
+    async def current_url(self):
+        return await self.command("GET", "/url")
+
+    async def find_element(self, by, value):
+        using, value = _locator(by, value)
+        return await self.command("POST", "/element", {"using": using, "value": value})
+
+    async def find_elements(self, by, value):
+        using, value = _locator(by, value)
+        return await self.command("POST", "/elements", {"using": using, "value": value})
+
+    async def execute_script(self, script, *args):
+        return await self.command("POST", "/execute/sync", {"script": script, "args": self._wrap(list(args))})
+
+    async def get_cookies(self):
+        return await self.command("GET", "/cookie")
+
+    async def add_cookie(self, cookie):
+        await self.command("POST", "/cookie", {"cookie": cookie})
+
+    async def quit(self):
+        try:
+            if self.session_id:
+                await self.command("DELETE", "")
+        finally:
+            self.connection.close()
+
+
+# Async counterpart of WebDriverWait(...).until(...)
+async def wait_until(driver, condition, timeout=10, poll=0.25):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = await condition(driver)
+            if result:
+                return result
+        except WebDriverError:
+            pass
+        if time.monotonic() >= deadline:
+            raise asyncio.TimeoutError(f"Condition not met within {timeout}s")
+        await asyncio.sleep(poll)
+
+
+# Coroutine port of login_linkedin
+async def login_linkedin(driver, username, password, pause=asyncio.sleep):
+    await driver.get("https://www.linkedin.com/login")
+    username_field = await wait_until(driver, lambda d: d.find_element(By.ID, "username"))
+    await username_field.send_keys(username)
+    await pause(0.5)
+    await (await driver.find_element(By.ID, "password")).send_keys(password)
+    await pause(0.5)
+
+    # Uncheck "Remember Me" if it exists
+    try:
+        remember_me_checkbox = await driver.find_element(By.XPATH, "//input[@id='remember-me']")
+        if await remember_me_checkbox.is_selected():
+            await remember_me_checkbox.click()
+            logging.info("Unchecked 'Remember Me' option.")
+    except WebDriverError as e:
+        logging.info(f"'Remember Me' option not found or could not be unchecked: {e}")
+
+    await (await driver.find_element(By.XPATH, "//button[@type='submit']")).click()
+    logging.info("Logged in to LinkedIn successfully (async session).")
+
+
+# Coroutine port of the paginated search: same start= offsets, job id dedup
+# and early stop as pagination.iter_pages, yielding plain job dicts
+async def iter_jobs(driver, base_url, roles_to_display=None, is_applied=None, max_pages=MAX_PAGES):
+    seen = set()
+    yielded = 0
+    for page in range(max_pages):
+        await asyncio.sleep(default_limiter().reserve(PAGE_LOAD))
+        await driver.get(page_url(base_url, page * PAGE_SIZE))
+        try:
+            await wait_until(driver, lambda d: d.find_elements(By.CLASS_NAME, "job-card-container"))
+        except asyncio.TimeoutError:
+            break
+        new_jobs = []
+        for job in await driver.execute_script(EXTRACT_JOB_CARDS_JS, 0) or []:
+            key = job.get("Job ID") or (job.get("Job Title"), job.get("Company"))
+            if key not in seen:
+                seen.add(key)
+                new_jobs.append(job)
+        if not new_jobs:
+            break
+        for job in new_jobs:
+            yield job
+            yielded += 1
+            if roles_to_display and yielded >= roles_to_display:
+                return
+        if is_applied and all(is_applied(job.get("Job ID")) for job in new_jobs):
+            break
+
+
+async def search_jobs(driver, base_url, roles_to_display=None, is_applied=None):
+    return [job async for job in iter_jobs(driver, base_url, roles_to_display, is_applied)]
+
+
+# Run one coroutine per session on a single event loop. make_session is an
+# async factory returning a ready AsyncWebDriver; work(driver, item) is
+# awaited for every item. Sessions pull items from a shared queue and a
+# failing item never stops the others. Returns (results, failures).
+async def run_sessions(items, make_session, work, sessions=10):
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+    results, failures = [], []
+
+    async def worker(worker_id):
+        driver = None
+        try:
+            while not queue.empty():
+                item = queue.get_nowait()
+                try:
+                    if driver is None:
+                        driver = await make_session()
+                    results.append((item, await work(driver, item)))
+                except Exception as e:
+                    logging.error(f"Async session {worker_id} failed on {item!r}: {e}")
+                    failures.append((item, str(e)))
+        finally:
+            if driver is not None:
+                try:
+                    await driver.quit()
+                except Exception as e:
+                    logging.warning(f"Could not close async session {worker_id}: {e}")
+
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(max(1, min(sessions, len(items))))))
+    return results, failures
+
+
+# Start a chromedriver process that all async sessions share
+async def start_chromedriver(port=9515):
+    from session import chromedriver_path
+    process = await asyncio.create_subprocess_exec(
+        chromedriver_path(), f"--port={port}",
+        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+    endpoint = f"http://127.0.0.1:{port}"
+    for _ in range(50):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return process, endpoint
+        except OSError:
+            await asyncio.sleep(0.1)
+    process.kill()
+    raise RuntimeError("chromedriver did not start")
+
+
+# Chrome capabilities for an async session (headless by default)
+def chrome_capabilities(headless=True, extra_args=()):
+    args = ["--disable-gpu", "--disable-notifications", "--disable-extensions", *extra_args]
+    if headless:
+        args.append("--headless=new")
+    return {"browserName": "chrome", "goog:chromeOptions": {"args": args}}
+
+
+# Search many result URLs concurrently from one process: starts a shared
+# chromedriver, opens up to `sessions` browsers that reuse the saved login
+# cookies, and returns {url: [job, ...]} plus the failures
+async def search_concurrently(urls, sessions=10, cookie_file=None, roles_to_display=None, port=9515):
+    process, endpoint = await start_chromedriver(port)
+    cookies = []
+    if cookie_file:
+        try:
+            with open(cookie_file, "r") as file:
+                cookies = json.load(file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Async sessions start without saved cookies: {e}")
+
+    async def make_session():
+        driver = await AsyncWebDriver.create(endpoint, chrome_capabilities())
+        if cookies:
+            await driver.get("https://www.linkedin.com/")
+            for cookie in cookies:
+                try:
+                    await driver.add_cookie(cookie)
+                except WebDriverError:
+                    pass
+        return driver
+
+    async def work(driver, url):
+        return await search_jobs(driver, url, roles_to_display)
+
+    try:
+        results, failures = await run_sessions(urls, make_session, work, sessions)
+    finally:
+        process.terminate()
+        await process.wait()
+    return dict(results), failures
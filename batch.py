@@ -0,0 +1,259 @@
+import sys
+import json
+import time
+import logging
+import argparse
+import contextlib
+from datetime import datetime
+
+from core import load_settings, configure, start_session, stream_job_pages, apply_jobs, record_outcome
+from resilience import CircuitOpenError
+from stream import tap, until, mark_exhausted
+from filters import JobFilter
+from resumes import ResumeManager, ResumeError, DEFAULT_DOCUMENTS_FILE
+from store import AppliedJobsStore
+from session import DEFAULT_COOKIE_FILE
+from export import active_exporter
+from checkpoint import Checkpoint, checkpointed, DEFAULT_CHECKPOINT_FILE
+from metrics import finish_run
+
+# Example job-spec file:
+# {
+#     "searches": [
+#         {"keyword": "cybersecurity", "location": "Worldwide", "easy_apply": true,
+#          "job_type": "remote", "roles_to_display": 25}
+#     ],
+#     "apply": {
+#         "enabled": true,
+#         "use_existing_resume": true,
+#         "pdf_path": null,
+#         "resume_by_keyword": {"security": "resume_security.pdf"},
+#         "title_include": ["engineer", "analyst"],
+#         "title_exclude": ["intern", "principal"],
+#         "company_exclude": ["Acme"],
+#         "seniority_weights": {"senior|lead": -1, "junior|entry": 1},
+#         "location_weights": {"remote": 2},
+#         "keyword_weights": {"security": 2},
+#         "min_score": 0,
+#         "max_applications": 20
+#     }
+# }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run LinkedIn job searches and applications unattended.")
+    parser.add_argument("--spec", help="JSON job-spec file with 'searches' and 'apply' sections")
+    parser.add_argument("--keyword", action="append", default=[], help="search keyword (repeatable)")
+    parser.add_argument("--location", action="append", default=[], help="search location (repeatable)")
+    parser.add_argument("--job-type", default=None, help="remote/hybrid/onsite")
+    parser.add_argument("--no-easy-apply", action="store_true", help="do not filter on Easy Apply")
+    parser.add_argument("--roles", type=int, default=None, help="maximum roles per search")
+    parser.add_argument("--apply", action="store_true", help="apply to every job that passes the rules")
+    parser.add_argument("--resume", default=None, help="PDF resume to upload instead of the LinkedIn one")
+    parser.add_argument("--resume-run", action="store_true",
+                        help="continue the last interrupted run from its checkpoint")
+    parser.add_argument("--output", default="-",
+                        help="JSONL result stream, '-' for stdout (progress text then goes to stderr)")
+    parser.add_argument("--every", type=float, default=None,
+                        help="daemon mode: repeat the whole batch every N minutes")
+    parser.add_argument("--full-scan", action="store_true",
+                        help="ignore the seen-jobs index and walk every result page")
+    return parser.parse_args(argv)
+
+
+# Merge the spec file and the command line into one batch description
+def load_batch(args, settings):
+    batch = {"searches": [], "apply": {}}
+    if args.spec:
+        with open(args.spec, "r") as file:
+            batch.update(json.load(file))
+
+    keywords = args.keyword or ([settings["keyword"]] if settings.get("keyword") and not batch["searches"] else [])
+    locations = args.location or [settings.get("location", "")]
+    for keyword in keywords:
+        for location in locations:
+            search = {
+                "keyword": keyword,
+                "location": location,
+                "easy_apply": not args.no_easy_apply and settings.get("easy_apply", True),
+                "job_type": args.job_type or settings.get("job_type", "remote"),
+            }
+            if args.roles:
+                search["roles_to_display"] = args.roles
+            batch["searches"].append(search)
+
+    if args.apply:
+        batch["apply"]["enabled"] = True
+    if args.resume:
+        batch["apply"]["use_existing_resume"] = False
+        batch["apply"]["pdf_path"] = args.resume
+    return batch
+
+
+class ResultStream:
+    def __init__(self, path):
+        self.file = sys.stdout if path == "-" else open(path, "a")
+
+    def emit(self, event, **fields):
+        record = {"time": datetime.now().isoformat(timespec="seconds"), "event": event}
+        record.update(fields)
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+# Run every search, and optionally apply, without any prompts. With a
+# checkpoint, progress is saved after every job and a resumed checkpoint
+# continues at the search, page and job where the previous run stopped.
+def run_batch(batch, settings, store, results, checkpoint=None):
+    rules = batch.get("apply", {})
+    use_existing_resume = rules.get("use_existing_resume", True)
+    pdf_path = rules.get("pdf_path")
+    try:
+        # Validate every resume once, before the first application
+        resumes = ResumeManager(None if use_existing_resume else pdf_path,
+                                None if use_existing_resume else rules.get("resume_by_keyword"),
+                                settings.get("resume_documents_file", DEFAULT_DOCUMENTS_FILE))
+        if not use_existing_resume and resumes.default is None:
+            raise ResumeError("No pdf_path given for use_existing_resume=false.")
+    except ResumeError as e:
+        results.emit("error", message=str(e))
+        return 0
+
+    # Rules are evaluated on the listing data before any card is clicked
+    job_filter = JobFilter(rules, store)
+    max_applications = rules.get("max_applications")
+    # Only submitted applications count towards max_applications
+    totals = {"applied": checkpoint.state["applied"] if checkpoint else 0}
+    limit_reached = lambda: max_applications is not None and totals["applied"] >= max_applications
+    interrupted = False
+
+    driver = start_session(settings.get("username"), settings.get("password"),
+                           settings.get("chrome_profile_dir"), settings.get("cookie_file", DEFAULT_COOKIE_FILE),
+                           settings.get("performance_mode", False))
+    try:
+        for index, spec in enumerate(batch["searches"]):
+            if limit_reached():
+                results.emit("limit", message=f"Reached max_applications={max_applications}")
+                break
+            if checkpoint and checkpoint.completed(index):
+                continue
+            search = f"{spec['keyword']} / {spec['location']}"
+            found = {"jobs": 0}
+            progress = {"exhausted": False, "failed": False}
+            first_start = checkpoint.offset(index) if checkpoint else 0
+            if checkpoint:
+                checkpoint.begin_search(index, spec)
+
+            def on_page(page):
+                found["jobs"] += len(page)
+                for job in page:
+                    results.emit("job", search=search, job=job)
+
+            def report(job, outcome):
+                if outcome == "applied":
+                    totals["applied"] += 1
+                results.emit("apply", search=search, outcome=outcome, job=job)
+                if checkpoint:
+                    checkpoint.job_done(job.get("Job ID"), outcome)
+
+            # Jobs the rules turn down are logged and exported like apply_jobs outcomes
+            def reject(job):
+                record_outcome(job, "skipped", search, "job_filter", store=store)
+                report(job, "skipped")
+
+            # Search result pages stream through the filter straight into the apply stage.
+            # A resumed search pages on from its checkpoint, not from the seen-jobs index.
+            pages = stream_job_pages(driver, **spec, store=store, prefetch=settings.get("prefetch_next_page", False),
+                                     incremental=settings.get("incremental_search", True) and not first_start,
+                                     first_start=first_start, on_error=lambda e: progress.update(failed=True))
+            if checkpoint:
+                pages = checkpointed(pages, checkpoint)
+            pages = mark_exhausted(pages, progress)
+            pages = tap(pages, on_page)
+            if rules.get("enabled"):
+                jobs = job_filter.filter_pages(pages, on_reject=reject)
+                apply_jobs(driver, use_existing_resume, pdf_path, settings, store, search,
+                           decide=lambda job: True, report=report, jobs=until(jobs, limit_reached), resumes=resumes)
+            else:
+                for _ in pages:
+                    pass
+            results.emit("search", search=spec, jobs=found["jobs"])
+            # Only a search read to the end is complete; otherwise a resumed run picks it up again
+            if progress["exhausted"] and not progress["failed"]:
+                if checkpoint:
+                    checkpoint.search_done(index)
+            elif not limit_reached():
+                interrupted = True
+        if checkpoint and not interrupted:
+            checkpoint.finish()
+    except CircuitOpenError as e:
+        # Fresh sessions kept failing: stop, and leave the checkpoint for --resume-run
+        logging.error(f"Stopping the batch: {e}")
+        results.emit("error", message=str(e))
+    finally:
+        driver.quit()
+    return totals["applied"]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    settings = load_settings()
+    configure(settings)
+    batch = load_batch(args, settings)
+    if args.full_scan:
+        settings["incremental_search"] = False
+    if not batch["searches"]:
+        print("No searches given: pass --spec or --keyword.", file=sys.stderr)
+        return 2
+    if not settings.get("username") or not settings.get("password"):
+        print("Batch mode needs username and password in settings.json.", file=sys.stderr)
+        return 2
+
+    store = AppliedJobsStore(settings.get("applied_jobs_db", "applied_jobs.db"))
+    results = ResultStream(args.output)
+    checkpoint = Checkpoint(settings.get("checkpoint_file") or DEFAULT_CHECKPOINT_FILE)
+    resume = args.resume_run
+    try:
+        while True:
+            started = time.time()
+            # Only the first pass can continue an interrupted run
+            if resume and checkpoint.resume(batch):
+                results.emit("resume", checkpoint=checkpoint.path, completed=len(checkpoint.state["completed"]),
+                             processed=len(checkpoint.state["processed"]))
+            else:
+                if resume:
+                    print("No unfinished checkpoint for these searches, starting from the beginning.",
+                          file=sys.stderr)
+                checkpoint.start(batch)
+            resume = False
+            results.emit("start", searches=len(batch["searches"]))
+            try:
+                # Keep stdout clean for the JSONL stream
+                with contextlib.redirect_stdout(sys.stderr if args.output == "-" else sys.stdout):
+                    applied = run_batch(batch, settings, store, results, checkpoint)
+                results.emit("done", applied=applied, seconds=round(time.time() - started, 1))
+            except Exception as e:
+                logging.error(f"Batch run failed: {e}")
+                results.emit("error", message=str(e))
+            # Each pass is its own run partition in the result export
+            if active_exporter():
+                active_exporter().new_run()
+            if args.every is None:
+                break
+            time.sleep(max(0.0, args.every * 60 - (time.time() - started)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        results.close()
+        store.close()
+        with contextlib.redirect_stdout(sys.stderr if args.output == "-" else sys.stdout):
+            finish_run(settings)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
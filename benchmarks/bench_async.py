@@ -0,0 +1,113 @@
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+import pathlib
+import resource
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import async_driver
+from ratelimit import set_default_limiter, unlimited_limiter
+
+# Fake WebDriver endpoint: speaks enough of the W3C protocol for the async
+# search flow, with a configurable page-load latency and a finite result set
+LOAD_LATENCY = float(os.environ.get("BENCH_LOAD_LATENCY", "0.3"))
+TOTAL_RESULTS = int(os.environ.get("BENCH_TOTAL", "75"))
+SEARCHES = int(os.environ.get("BENCH_SEARCHES", "40"))
+
+sessions = {}
+
+
+def job_cards(url):
+    start = int(parse_qs(urlparse(url).query).get("start", ["0"])[0])
+    # Like LinkedIn, offsets past the end show the last page again
+    start = min(start, (TOTAL_RESULTS - 1) // 25 * 25)
+    return [{"Job ID": str(4000000000 + index), "Job Title": f"Engineer {index}", "Company": f"Company {index % 7}",
+             "Location": "Remote", "Easy Apply": True}
+            for index in range(start, min(start + 25, TOTAL_RESULTS))]
+
+
+async def handle(method, path, payload):
+    parts = path.strip("/").split("/")
+    if parts == ["session"] and method == "POST":
+        session_id = uuid.uuid4().hex
+        sessions[session_id] = {"url": "about:blank"}
+        return 200, {"value": {"sessionId": session_id, "capabilities": {}}}
+    session = sessions.get(parts[1]) if len(parts) > 1 else None
+    if session is None:
+        return 404, {"value": {"error": "invalid session id", "message": "no such session"}}
+    command = parts[2:]
+    if not command and method == "DELETE":
+        sessions.pop(parts[1], None)
+        return 200, {"value": None}
+    if command == ["url"] and method == "POST":
+        await asyncio.sleep(LOAD_LATENCY)
+        session["url"] = payload["url"]
+        return 200, {"value": None}
+    if command == ["url"]:
+        return 200, {"value": session["url"]}
+    if command == ["elements"]:
+        cards = job_cards(session["url"])
+        return 200, {"value": [{async_driver.ELEMENT_KEY: f"card-{i}"} for i in range(len(cards))]}
+    if command == ["execute", "sync"]:
+        return 200, {"value": job_cards(session["url"])}
+    return 404, {"value": {"error": "unknown command", "message": path}}
+
+
+async def serve(reader, writer):
+    try:
+        while True:
+            request_line = await reader.readuntil(b"\r\n")
+            method, path, _ = request_line.decode().split(" ", 2)
+            length = 0
+            while True:
+                line = await reader.readuntil(b"\r\n")
+                if line == b"\r\n":
+                    break
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            body = await reader.readexactly(length) if length else b""
+            status, response = await handle(method, path, json.loads(body) if body else {})
+            raw = json.dumps(response).encode()
+            writer.write(f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(raw)}\r\n\r\n".encode() + raw)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def bench(endpoint, concurrency):
+    base_url = "https://www.linkedin.com/jobs/search/?keywords=security&geoId=92000000"
+
+    async def work(driver, spec):
+        return await async_driver.search_jobs(driver, base_url)
+
+    started_cpu = time.process_time()
+    started = time.perf_counter()
+    results, failures = await async_driver.run_sessions(
+        list(range(SEARCHES)), lambda: async_driver.AsyncWebDriver.create(endpoint), work, concurrency)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - started_cpu
+    jobs = sum(len(found) for _, found in results)
+    print(f"sessions={concurrency:<3} searches={len(results):<3} failures={len(failures):<2} jobs={jobs:<5} "
+          f"elapsed={elapsed:.2f}s searches/s={len(results) / elapsed:.1f} cpu={cpu:.2f}s")
+
+
+async def main():
+    set_default_limiter(unlimited_limiter())  # measure concurrency, not the request budget
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    endpoint = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    async with server:
+        for concurrency in (1, 10, 20):
+            await bench(endpoint, concurrency)
+    print(f"max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import pathlib
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from waits import wait_for_job_cards
+from session import apply_performance_options, block_urls, BLOCKED_URL_PATTERNS
+
+FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+RUNS = int(os.environ.get("BENCH_RUNS", "5"))
+ASSET_LATENCY = float(os.environ.get("BENCH_ASSET_LATENCY", "0.4"))
+ASSET_SIZE = int(os.environ.get("BENCH_ASSET_SIZE", str(512 * 1024)))
+
+
+# Serves the fixtures plus slow, heavy assets and a slow analytics script
+class StandInHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/assets/") or self.path.startswith("/analytics/"):
+            time.sleep(ASSET_LATENCY)
+            body = b"//" if self.path.startswith("/analytics/") else b"\0" * ASSET_SIZE
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+
+def start_server():
+    handler = functools.partial(StandInHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Resident memory of the browser: chromedriver's descendant processes (Linux /proc)
+def browser_rss_mb(driver):
+    root = driver.service.process.pid
+    children = {}
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat") as file:
+                parent = int(file.read().rsplit(")", 1)[1].split()[1])
+            children.setdefault(parent, []).append(int(pid))
+        except (OSError, IndexError, ValueError):
+            continue
+    total, stack = 0, list(children.get(root, []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/statm") as file:
+                total += int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            continue
+    return total / (1024 * 1024)
+
+
+def make_driver(performance):
+    chrome_options = Options()
+    chrome_options.add_argument("--disable-gpu")
+    if performance:
+        apply_performance_options(chrome_options)
+        driver = webdriver.Chrome(options=chrome_options)
+        return block_urls(driver, BLOCKED_URL_PATTERNS + ["*/analytics/*"])
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(options=chrome_options)
+
+
+def bench(name, performance, url):
+    driver = make_driver(performance)
+    try:
+        timings = []
+        for run in range(RUNS):
+            started = time.perf_counter()
+            driver.get(f"{url}?run={run}")
+            wait_for_job_cards(driver)
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        print(f"{name:<12} median load={timings[len(timings) // 2]:.2f}s max={timings[-1]:.2f}s "
+              f"browser RSS={browser_rss_mb(driver):.0f} MB")
+    finally:
+        driver.quit()
+
+
+def main():
+    server = start_server()
+    url = f"http://127.0.0.1:{server.server_port}/job_page.html"
+    try:
+        bench("default", False, url)
+        bench("performance", True, url)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
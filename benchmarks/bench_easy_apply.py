@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+import pathlib
+import tempfile
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from easy_apply import EasyApplyForm, AnswerCache
+from resumes import ResumeManager
+from ratelimit import set_default_limiter, unlimited_limiter
+from waits import wait_for_apply_modal
+
+FIXTURE = pathlib.Path(__file__).resolve().parent / "fixtures" / "easy_apply_form.html"
+RUNS = int(os.environ.get("BENCH_RUNS", "5"))
+DELAY_MS = int(os.environ.get("BENCH_DELAY_MS", "300"))
+
+KNOWN_ANSWERS = {
+    "mobile phone number": "+62 811 0000 000",
+    "email address": "me@example.com",
+    "how many years of work experience do you have with python": "5",
+    "are you legally authorized to work in this country": "Yes",
+}
+
+
+# Smallest valid one-page PDF, so the bench needs no resume of its own
+MINIMAL_PDF = (b"%PDF-1.4\n1 0 obj<</Type /Catalog /Pages 2 0 R>>endobj\n"
+               b"2 0 obj<</Type /Pages /Kids[3 0 R] /Count 1>>endobj\n"
+               b"3 0 obj<</Type /Page /Parent 2 0 R /MediaBox[0 0 612 792]>>endobj\n"
+               b"trailer<</Root 1 0 R>>\n%%EOF\n")
+
+
+def make_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    return webdriver.Chrome(options=chrome_options)
+
+
+def open_form(driver, url):
+    driver.get(url)
+    driver.find_element(By.CLASS_NAME, "jobs-apply-button").click()
+    wait_for_apply_modal(driver)
+
+
+# Old behaviour: treat the form as one screen and wait for a confirmation
+def single_screen_apply(driver, url, answers):
+    open_form(driver, url)
+    wait = WebDriverWait(driver, 10)
+    wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'next step')]"))).click()
+    try:
+        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "confirmation-message-class")))
+        return "submitted"
+    except Exception:
+        return "abandoned"
+
+
+# New behaviour: drive every step from the answer cache
+def state_machine_apply(driver, url, answers):
+    open_form(driver, url)
+    return EasyApplyForm(driver, answers).run()
+
+
+# Resume step: the first run uploads, later runs pick the document LinkedIn kept
+def resume_apply(resumes):
+    def apply(driver, url, answers):
+        open_form(driver, url)
+        return EasyApplyForm(driver, answers, resumes).run(resumes.default)
+    return apply
+
+
+def bench(name, apply, driver, url, answers):
+    timings = []
+    outcomes = set()
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        outcomes.add(apply(driver, url, answers))
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"{name:<28} outcome={'/'.join(sorted(outcomes)):<14} min={timings[0]:.2f}s "
+          f"median={timings[len(timings) // 2]:.2f}s max={timings[-1]:.2f}s")
+
+
+def main():
+    set_default_limiter(unlimited_limiter())  # measure the form flow, not the request budget
+    driver = make_driver()
+    with tempfile.TemporaryDirectory() as tmp:
+        answers = AnswerCache(os.path.join(tmp, "answers.json"))
+        for label, answer in KNOWN_ANSWERS.items():
+            answers.set(label, answer)
+        pdf_path = os.path.join(tmp, "resume.pdf")
+        with open(pdf_path, "wb") as file:
+            file.write(MINIMAL_PDF)
+        resumes = ResumeManager(pdf_path)
+        url = f"{FIXTURE.as_uri()}?delay={DELAY_MS}"
+        try:
+            bench("single-screen", single_screen_apply, driver, url, answers)
+            bench("state-machine", state_machine_apply, driver, url, answers)
+            bench("state-machine unknown q", state_machine_apply, driver, url + "&unknown=1", answers)
+            bench("state-machine + resume", resume_apply(resumes), driver, url, answers)
+            print(f"resume uploads over {RUNS} applications: {resumes.uploads}")
+        finally:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
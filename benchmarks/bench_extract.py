@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import pathlib
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from waits import wait_for_job_cards
+from extract import extract_job_cards
+
+FIXTURE = pathlib.Path(__file__).resolve().parent / "fixtures" / "search_page.html"
+RUNS = int(os.environ.get("BENCH_RUNS", "10"))
+CARDS = int(os.environ.get("BENCH_CARDS", "25"))
+
+
+def make_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    return webdriver.Chrome(options=chrome_options)
+
+
+# Count WebDriver commands by wrapping the driver's execute method
+def count_round_trips(driver):
+    counter = {"calls": 0}
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        counter["calls"] += 1
+        return original(driver_command, params)
+
+    driver.execute = execute
+    return counter
+
+
+# Old behaviour: up to three .text reads per card
+def per_element(driver):
+    jobs = []
+    for job in driver.find_elements(By.CLASS_NAME, "job-card-container"):
+        job_title = job.text.split("\n")[0]
+        company_name = job.text.split("\n")[1] if len(job.text.split("\n")) > 1 else "Unknown Company"
+        jobs.append({"Job Title": job_title, "Company": company_name})
+    return jobs
+
+
+def bulk_script(driver):
+    return extract_job_cards(driver)
+
+
+def bench(name, extract, driver, counter):
+    timings = []
+    calls = 0
+    for _ in range(RUNS):
+        counter["calls"] = 0
+        started = time.perf_counter()
+        jobs = extract(driver)
+        timings.append(time.perf_counter() - started)
+        calls = counter["calls"]
+    timings.sort()
+    print(f"{name:<12} jobs={len(jobs):<3} round-trips={calls:<4} "
+          f"median={timings[len(timings) // 2] * 1000:.1f}ms max={timings[-1] * 1000:.1f}ms")
+
+
+def main():
+    driver = make_driver()
+    try:
+        driver.get(f"{FIXTURE.as_uri()}?delay=0&cards={CARDS}")
+        wait_for_job_cards(driver)
+        counter = count_round_trips(driver)
+        bench("per-element", per_element, driver, counter)
+        bench("bulk-script", bulk_script, driver, counter)
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
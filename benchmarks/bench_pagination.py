@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import pathlib
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from waits import configure_jitter
+import pagination
+from ratelimit import set_default_limiter, unlimited_limiter
+
+FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+DELAY_MS = int(os.environ.get("BENCH_DELAY_MS", "1200"))
+TOTAL = int(os.environ.get("BENCH_TOTAL", "250"))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    handler = functools.partial(QuietHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    return webdriver.Chrome(options=chrome_options)
+
+
+# Count full page loads issued through driver.get
+def count_page_loads(driver):
+    counter = {"loads": 0}
+    original = driver.get
+
+    def get(url):
+        counter["loads"] += 1
+        return original(url)
+
+    driver.get = get
+    return counter
+
+
+def run(name, driver, base_url, **kwargs):
+    counter = count_page_loads(driver)
+    started = time.perf_counter()
+    jobs = [job for page in pagination.iter_pages(driver, base_url, **kwargs) for job in page]
+    elapsed = time.perf_counter() - started
+    del driver.get
+    print(f"{name:<28} jobs={len(jobs):<4} driver.get={counter['loads']:<3} elapsed={elapsed:.2f}s")
+
+
+def main():
+    configure_jitter({"human_delay": [0, 0]})
+    set_default_limiter(unlimited_limiter())  # measure paging, not the request budget
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_port}/search_page.html?delay={DELAY_MS}&total={TOTAL}"
+    driver = make_driver()
+    try:
+        run("all pages", driver, base_url)
+        run("all pages + prefetch", driver, base_url, prefetch=True)
+        run("roles_to_display=60", driver, base_url, roles_to_display=60)
+        run("already applied after 100", driver, base_url,
+            is_applied=lambda job_id: int(job_id) >= 4000000100)
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
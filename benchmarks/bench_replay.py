@@ -0,0 +1,149 @@
+import os
+import sys
+import json
+import time
+import pathlib
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import metrics
+from waits import configure_jitter
+from pagination import iter_pages
+from store import AppliedJobsStore
+from core import apply_jobs
+from ratelimit import set_default_limiter, unlimited_limiter
+from replay_server import start_replay_server, replay_search_url
+
+HERE = pathlib.Path(__file__).resolve().parent
+DEFAULT_RECORDINGS = HERE / "recordings" / "sample"
+DEFAULT_RESULTS = HERE / "results" / "replay.jsonl"
+
+# Answers for the questions in the sample recording's Easy Apply steps
+SAMPLE_ANSWERS = {
+    "mobile phone number": "+62 811 0000 000",
+    "how many years of work experience do you have with python": "5",
+    "are you legally authorized to work in this country": "Yes",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run search + apply against recorded pages and report throughput.")
+    parser.add_argument("--recordings", default=str(DEFAULT_RECORDINGS))
+    parser.add_argument("--latency", type=float, default=150, help="replay latency per response, in ms")
+    parser.add_argument("--jitter", type=float, default=50, help="random extra latency, in ms")
+    parser.add_argument("--jobs", type=int, default=20, help="jobs to apply to per run")
+    parser.add_argument("--results", default=str(DEFAULT_RESULTS), help="JSONL file the results are appended to")
+    parser.add_argument("--label", default=None, help="label for this run (default: git commit)")
+    return parser.parse_args(argv)
+
+
+def make_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    return metrics.instrument_driver(webdriver.Chrome(options=chrome_options))
+
+
+def git_label():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=HERE).stdout.strip() or "unknown"
+    except OSError:
+        return "unknown"
+
+
+def run(args):
+    configure_jitter({"human_delay": [0, 0]})
+    set_default_limiter(unlimited_limiter())  # measure the code path, not the request budget
+    metrics.reset()
+    server = start_replay_server(args.recordings, latency_ms=args.latency, jitter_ms=args.jitter)
+    url = replay_search_url(server, args.recordings)
+    outcomes = {}
+
+    def report(job, outcome):
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        answers_file = os.path.join(tmp, "answers.json")
+        with open(answers_file, "w") as file:
+            json.dump(SAMPLE_ANSWERS, file)
+        settings = {"answers_file": answers_file}
+        store = AppliedJobsStore(os.path.join(tmp, "applied.db"))
+        driver = make_driver()
+        try:
+            started = time.perf_counter()
+            jobs = (job for page in iter_pages(driver, url, roles_to_display=args.jobs) for job in page)
+            apply_jobs(driver, True, None, settings, store, "replay", decide=lambda job: True, report=report,
+                       jobs=jobs)
+            elapsed = time.perf_counter() - started
+        finally:
+            driver.quit()
+            store.close()
+            server.shutdown()
+
+    processed = sum(outcomes.values())
+    rows = metrics.summary_rows()
+    round_trips = sum(row["count"] for row in rows if row["stage"].startswith("webdriver:"))
+    return {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "label": args.label or git_label(),
+        "latency_ms": args.latency,
+        "jobs": processed,
+        "outcomes": outcomes,
+        "seconds": round(elapsed, 2),
+        "jobs_per_minute": round(60 * processed / elapsed, 2) if elapsed else 0.0,
+        "round_trips_per_job": round(round_trips / processed, 1) if processed else 0.0,
+        "stages": {row["stage"]: {"count": row["count"], "p50": round(row["p50"], 4), "p95": round(row["p95"], 4)}
+                   for row in rows if not row["stage"].startswith("webdriver:")},
+    }
+
+
+def previous_result(path, latency):
+    if not os.path.exists(path):
+        return None
+    previous = None
+    with open(path, "r") as file:
+        for line in file:
+            result = json.loads(line)
+            if result.get("latency_ms") == latency:
+                previous = result
+    return previous
+
+
+def change(new, old):
+    if not old:
+        return ""
+    return f" ({(new - old) / old:+.0%} vs {old})"
+
+
+def print_report(result, previous):
+    base = previous or {}
+    print(f"run {result['label']}: {result['jobs']} jobs in {result['seconds']}s, outcomes {result['outcomes']}")
+    if previous:
+        print(f"compared with {previous['label']} from {previous['time']}")
+    print(f"jobs/minute:          {result['jobs_per_minute']}{change(result['jobs_per_minute'], base.get('jobs_per_minute'))}")
+    print(f"round-trips per job:  {result['round_trips_per_job']}"
+          f"{change(result['round_trips_per_job'], base.get('round_trips_per_job'))}")
+    print(f"{'stage':<34}{'count':>7}{'p50 s':>9}{'p95 s':>9}{'prev p95':>10}")
+    for stage, stats in sorted(result["stages"].items(), key=lambda item: -item[1]["p95"]):
+        old = base.get("stages", {}).get(stage, {}).get("p95")
+        print(f"{stage[:33]:<34}{stats['count']:>7}{stats['p50']:>9.3f}{stats['p95']:>9.3f}"
+              f"{'' if old is None else format(old, '.3f'):>10}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    result = run(args)
+    print_report(result, previous_result(args.results, args.latency))
+    os.makedirs(os.path.dirname(args.results), exist_ok=True)
+    with open(args.results, "a") as file:
+        file.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import pathlib
+import subprocess
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+MODULES = ["app", "app2", "batch", "core"]
+# Optional dependencies that should only load when a feature needs them
+HEAVY = ["pandas", "geopy", "plyer", "webdriver_manager"]
+RUNS = int(os.environ.get("BENCH_RUNS", "5"))
+
+# Import each entry point in a fresh interpreter and report the median
+# cumulative import time from -X importtime, plus any heavy module pulled in.
+CHECK = "import sys, {module}; print(','.join(name for name in {heavy!r} if name in sys.modules))"
+
+
+def import_time(module):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", CHECK.format(module=module, heavy=HEAVY)],
+                            capture_output=True, text=True, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    line = [line for line in result.stderr.splitlines() if line.rstrip().endswith(f"| {module}")][-1]
+    return int(line.split("|")[1]) / 1e6, result.stdout.strip()
+
+
+def main():
+    print(f"{'module':<10}{'median s':>10}{'min s':>8}  heavy imports")
+    for module in MODULES:
+        runs = [import_time(module) for _ in range(RUNS)]
+        seconds = sorted(run[0] for run in runs)
+        print(f"{module:<10}{seconds[len(seconds) // 2]:>10.3f}{seconds[0]:>8.3f}  {runs[-1][1] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
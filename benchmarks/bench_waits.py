@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+import random
+import pathlib
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from waits import configure_jitter, wait_for_job_cards, human_pause
+
+FIXTURE = pathlib.Path(__file__).resolve().parent / "fixtures" / "search_page.html"
+RUNS = int(os.environ.get("BENCH_RUNS", "5"))
+DELAY_MS = int(os.environ.get("BENCH_DELAY_MS", "800"))
+
+
+def make_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    return webdriver.Chrome(options=chrome_options)
+
+
+# Old behaviour: fixed random sleeps before reading the card list
+def fixed_sleep_search(driver, url):
+    driver.get(url)
+    time.sleep(random.uniform(2, 4))
+    time.sleep(random.uniform(5, 10))
+    return driver.find_elements(By.CLASS_NAME, "job-card-container")
+
+
+# New behaviour: return as soon as the cards exist, plus the jitter budget
+def event_wait_search(driver, url):
+    driver.get(url)
+    cards = wait_for_job_cards(driver)
+    human_pause()
+    return cards
+
+
+def bench(name, search, driver, url):
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        cards = search(driver, url)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"{name:<12} cards={len(cards):<3} min={timings[0]:.2f}s "
+          f"median={timings[len(timings) // 2]:.2f}s max={timings[-1]:.2f}s")
+
+
+def main():
+    configure_jitter({"human_delay": [0.3, 1.2]})
+    url = f"{FIXTURE.as_uri()}?delay={DELAY_MS}&cards=25"
+    driver = make_driver()
+    try:
+        bench("fixed-sleep", fixed_sleep_search, driver, url)
+        bench("event-wait", event_wait_search, driver, url)
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
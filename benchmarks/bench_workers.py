@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import pathlib
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from waits import wait_for_job_cards
+from extract import extract_job_cards
+from workers import build_search_specs, run_search_pool
+
+FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+KEYWORDS = ["security", "devops", "python", "data", "cloud", "network"]
+LOCATIONS = ["indonesia", "worldwide"]
+DELAY_MS = int(os.environ.get("BENCH_DELAY_MS", "1500"))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+# Serve the fixtures directory as a local stand-in for the search pages
+def start_server():
+    handler = functools.partial(QuietHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    return webdriver.Chrome(options=chrome_options)
+
+
+def local_search(base_url, driver, keyword, location, easy_apply, job_type):
+    # Each keyword gets its own id range so merged results stay distinguishable
+    start = KEYWORDS.index(keyword) * 10
+    driver.get(f"{base_url}/search_page.html?delay={DELAY_MS}&cards=25&start={start}")
+    wait_for_job_cards(driver)
+    return extract_job_cards(driver)
+
+
+def main():
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    specs = build_search_specs(KEYWORDS, LOCATIONS, True, "remote")
+    search = functools.partial(local_search, base_url)
+    try:
+        for workers in (1, 2, 4):
+            started = time.perf_counter()
+            jobs, failures = run_search_pool(specs, make_driver, search, workers)
+            elapsed = time.perf_counter() - started
+            print(f"workers={workers} specs={len(specs)} unique_jobs={len(jobs)} failures={len(failures)} "
+                  f"elapsed={elapsed:.2f}s specs/min={len(specs) / elapsed * 60:.1f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
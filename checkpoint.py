@@ -0,0 +1,129 @@
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+
+DEFAULT_CHECKPOINT_FILE = "batch_checkpoint.json"
+# Outcome stored for jobs that were listed but not acted on (search-only runs)
+LISTED = "listed"
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+# Identifies a batch so a checkpoint is only resumed by the same searches
+def batch_fingerprint(batch):
+    return hashlib.sha1(json.dumps(batch.get("searches", []), sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+# Progress of a batch run, rewritten after every job: which searches are done,
+# the search in progress and the start= offset of its current page, and every
+# processed job id with its outcome. A resumed run skips completed searches,
+# starts the current one at the saved offset and never reopens a processed job.
+class Checkpoint:
+    def __init__(self, path=DEFAULT_CHECKPOINT_FILE):
+        self.path = path
+        self.state = {}
+
+    def start(self, batch):
+        self.state = {
+            "batch": batch_fingerprint(batch),
+            "started": _now(),
+            "updated": None,
+            "search": None,
+            "spec": None,
+            "start": 0,
+            "completed": [],
+            "processed": {},
+            "applied": 0,
+            "finished": False,
+        }
+        self.save()
+
+    # Load an unfinished checkpoint for this batch; False when there is none
+    def resume(self, batch):
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r") as file:
+                state = json.load(file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return False
+        if state.get("finished") or state.get("batch") != batch_fingerprint(batch):
+            return False
+        self.state = state
+        logging.info(f"Resuming batch from {self.path}: {len(state['completed'])} searches done, "
+                     f"{len(state['processed'])} jobs processed.")
+        return True
+
+    # Written to a temporary file and renamed over the old one, so a crash
+    # mid-write leaves the previous checkpoint intact
+    def save(self):
+        self.state["updated"] = _now()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(self.state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def completed(self, index):
+        return index in self.state["completed"]
+
+    # Offset to start search index at: the saved page for the interrupted search, else 0
+    def offset(self, index):
+        return self.state["start"] if self.state["search"] == index else 0
+
+    def begin_search(self, index, spec):
+        if self.state["search"] != index:
+            self.state.update(search=index, spec=spec, start=0)
+            self.save()
+
+    def at_page(self, start):
+        if self.state["start"] != start:
+            self.state["start"] = start
+            self.save()
+
+    def processed(self, job_id):
+        return bool(job_id) and str(job_id) in self.state["processed"]
+
+    def job_done(self, job_id, outcome):
+        if not job_id:
+            return
+        self.state["processed"][str(job_id)] = outcome
+        if outcome == "applied":
+            self.state["applied"] += 1
+        self.save()
+
+    # Mark jobs of a finished page that got no outcome (e.g. search-only runs)
+    def page_done(self, jobs):
+        pending = [str(job.get("Job ID")) for job in jobs
+                   if job.get("Job ID") and str(job.get("Job ID")) not in self.state["processed"]]
+        if pending:
+            self.state["processed"].update(dict.fromkeys(pending, LISTED))
+            self.save()
+
+    def search_done(self, index):
+        self.state["completed"].append(index)
+        self.state.update(search=None, spec=None, start=0)
+        self.save()
+
+    def finish(self):
+        self.state["finished"] = True
+        self.save()
+
+
+# Stream stage over result pages: records each page's offset, drops jobs
+# processed before the interruption and, once the consumer moves on, marks
+# the rest of the page as processed
+def checkpointed(pages, checkpoint):
+    for page in pages:
+        checkpoint.at_page(getattr(page, "start", 0))
+        remaining = [job for job in page if not checkpoint.processed(job.get("Job ID"))]
+        if len(remaining) < len(page):
+            logging.info(f"Skipping {len(page) - len(remaining)} jobs processed before the restart.")
+        yield remaining
+        checkpoint.page_done(remaining)
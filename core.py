@@ -0,0 +1,435 @@
+import os
+import time
+import json
+import random
+import logging
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from waits import (configure_jitter, human_pause, wait_present, wait_clickable, wait_for_apply_modal, LOGIN_USERNAME,
+                   EASY_APPLY_BUTTON)
+from extract import find_job_cards, find_job_card, extract_job_cards
+from pagination import iter_pages, posted_since_params, MAX_PAGES
+from store import search_key
+from resumes import ResumeManager, DEFAULT_DOCUMENTS_FILE
+from resilience import (RecoverableDriver, CircuitOpenError, retry, open_job_card, open_job_page, record_success,
+                        record_failure, STALE)
+from ratelimit import configure_rate_limits, default_limiter, SEARCH
+from activity_log import configure_logging, log_job
+from recording import configure_recording
+from export import configure_export, export_searched, export_outcome
+from easy_apply import EasyApplyForm, AnswerCache, SUBMITTED, UNCONFIRMED, NEEDS_ANSWERS, DEFAULT_ANSWERS_FILE
+from session import (launch_chrome, restore_session, login_and_save, apply_performance_options, block_urls,
+                     LoginError, DEFAULT_COOKIE_FILE)
+from geo import default_resolver, configure_resolver, DEFAULT_CACHE_FILE
+from metrics import timed, mark_failed, instrument_driver, configure_metrics
+
+# Shared code path behind app.py, app2.py and batch.py. The entry points only
+# differ in the strategies they pass in: the search function (any callable
+# with the stream_job_pages signature, as run_search_pool already takes),
+# the extract function that reads job records off a result page, and
+# decide/report for apply_jobs. Heavy optional dependencies (pandas,
+# geopy, plyer, webdriver_manager) are imported where they are first used.
+
+SETTINGS_FILE = "settings.json"
+
+DEFAULT_SETTINGS = {
+    "username": "",
+    "password": "",
+    "keyword": "",
+    "location": "",
+    "easy_apply": True,
+    "job_type": "remote",
+    "human_delay": [0.3, 1.2],
+    "search_workers": 2,
+    "prefetch_next_page": True,
+    "applied_jobs_db": "applied_jobs.db",
+    "chrome_profile_dir": "chrome_profile",
+    "cookie_file": "linkedin_cookies.json",
+    "geo_offline": False,
+    "geo_cache_file": "geo_cache.json",
+    "metrics_file": "metrics.jsonl",
+    "prometheus_file": None,
+    "performance_mode": False,
+    "job_filter": {},
+    "answers_file": "easy_apply_answers.json",
+    "resume_by_keyword": {},
+    "resume_documents_file": "resume_documents.json",
+    "rate_limits": {},
+    "log_file": "linkedin_activity.log",
+    "log_max_bytes": 52428800,
+    "log_backup_count": 30,
+    "log_rotate_daily": True,
+    "record_dir": None,
+    "incremental_search": True,
+    "export_dir": None,
+    "export_format": "parquet",
+    "export_batch_size": 1000,
+    "checkpoint_file": "batch_checkpoint.json",
+}
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
+]
+
+# Mapping job type to LinkedIn filter values
+WORK_TYPES = {
+    "hybrid": "3",
+    "remote": "2",
+    "onsite": "1"
+}
+
+# Outcomes that leave a job to be tried again by a later run
+RETRY_OUTCOMES = ("needs_answers", "failed", "error")
+
+
+# Load and save settings
+def load_settings(path=SETTINGS_FILE):
+    if os.path.exists(path):
+        with open(path, 'r') as file:
+            return json.load(file)
+    return dict(DEFAULT_SETTINGS)
+
+
+def save_settings(settings, path=SETTINGS_FILE):
+    with open(path, 'w') as file:
+        json.dump(settings, file, indent=4)
+
+
+# Apply the process-wide settings: logging, pacing, rate limits, metrics,
+# recording, result export and the geoId resolver
+def configure(settings):
+    configure_logging(settings)
+    configure_jitter(settings)
+    configure_rate_limits(settings)
+    configure_metrics(settings)
+    configure_recording(settings)
+    configure_export(settings)
+    configure_resolver(settings.get("geo_offline", False), settings.get("geo_cache_file", DEFAULT_CACHE_FILE))
+
+
+def get_random_user_agent():
+    return random.choice(USER_AGENTS)
+
+
+# Desktop notification; plyer is only imported when there is something to show
+def notify_error(message):
+    try:
+        from plyer import notification
+        notification.notify(title="LinkedIn Script Error", message=message)
+    except Exception as e:
+        logging.info(f"Could not show desktop notification: {e}")
+
+
+@timed("setup_driver")
+def setup_driver(profile_dir=None, performance=False, user_agent=None):
+    chrome_options = Options()
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-gpu")
+    if user_agent:
+        chrome_options.add_argument(f"user-agent={user_agent}")
+    # Persistent profile keeps the LinkedIn session between runs
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+    # Performance mode: headless, no images/fonts/media/trackers, small viewport
+    if performance:
+        apply_performance_options(chrome_options)
+        return instrument_driver(block_urls(launch_chrome(chrome_options)))
+    return instrument_driver(launch_chrome(chrome_options))
+
+
+# LinkedIn login
+@timed("login_linkedin")
+def login_linkedin(driver, username, password):
+    try:
+        driver.get("https://www.linkedin.com/login")
+        wait_present(driver, LOGIN_USERNAME).send_keys(username)
+        human_pause()
+        driver.find_element(By.ID, "password").send_keys(password)
+        human_pause()
+
+        # Uncheck "Remember Me" if it exists
+        try:
+            remember_me_checkbox = driver.find_element(By.XPATH, "//input[@id='remember-me']")
+            if remember_me_checkbox.is_selected():
+                remember_me_checkbox.click()
+                logging.info("Unchecked 'Remember Me' option.")
+        except Exception as e:
+            logging.info(f"'Remember Me' option not found or could not be unchecked: {e}")
+
+        driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        logging.info("Logged in to LinkedIn successfully.")
+        print("Login successful!")
+    except Exception as e:
+        logging.error(f"Error during LinkedIn login: {e}")
+        mark_failed(e)
+        notify_error("Error during LinkedIn login")
+        print("Error during LinkedIn login.")
+
+
+# Start a browser session, reusing the saved login when it is still valid.
+# credentials() -> (username, password) is only called when a fresh login is
+# needed and no username was given. Raises LoginError when the login does not
+# produce a valid session. The returned driver restarts itself through the
+# same steps when the session dies.
+def start_session(username, password, profile_dir=None, cookie_file=DEFAULT_COOKIE_FILE, performance=False,
+                  user_agent=None, credentials=None):
+    login = {"username": username, "password": password}
+
+    def start():
+        driver = setup_driver(profile_dir, performance, user_agent)
+        if restore_session(driver, cookie_file):
+            print("Reusing saved LinkedIn session.")
+            return driver
+        if not login["username"] and credentials:
+            login["username"], login["password"] = credentials()
+        if not login_and_save(driver, login["username"], login["password"], login_linkedin, cookie_file):
+            driver.quit()
+            raise LoginError("LinkedIn login failed: the session is still not signed in.")
+        return driver
+    return RecoverableDriver(start)
+
+
+# Function to get Geo IP location and Geo ID
+def get_geo_ip(location_name, default=None):
+    if default is None:
+        return default_resolver().resolve(location_name)
+    return default_resolver().resolve(location_name, default=default)
+
+
+# Job search and filtering: yields each result page's job records as a list.
+# With incremental=True and a store, a search that ran before only asks for
+# jobs posted since then and stops at the first job an earlier run saw.
+# first_start continues an interrupted search at that start= offset;
+# on_error(e) is told about an error that ended the search early, and
+# extract(driver) reads the job records off each result page.
+@timed("search_jobs")
+def stream_job_pages(driver, keyword, location, easy_apply, job_type, roles_to_display=None, store=None,
+                     prefetch=False, incremental=False, max_pages=MAX_PAGES, default_geo=None, first_start=0,
+                     on_error=None, extract=extract_job_cards):
+    try:
+        print("Starting job search...")
+        logging.info("Starting job search on LinkedIn.")
+
+        work_type = WORK_TYPES.get(job_type.lower(), "2")  # Default to "remote" if not recognized
+        geo_id = get_geo_ip(location, default_geo)
+
+        # Construct the search URL
+        easy_apply_flag = "true" if easy_apply else "false"
+        url = (f"https://www.linkedin.com/jobs/search/?f_AL={easy_apply_flag}"
+               f"&f_WT={work_type}&geoId={geo_id}&keywords={keyword}&refresh=true")
+
+        key = search_key(keyword, geo_id, work_type, easy_apply_flag)
+        run_started = datetime.now()
+        seen = None
+        pending = None
+        last_run = store.last_search_run(key) if store and incremental else None
+        if last_run:
+            # Reach back far enough to list jobs that are still waiting for a retry,
+            # and page past seen jobs until all of them were listed again
+            url += posted_since_params(min(last_run, store.oldest_retry(key) or last_run), run_started)
+            seen = lambda job_ids: store.seen_ids(key, job_ids)
+            pending = store.retry_ids(key)
+            print(f"Only looking at jobs posted since the last search on {last_run}.")
+
+        print(f"Searching for jobs with keyword '{keyword}' in '{location}', job type: {job_type}.")
+        logging.info(f"Job search URL: {url}")
+
+        # Walk the result pages by start= offset until enough new jobs are collected
+        is_applied = store.has_applied if store else None
+        default_limiter().acquire(SEARCH)
+        found = 0
+        for page in iter_pages(driver, url, roles_to_display, is_applied, prefetch, max_pages, seen, first_start,
+                               pending, extract):
+            export_searched(page, f"{keyword} / {location}")
+            yield page
+            # Marked once the consumer is done with the page, so a crash mid-page
+            # leaves its jobs for the next run
+            found += len(page)
+            if store:
+                store.mark_seen(key, [job.get("Job ID") for job in page])
+        # A search cut short by roles_to_display, or resumed part way, may have left older jobs unseen
+        if store and not first_start and (roles_to_display is None or found < roles_to_display):
+            store.record_search_run(key, run_started.isoformat(timespec="seconds"))
+
+    except CircuitOpenError:
+        # The session is beyond recovery; the caller has to stop, not carry on with no results
+        raise
+    except Exception as e:
+        logging.error(f"Error during job search: {e}")
+        mark_failed(e)
+        print("Error during job search.")
+        if on_error:
+            on_error(e)
+
+
+# Job records one at a time, as each result page is parsed
+def stream_jobs(driver, keyword, location, easy_apply, job_type, roles_to_display=None, store=None, prefetch=False,
+                incremental=False, max_pages=MAX_PAGES, default_geo=None, on_error=None, extract=extract_job_cards):
+    for page in stream_job_pages(driver, keyword, location, easy_apply, job_type, roles_to_display, store, prefetch,
+                                 incremental, max_pages, default_geo, on_error=on_error, extract=extract):
+        yield from page
+
+
+# List-returning wrapper over stream_jobs
+def search_jobs(driver, keyword, location, easy_apply, job_type, roles_to_display=None, store=None, prefetch=False,
+                incremental=False, max_pages=MAX_PAGES, default_geo=None, on_error=None, extract=extract_job_cards):
+    return list(stream_jobs(driver, keyword, location, easy_apply, job_type, roles_to_display, store, prefetch,
+                            incremental, max_pages, default_geo, on_error, extract))
+
+
+# Every per-job outcome goes to the activity log and the result export,
+# whichever stage decided it (the job filter or apply_jobs). With a store,
+# retryable outcomes keep the job out of the seen-jobs stop until a later
+# run reaches a final one.
+def record_outcome(job, outcome, search=None, stage="apply_jobs", started=None, store=None):
+    log_job(job, outcome, stage, search, started)
+    export_outcome(job, outcome, search)
+    if store is not None:
+        if outcome in RETRY_OUTCOMES:
+            store.mark_retry(job.get("Job ID"), outcome)
+        else:
+            store.clear_retry(job.get("Job ID"))
+
+
+# decide(job) replaces the y/n prompt and report(job, outcome) receives every
+# per-job outcome; both are optional so the interactive flow stays unchanged.
+# jobs is an optional stream of job records (e.g. from stream_jobs) consumed
+# lazily; a record whose card is not on the current page is opened on its
+# own job page. Without it the cards on the current page are used. resumes is a
+# ResumeManager shared across calls so uploads already made are reused.
+@timed("apply_jobs")
+def apply_jobs(driver, use_existing_resume, pdf_path, settings, store, search=None, decide=None, report=None,
+               jobs=None, resumes=None):
+    notify = report or (lambda job, outcome: None)
+    job_started = {"at": None}
+
+    def report(job, outcome):
+        record_outcome(job, outcome, search, "apply_jobs", job_started["at"], store)
+        notify(job, outcome)
+
+    applied_jobs = []
+    try:
+        wait = WebDriverWait(driver, 10)
+        answers = AnswerCache(settings.get("answers_file", DEFAULT_ANSWERS_FILE))
+        if resumes is None:
+            resumes = ResumeManager(None if use_existing_resume else pdf_path, settings.get("resume_by_keyword"),
+                                    settings.get("resume_documents_file", DEFAULT_DOCUMENTS_FILE))
+        resume = None if use_existing_resume else resumes.for_search(search)
+        if jobs is None:
+            job_cards = ((card, {"Job ID": job_id}) for card, job_id in find_job_cards(driver))
+        else:
+            job_cards = ((find_job_card(driver, listed.get("Job ID")), listed) for listed in jobs)
+
+        for index, (job, listed) in enumerate(job_cards):
+            job_started["at"] = time.perf_counter()
+            job_id = listed.get("Job ID")
+            # Skip jobs already in the applied-jobs store without opening them
+            if store.has_applied(job_id):
+                logging.info(f"Already applied to job {job_id}, skipping.")
+                report(listed, "already_applied")
+                continue
+            if job is None and not job_id:
+                logging.warning("Job record without a job id is not on the current page, skipping.")
+                report(listed, "error")
+                continue
+
+            try:
+                if job is None:
+                    # Listed on another result page or by another session
+                    open_job_page(driver, job_id)
+                else:
+                    # Re-finds the card by job id if the result list re-rendered under it
+                    job = open_job_card(driver, job, job_id)
+                human_pause()
+
+                if listed.get("Job Title"):
+                    job_title = listed["Job Title"]
+                    company_name = listed.get("Company") or "Unknown Company"
+                else:
+                    # Use explicit waits to ensure elements are available
+                    job_title_element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card-list__title")))
+                    company_name_element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card-container__company-name")))
+                    job_title = job_title_element.text if job_title_element else "Unknown Job Title"
+                    company_name = company_name_element.text if company_name_element else "Unknown Company"
+                print(f"\nProcessing Job {index + 1}: {job_title} at {company_name}")
+                job_record = dict(listed, **{"Job ID": job_id, "Job Title": job_title, "Company": company_name})
+
+                if decide is None:
+                    apply_now = input("Do you want to apply for this job? (y/n): ").strip().lower() == 'y'
+                else:
+                    apply_now = decide(job_record)
+
+                if apply_now:
+                    logging.info(f"Attempting to apply for job: {job_title} at {company_name}")
+                    try:
+                        # Click the 'Easy Apply' button
+                        retry(lambda: wait_clickable(driver, EASY_APPLY_BUTTON).click(), retry_on=(STALE,))
+                        wait_for_apply_modal(driver)
+                        logging.info("Clicked 'Easy Apply' button.")
+
+                        # Walk the multi-step form, answering questions from the cache
+                        form = EasyApplyForm(driver, answers, resumes, job_id)
+                        outcome = form.run(resume)
+                        if outcome == SUBMITTED:
+                            print(f"Application for {job_title} at {company_name} was successful.")
+                            logging.info(f"Application for {job_title} at {company_name} was successful.")
+                            applied_jobs.append(job_record)
+                            store.record(job_record, search=search)
+                            report(job_record, "applied")
+                        elif outcome == NEEDS_ANSWERS:
+                            print(f"Skipped {job_title}: unanswered questions saved to {answers.path}.")
+                            logging.info(f"Easy Apply for {job_title} at {company_name} needs answers: {form.missing}")
+                            report(dict(job_record, Questions=form.missing), "needs_answers")
+                        elif outcome == UNCONFIRMED:
+                            logging.warning(f"Could not confirm application success for {job_title} at {company_name}.")
+                            report(job_record, "unconfirmed")
+                        else:
+                            logging.warning(f"Easy Apply for {job_title} at {company_name} ended as {outcome}.")
+                            report(job_record, "failed")
+
+                    except Exception as e:
+                        kind = record_failure(driver, e)
+                        logging.warning(f"Could not complete Easy Apply for job: {job_title}. Reason ({kind}): {e}")
+                        report(job_record, "failed")
+                    else:
+                        record_success(driver)
+                else:
+                    logging.info(f"Skipped application for job: {job_title} at {company_name}")
+                    report(job_record, "skipped")
+
+                # Move to the next job in the list
+                print("Moving to the next job...")
+
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                kind = record_failure(driver, e)
+                logging.warning(f"Error accessing job details ({kind}): {e}")
+                report(listed, "error")
+
+        if applied_jobs:
+            print("\nSuccessfully applied to the following jobs:")
+            for job in applied_jobs:
+                print(f"- {job['Job Title']} at {job['Company']}")
+                logging.info(f"Applied to: {job['Job Title']} at {job['Company']}")
+        else:
+            print("\nNo applications were successfully submitted.")
+
+    except CircuitOpenError:
+        raise
+    except Exception as e:
+        logging.error(f"Error during job application process: {e}")
+        mark_failed(e)
+        notify_error("Error during job application")
+        print("Error during job application.")
+
+    return applied_jobs
@@ -0,0 +1,393 @@
+import os
+import re
+import json
+import time
+import logging
+from selenium.webdriver.support.ui import WebDriverWait
+import metrics
+from resumes import ResumeManager
+from recording import record
+from ratelimit import default_limiter, CLICK, APPLY_SUBMIT
+
+DEFAULT_ANSWERS_FILE = "easy_apply_answers.json"
+
+# Each step must change the form within this many seconds after Next/Review/Submit
+STEP_TIMEOUT = 5
+MAX_STEPS = 12
+
+# Outcomes of EasyApplyForm.run()
+SUBMITTED = "submitted"
+UNCONFIRMED = "unconfirmed"
+NEEDS_ANSWERS = "needs_answers"
+STUCK = "stuck"
+NO_FORM = "no_form"
+
+# Read the current step of the Easy Apply modal in one round-trip: every form
+# field (tagged with data-ea-field so it can be filled later), the navigation
+# buttons that are present, the progress text and any validation errors.
+READ_STEP_JS = r"""
+var modal = document.querySelector(".jobs-easy-apply-modal, .artdeco-modal");
+if (!modal) {
+    return null;
+}
+function text(el) {
+    return el ? (el.innerText || el.textContent || "").trim() : "";
+}
+function labelFor(el) {
+    var group = el.closest("fieldset");
+    if (group && (el.type === "radio" || el.type === "checkbox") && group.querySelectorAll("input").length > 1) {
+        return text(group.querySelector("legend")) || text(group);
+    }
+    if (el.id) {
+        var label = modal.querySelector("label[for='" + el.id + "']");
+        if (label) {
+            return text(label);
+        }
+    }
+    var wrapper = el.closest("label");
+    if (wrapper) {
+        return text(wrapper);
+    }
+    return el.getAttribute("aria-label") || el.getAttribute("placeholder") || el.name || "";
+}
+var fields = [];
+var seen = {};
+var inputs = modal.querySelectorAll("input, select, textarea");
+for (var i = 0; i < inputs.length; i++) {
+    var el = inputs[i];
+    var type = (el.getAttribute("type") || el.tagName).toLowerCase();
+    if (type === "hidden" || type === "submit" || type === "button" || el.disabled) {
+        continue;
+    }
+    var kind = type === "select" || type === "textarea" || type === "radio" || type === "checkbox" || type === "file"
+        ? type : "text";
+    var key = kind === "radio" ? "radio:" + el.name : null;
+    if (key && seen[key] !== undefined) {
+        var field = fields[seen[key]];
+        field.options.push(text(el.closest("label")) || text(modal.querySelector("label[for='" + el.id + "']")) || el.value);
+        field.filled = field.filled || el.checked;
+        continue;
+    }
+    var label = labelFor(el);
+    var index = fields.length;
+    el.setAttribute("data-ea-field", index);
+    var options = [];
+    var filled;
+    if (kind === "select") {
+        for (var j = 0; j < el.options.length; j++) {
+            options.push(text(el.options[j]));
+        }
+        filled = el.selectedIndex > 0 || (el.selectedIndex === 0 && !/select an option/i.test(text(el.options[0])));
+    } else if (kind === "radio") {
+        options.push(text(el.closest("label")) || text(modal.querySelector("label[for='" + el.id + "']")) || el.value);
+        filled = el.checked;
+    } else if (kind === "checkbox") {
+        filled = el.checked;
+    } else if (kind === "file") {
+        filled = el.files && el.files.length > 0;
+    } else {
+        filled = el.value.trim() !== "";
+    }
+    fields.push({
+        "index": index,
+        "kind": kind,
+        "label": label,
+        "required": el.required || el.getAttribute("aria-required") === "true" || /\*\s*$/.test(label),
+        "filled": filled,
+        "options": options
+    });
+    if (key) {
+        seen[key] = index;
+    }
+}
+function button(selectors, pattern) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = modal.querySelector(selectors[i]);
+        if (el && !el.disabled) {
+            return selectors[i];
+        }
+    }
+    var buttons = modal.querySelectorAll("button");
+    for (var k = 0; k < buttons.length; k++) {
+        if (!buttons[k].disabled && pattern.test(text(buttons[k]))) {
+            buttons[k].setAttribute("data-ea-button", pattern.source);
+            return "button[data-ea-button='" + pattern.source + "']";
+        }
+    }
+    return null;
+}
+var progress = modal.querySelector("progress, [role='progressbar']");
+var errors = [];
+var feedback = modal.querySelectorAll(".artdeco-inline-feedback--error");
+for (var e = 0; e < feedback.length; e++) {
+    if (text(feedback[e])) {
+        errors.push(text(feedback[e]));
+    }
+}
+return {
+    "fields": fields,
+    "submit": button(["button[aria-label='Submit application']"], /^submit/i),
+    "review": button(["button[aria-label='Review your application']"], /^review/i),
+    "next": button(["button[aria-label='Continue to next step']"], /^(next|continue)/i),
+    "progress": progress ? String(progress.value || progress.getAttribute("aria-valuenow") || text(progress)) : "",
+    "heading": text(modal.querySelector("h3, h2")),
+    "errors": errors,
+    "done": /application (was )?sent|your application was submitted/i.test(text(modal))
+};
+"""
+
+# Fill several fields in one round-trip; answers maps data-ea-field index -> value
+FILL_FIELDS_JS = r"""
+var answers = arguments[0];
+var filled = [];
+function norm(s) {
+    return (s || "").toLowerCase().replace(/\s+/g, " ").trim();
+}
+function fire(el) {
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+}
+for (var index in answers) {
+    var value = String(answers[index]);
+    var el = document.querySelector("[data-ea-field='" + index + "']");
+    if (!el) {
+        continue;
+    }
+    var type = (el.getAttribute("type") || el.tagName).toLowerCase();
+    if (type === "select") {
+        for (var i = 0; i < el.options.length; i++) {
+            if (norm(el.options[i].text) === norm(value) || norm(el.options[i].value) === norm(value)) {
+                el.selectedIndex = i;
+                fire(el);
+                filled.push(index);
+                break;
+            }
+        }
+    } else if (type === "radio") {
+        var radios = document.querySelectorAll("input[type='radio'][name='" + el.name + "']");
+        for (var j = 0; j < radios.length; j++) {
+            var label = radios[j].closest("label") || document.querySelector("label[for='" + radios[j].id + "']");
+            if (norm(label && label.innerText) === norm(value) || norm(radios[j].value) === norm(value)) {
+                radios[j].click();
+                filled.push(index);
+                break;
+            }
+        }
+    } else if (type === "checkbox") {
+        var want = /^(yes|true|1|on)$/i.test(value);
+        if (el.checked !== want) {
+            el.click();
+        }
+        filled.push(index);
+    } else {
+        var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+        setter.call(el, value);
+        fire(el);
+        filled.push(index);
+    }
+}
+return filled;
+"""
+
+# Close the modal and confirm discarding the draft, without waiting on either button
+DISCARD_JS = r"""
+var dismiss = document.querySelector(".artdeco-modal__dismiss");
+if (dismiss) {
+    dismiss.click();
+}
+var confirm = document.querySelector("[data-control-name='discard_application_confirm_btn']") ||
+    Array.prototype.find.call(document.querySelectorAll(".artdeco-modal button"), function (b) {
+        return /^discard$/i.test((b.innerText || "").trim());
+    });
+if (confirm) {
+    confirm.click();
+}
+return Boolean(dismiss);
+"""
+
+CLICK_JS = "var el = document.querySelector(arguments[0]); if (el) { el.click(); } return Boolean(el);"
+
+
+# Normalize a question label so "Years of experience with Python? *" and
+# "years of experience with python" share one cache entry
+def normalize_label(label):
+    label = (label or "").split("\n")[0].lower()
+    label = re.sub(r"\brequired\b|\*", " ", label)
+    label = re.sub(r"[^\w\s]", " ", label)
+    return re.sub(r"\s+", " ", label).strip()
+
+
+# Persistent question -> answer cache. Unknown questions are written with a
+# null answer so they can be filled in by hand before the next run.
+class AnswerCache:
+    def __init__(self, path=DEFAULT_ANSWERS_FILE):
+        self.path = path
+        self.answers = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as file:
+                    self.answers = json.load(file)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Could not read answer cache {path}: {e}")
+
+    def get(self, label):
+        return self.answers.get(normalize_label(label))
+
+    def set(self, label, answer):
+        key = normalize_label(label)
+        if key and self.answers.get(key) != answer:
+            self.answers[key] = answer
+            self._dirty = True
+
+    # Remember a question we could not answer, keeping any answer already given
+    def add_unknown(self, label):
+        key = normalize_label(label)
+        if key and key not in self.answers:
+            self.answers[key] = None
+            self._dirty = True
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        with open(self.path, "w") as file:
+            json.dump(self.answers, file, indent=4, sort_keys=True)
+        self._dirty = False
+
+
+# Drives an open Easy Apply modal step by step: read the step, fill known
+# fields from the answer cache, then press Next, Review or Submit. A required
+# question with no cached answer discards the draft straight away instead of
+# waiting out element timeouts.
+class EasyApplyForm:
+    def __init__(self, driver, answers, resumes=None, job_id=None, step_timeout=STEP_TIMEOUT, max_steps=MAX_STEPS):
+        self.driver = driver
+        self.job_id = job_id
+        self.answers = answers
+        self.resumes = resumes or ResumeManager()
+        self.step_timeout = step_timeout
+        self.max_steps = max_steps
+        self.steps = 0
+        self.missing = []
+
+    def read_step(self):
+        return self.driver.execute_script(READ_STEP_JS)
+
+    # Fill the empty fields we know answers for; returns the required ones left empty
+    def fill(self, step, resume=None):
+        planned = {}
+        missing = []
+        for field in step["fields"]:
+            if field["kind"] == "file" and resume and "cover" not in field["label"].lower():
+                self.resumes.attach(self.driver, resume, f"[data-ea-field='{field['index']}']")
+                resume = None
+                continue
+            if field["filled"]:
+                continue
+            if field["kind"] == "file":
+                if field["required"]:
+                    missing.append(field["label"])
+                continue
+            answer = self.answers.get(field["label"])
+            if answer is not None:
+                planned[str(field["index"])] = answer
+            elif field["required"]:
+                missing.append(field["label"])
+                self.answers.add_unknown(field["label"])
+        if planned:
+            filled = set(self.driver.execute_script(FILL_FIELDS_JS, planned))
+            for field in step["fields"]:
+                if str(field["index"]) in planned and str(field["index"]) not in filled and field["required"]:
+                    missing.append(field["label"])
+        return missing
+
+    @staticmethod
+    def signature(step):
+        return (step["progress"], step["heading"], tuple(field["label"] for field in step["fields"]))
+
+    # Wait until the modal moves past the given step (or closes)
+    def wait_for_change(self, before):
+        state = {"step": None}
+
+        def changed(driver):
+            step = self.read_step()
+            state["step"] = step
+            if step is None or step["done"] or step["errors"]:
+                return True
+            # Ignore the transitional spinner between steps
+            ready = step["submit"] or step["review"] or step["next"]
+            return bool(ready) and self.signature(step) != before
+
+        try:
+            WebDriverWait(self.driver, self.step_timeout, poll_frequency=0.2).until(changed)
+        except Exception:
+            pass
+        return state["step"]
+
+    def discard(self):
+        try:
+            self.driver.execute_script(DISCARD_JS)
+            time.sleep(0.3)
+            self.driver.execute_script(DISCARD_JS)
+        except Exception as e:
+            logging.warning(f"Could not discard Easy Apply draft: {e}")
+
+    def close(self):
+        try:
+            self.driver.execute_script(CLICK_JS, ".artdeco-modal__dismiss")
+        except Exception as e:
+            logging.warning(f"Could not close application modal: {e}")
+
+    @metrics.timed("easy_apply")
+    def run(self, resume=None):
+        step = self.read_step()
+        if step is None:
+            return NO_FORM
+        try:
+            while self.steps < self.max_steps:
+                if step is None:
+                    logging.warning("Easy Apply modal closed before the application was submitted.")
+                    return UNCONFIRMED
+                if step["done"]:
+                    self.close()
+                    return SUBMITTED
+                record("apply_step", self.driver, self.job_id, self.steps)
+                self.steps += 1
+                self.missing = self.fill(step, resume)
+                if self.missing:
+                    logging.info(f"Easy Apply needs answers for: {self.missing}")
+                    self.discard()
+                    return NEEDS_ANSWERS
+
+                button = step["submit"] or step["review"] or step["next"]
+                if not button:
+                    logging.warning("Easy Apply step has no Next, Review or Submit button.")
+                    self.discard()
+                    return STUCK
+                before = self.signature(step)
+                default_limiter().acquire(APPLY_SUBMIT if button == step["submit"] else CLICK)
+                self.driver.execute_script(CLICK_JS, button)
+                if button == step["submit"]:
+                    # Only the "application sent" confirmation counts; a modal
+                    # that just closes may have dropped the submission
+                    after = self.wait_for_change(before)
+                    if after is not None and after["done"]:
+                        self.close()
+                        return SUBMITTED
+                    if after is None:
+                        logging.warning("Easy Apply modal closed after Submit without a confirmation.")
+                    else:
+                        self.close()
+                    return UNCONFIRMED
+
+                step = self.wait_for_change(before)
+                if step is not None and (step["errors"] or self.signature(step) == before):
+                    logging.warning(f"Easy Apply step did not advance: {step['errors']}")
+                    self.missing = [field["label"] for field in step["fields"] if field["required"]]
+                    self.discard()
+                    return STUCK
+            self.discard()
+            return STUCK
+        finally:
+            metrics.annotate(steps=self.steps)
+            self.answers.save()
@@ -0,0 +1,168 @@
+import os
+import atexit
+import logging
+import threading
+from datetime import datetime
+
+# Every searched job and every apply outcome as one row of a dataset
+# partitioned by day and run (Hive-style directories, readable by pandas,
+# pyarrow, DuckDB or Spark):
+#   <export_dir>/date=2026-10-18/run=20261018-091500-123456/part-00000.parquet
+# Rows are buffered and written batch_size at a time, so a run produces a
+# handful of files instead of one write per job. Parquet needs pyarrow; without
+# it the dataset is written as CSV parts with the same layout.
+COLUMNS = ["time", "run", "event", "search", "keyword", "location", "job_id", "title", "company", "job_location",
+           "easy_apply", "score", "outcome"]
+DEFAULT_EXPORT_DIR = "exports"
+DEFAULT_BATCH_SIZE = 1000
+SEARCHED = "searched"
+OUTCOME = "outcome"
+
+
+def parquet_available():
+    try:
+        import pyarrow
+        return True
+    except ImportError:
+        return False
+
+
+# prefix keeps runs of several accounts sharing one export_dir apart; the
+# microseconds keep runs started within the same second apart
+def new_run_id(prefix=""):
+    return prefix + datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+
+
+# Job row in the dataset's column layout; search is "<keyword> / <location>"
+def export_row(event, job, search=None, outcome=None, run=None, at=None):
+    keyword, _, location = (search or "").partition(" / ")
+    return {
+        "time": (at or datetime.now()).isoformat(timespec="seconds"),
+        "run": run,
+        "event": event,
+        "search": search,
+        "keyword": keyword,
+        "location": location,
+        "job_id": job.get("Job ID"),
+        "title": job.get("Job Title"),
+        "company": job.get("Company"),
+        "job_location": job.get("Location"),
+        "easy_apply": job.get("Easy Apply"),
+        "score": job.get("Score"),
+        "outcome": outcome,
+    }
+
+
+class ResultExporter:
+    def __init__(self, directory, fmt="parquet", batch_size=DEFAULT_BATCH_SIZE, run=None, run_prefix=""):
+        if fmt == "parquet" and not parquet_available():
+            logging.warning("pyarrow is not installed, exporting results as CSV instead of Parquet.")
+            fmt = "csv"
+        self.directory = directory
+        self.format = fmt
+        self.batch_size = batch_size
+        self.run_prefix = run_prefix
+        self.run = run or new_run_id(run_prefix)
+        self.rows = 0
+        self._buffer = []
+        self._parts = {}
+        self._lock = threading.Lock()
+
+    def searched(self, jobs, search=None):
+        self._add([export_row(SEARCHED, job, search, run=self.run) for job in jobs])
+
+    def outcome(self, job, outcome, search=None):
+        self._add([export_row(OUTCOME, job, search, outcome, run=self.run)])
+
+    def _add(self, rows):
+        with self._lock:
+            self._buffer.extend(rows)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        import pandas as pd
+        rows, self._buffer = self._buffer, []
+        frame = pd.DataFrame(rows, columns=COLUMNS)
+        # A run that crosses midnight writes to both days' partitions
+        for day, part in frame.groupby(frame["time"].str[:10], sort=False):
+            self._write(day, part)
+        self.rows += len(rows)
+
+    def _write(self, day, frame):
+        partition = os.path.join(self.directory, f"date={day}", f"run={self.run}")
+        os.makedirs(partition, exist_ok=True)
+        index = self._parts.get(day, 0)
+        self._parts[day] = index + 1
+        path = os.path.join(partition, f"part-{index:05d}.{self.format}")
+        frame = frame.drop(columns=["run"])  # carried by the partition directory
+        if self.format == "parquet":
+            frame.to_parquet(path, index=False)
+        else:
+            frame.to_csv(path, index=False)
+
+    # Flush and start a new run partition, e.g. for each pass of a daemon
+    def new_run(self, run=None):
+        with self._lock:
+            self._flush_locked()
+            self.run = run or new_run_id(self.run_prefix)
+            self._parts = {}
+
+    def close(self):
+        self.flush()
+
+
+_exporter = None
+
+
+# Process-wide exporter, or None when exporting is off
+def active_exporter():
+    return _exporter
+
+
+# Turn exporting on when settings["export_dir"] is set
+def configure_export(settings):
+    global _exporter
+    directory = settings.get("export_dir")
+    if _exporter is not None:
+        _exporter.close()
+    _exporter = ResultExporter(directory, settings.get("export_format", "parquet"),
+                               int(settings.get("export_batch_size", DEFAULT_BATCH_SIZE)),
+                               run_prefix=settings.get("export_run_prefix", "")) if directory else None
+    if _exporter:
+        logging.info(f"Exporting results to {directory} as {_exporter.format}, run {_exporter.run}.")
+    return _exporter
+
+
+# Write whatever is still buffered
+def stop_export():
+    if _exporter is not None:
+        _exporter.close()
+
+
+atexit.register(stop_export)
+
+
+# Exporter calls that are no-ops when exporting is off; a failed write never breaks the run
+def export_searched(jobs, search=None):
+    if _exporter is None:
+        return
+    try:
+        _exporter.searched(jobs, search)
+    except Exception as e:
+        logging.warning(f"Could not export search results: {e}")
+
+
+def export_outcome(job, outcome, search=None):
+    if _exporter is None:
+        return
+    try:
+        _exporter.outcome(job, outcome, search)
+    except Exception as e:
+        logging.warning(f"Could not export apply outcome: {e}")
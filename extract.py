@@ -0,0 +1,123 @@
+import logging
+from selenium.webdriver.common.by import By
+
+# Resolve a card's LinkedIn job id from its data attributes or its view link
+JOB_ID_JS = r"""
+function jobId(card) {
+    var holder = card.closest("[data-occludable-job-id]") || card.closest("[data-job-id]");
+    var id = card.getAttribute("data-job-id") ||
+        (holder && (holder.getAttribute("data-occludable-job-id") || holder.getAttribute("data-job-id")));
+    if (!id) {
+        var link = card.querySelector("a[href*='/jobs/view/']");
+        var match = link && link.getAttribute("href").match(/\/jobs\/view\/(\d+)/);
+        id = match ? match[1] : null;
+    }
+    return id;
+}
+"""
+
+# Pull every visible job card in a single WebDriver round-trip. Selectors fall
+# back to the card's text lines (title, company, location) when LinkedIn
+# changes its markup, which is what the per-element .text parsing relied on.
+EXTRACT_JOB_CARDS_JS = JOB_ID_JS + r"""
+var limit = arguments[0];
+var cards = document.querySelectorAll(".job-card-container");
+var jobs = [];
+function pick(card, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = card.querySelector(selectors[i]);
+        if (el && el.innerText && el.innerText.trim()) {
+            return el.innerText.trim().split("\n")[0].trim();
+        }
+    }
+    return null;
+}
+for (var i = 0; i < cards.length; i++) {
+    if (limit && jobs.length >= limit) {
+        break;
+    }
+    var card = cards[i];
+    var rect = card.getBoundingClientRect();
+    if (rect.width === 0 && rect.height === 0) {
+        continue;
+    }
+    var lines = card.innerText.split("\n").map(function (l) { return l.trim(); }).filter(Boolean);
+    jobs.push({
+        "Job ID": jobId(card),
+        "Job Title": pick(card, [".job-card-list__title", ".job-card-container__link"]) || lines[0] || "",
+        "Company": pick(card, [".job-card-container__company-name", ".job-card-container__primary-description",
+                               ".artdeco-entity-lockup__subtitle"]) || lines[1] || "Unknown Company",
+        "Location": pick(card, [".job-card-container__metadata-item", ".job-card-container__metadata-wrapper li",
+                                ".artdeco-entity-lockup__caption"]) || lines[2] || "",
+        "Easy Apply": /Easy Apply/i.test(card.innerText)
+    });
+}
+return jobs;
+"""
+
+
+# Return each job card element paired with its job id
+FIND_JOB_CARDS_JS = JOB_ID_JS + r"""
+var cards = document.querySelectorAll(".job-card-container");
+var result = [];
+for (var i = 0; i < cards.length; i++) {
+    result.push([cards[i], jobId(cards[i])]);
+}
+return result;
+"""
+
+
+# Find the card element for one job id on the current page
+FIND_JOB_CARD_JS = JOB_ID_JS + r"""
+var cards = document.querySelectorAll(".job-card-container");
+for (var i = 0; i < cards.length; i++) {
+    if (jobId(cards[i]) === arguments[0]) {
+        return cards[i];
+    }
+}
+return null;
+"""
+
+
+# Extract title, company, job id, location and Easy Apply flag for all visible
+# job cards in one execute_script call; returns a list of plain dicts
+def extract_job_cards(driver, limit=None):
+    try:
+        return driver.execute_script(EXTRACT_JOB_CARDS_JS, limit or 0) or []
+    except Exception as e:
+        logging.warning(f"Bulk job card extraction failed, falling back to per-card reads: {e}")
+        return extract_job_cards_slow(driver, limit)
+
+
+# Per-element fallback (one round-trip per card) used when the script fails
+def extract_job_cards_slow(driver, limit=None):
+    jobs = []
+    for job in driver.find_elements(By.CLASS_NAME, "job-card-container"):
+        if limit and len(jobs) >= limit:
+            break
+        lines = job.text.split("\n")
+        jobs.append({
+            "Job ID": job.get_attribute("data-job-id"),
+            "Job Title": lines[0],
+            "Company": lines[1] if len(lines) > 1 else "Unknown Company",
+            "Location": lines[2] if len(lines) > 2 else "",
+            "Easy Apply": "Easy Apply" in lines,
+        })
+    return jobs
+
+
+# Job card elements and their job ids as (element, job_id) pairs, in one round-trip
+def find_job_cards(driver):
+    try:
+        return [(card, job_id) for card, job_id in driver.execute_script(FIND_JOB_CARDS_JS) or []]
+    except Exception as e:
+        logging.warning(f"Could not read job ids with the card list: {e}")
+        return [(card, card.get_attribute("data-job-id")) for card in
+                driver.find_elements(By.CLASS_NAME, "job-card-container")]
+
+
+# Card element for a job id on the current page, or None when it is not shown
+def find_job_card(driver, job_id):
+    if not job_id:
+        return None
+    return driver.execute_script(FIND_JOB_CARD_JS, str(job_id))
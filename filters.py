@@ -0,0 +1,105 @@
+import re
+import logging
+
+# Declarative pre-filter for job records, evaluated before any card is
+# clicked. Rules (all optional), e.g. in the batch spec "apply" section:
+#
+#   "title_include": ["engineer", "analyst"],        regexes, any must match
+#   "title_exclude": ["intern", "principal"],        regexes, none may match
+#   "company_exclude": ["Acme", "Globex"],           exact names, case-insensitive
+#   "seniority_weights": {"senior|sr\\.?": -2, "junior|entry": 1},
+#   "location_weights": {"remote": 2, "jakarta": 1},
+#   "keyword_weights": {"security": 2, "python": 1},
+#   "min_score": 0,
+#   "exclude_applied": true
+#
+# Patterns are compiled once; a batch of records is filtered and scored in a
+# few vectorized pandas string operations rather than per record. pandas is
+# imported on the first evaluation, so importing this module stays cheap.
+
+FIELDS = ["Job ID", "Job Title", "Company", "Location"]
+
+
+def _compile_any(patterns):
+    patterns = [pattern for pattern in patterns or [] if pattern]
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+def _compile_weights(weights):
+    return [(re.compile(pattern, re.IGNORECASE), float(weight)) for pattern, weight in (weights or {}).items()]
+
+
+class JobFilter:
+    def __init__(self, rules=None, store=None):
+        rules = rules or {}
+        self.title_include = _compile_any(rules.get("title_include"))
+        self.title_exclude = _compile_any(rules.get("title_exclude"))
+        self.company_exclude = {company.strip().lower() for company in rules.get("company_exclude", [])}
+        self.seniority_weights = _compile_weights(rules.get("seniority_weights"))
+        self.location_weights = _compile_weights(rules.get("location_weights"))
+        self.keyword_weights = _compile_weights(rules.get("keyword_weights"))
+        self.min_score = rules.get("min_score")
+        self.store = store if rules.get("exclude_applied", True) else None
+
+    # Score every record and mark whether it passes; returns a DataFrame
+    def evaluate(self, jobs):
+        import pandas as pd
+        frame = pd.DataFrame(list(jobs))
+        for field in FIELDS:
+            if field not in frame:
+                frame[field] = ""
+        if frame.empty:
+            frame["Score"] = pd.Series(dtype=float)
+            frame["Passed"] = pd.Series(dtype=bool)
+            return frame
+
+        titles = frame["Job Title"].fillna("").astype(str)
+        companies = frame["Company"].fillna("").astype(str)
+        locations = frame["Location"].fillna("").astype(str)
+
+        passed = pd.Series(True, index=frame.index)
+        if self.title_include is not None:
+            passed &= titles.str.contains(self.title_include)
+        if self.title_exclude is not None:
+            passed &= ~titles.str.contains(self.title_exclude)
+        if self.company_exclude:
+            passed &= ~companies.str.strip().str.lower().isin(self.company_exclude)
+        if self.store is not None:
+            applied = self.store.applied_ids(frame["Job ID"].dropna().tolist())
+            if applied:
+                passed &= ~frame["Job ID"].astype(str).isin(applied)
+
+        score = pd.Series(0.0, index=frame.index)
+        for pattern, weight in self.seniority_weights + self.keyword_weights:
+            score += titles.str.contains(pattern) * weight
+        for pattern, weight in self.location_weights:
+            score += locations.str.contains(pattern) * weight
+        if self.min_score is not None:
+            passed &= score >= float(self.min_score)
+
+        frame["Score"] = score
+        frame["Passed"] = passed
+        return frame
+
+    # Records that pass, with their "Score" added, in the original order;
+    # on_reject(job) is called for every record that does not
+    def filter(self, jobs, on_reject=None):
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        frame = self.evaluate(jobs)
+        kept = []
+        for job, score, ok in zip(jobs, frame["Score"].tolist(), frame["Passed"].tolist()):
+            if ok:
+                kept.append(dict(job, Score=score))
+            elif on_reject:
+                on_reject(job)
+        logging.info(f"Pre-filter kept {len(kept)} of {len(jobs)} jobs.")
+        return kept
+
+    # Filter a stream of result pages (lists of records) one page at a time
+    def filter_pages(self, pages, on_reject=None):
+        for page in pages:
+            yield from self.filter(page, on_reject)
@@ -0,0 +1,174 @@
+import os
+import re
+import json
+import time
+import difflib
+import logging
+import threading
+import unicodedata
+
+WORLDWIDE = "92000000"
+GEO_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "geo_ids.json")
+DEFAULT_CACHE_FILE = "geo_cache.json"
+DEFAULT_CACHE_TTL = 30 * 24 * 3600  # 30 days
+
+# Common alternative spellings mapped onto names in geo_ids.json
+ALIASES = {
+    "usa": "united states",
+    "us": "united states",
+    "united states of america": "united states",
+    "america": "united states",
+    "uk": "united kingdom",
+    "great britain": "united kingdom",
+    "england": "united kingdom",
+    "uae": "united arab emirates",
+    "holland": "netherlands",
+    "korea": "south korea",
+    "republic of korea": "south korea",
+    "viet nam": "vietnam",
+    "turkiye": "turkey",
+    "eu": "european union",
+    "europe": "european union",
+    "global": "worldwide",
+    "anywhere": "worldwide",
+    "remote": "worldwide",
+    "bangalore": "bengaluru",
+    "sf": "san francisco bay area",
+    "san francisco": "san francisco bay area",
+    "nyc": "new york city",
+    "new york": "new york city",
+    "seattle": "greater seattle area",
+    "boston": "greater boston",
+    "la": "los angeles",
+    "greater london": "london",
+}
+
+
+# Lowercase, strip accents, punctuation and extra whitespace
+def normalize(name):
+    name = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[^a-z0-9 ]+", " ", name.lower())
+    return " ".join(name.split())
+
+
+def load_geo_table(path=GEO_TABLE_FILE):
+    with open(path, "r") as file:
+        return {normalize(name): geo_id for name, geo_id in json.load(file).items()}
+
+
+# External lookup through Nominatim: geocode the place, then map its country
+# onto the bundled table. Only used when the table and the cache both miss.
+def nominatim_lookup(table):
+    def lookup(name):
+        from geopy.geocoders import Nominatim
+        geolocator = Nominatim(user_agent="linkedinapply-geo")
+        location = geolocator.geocode(name, addressdetails=True, language="en", timeout=5)
+        if not location:
+            return None
+        print(f"Detected location: {location.address}")
+        country = location.raw.get("address", {}).get("country")
+        return table.get(normalize(country)) if country else None
+    return lookup
+
+
+# Resolve free-text locations to LinkedIn geoIds: exact and alias matches
+# against the bundled table, then a fuzzy match, then the on-disk cache of
+# external lookups, and only then the external resolver (if any). Results are
+# memoized in memory, so repeated lookups are a dict hit.
+class GeoResolver:
+    def __init__(self, table=None, external=None, cache_path=DEFAULT_CACHE_FILE, ttl=DEFAULT_CACHE_TTL,
+                 clock=time.time):
+        self.table = table if table is not None else load_geo_table()
+        self.external = external
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.clock = clock
+        self._names = list(self.table)
+        self._memo = {}
+        self._lock = threading.Lock()
+        self._disk_cache = self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable geo cache {self.cache_path}: {e}")
+            return {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(self._disk_cache, file, indent=4)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write geo cache: {e}")
+
+    # Bundled table only: exact, alias, then fuzzy match; None when unknown
+    def lookup_table(self, name):
+        key = ALIASES.get(name, name)
+        if key in self.table:
+            return self.table[key]
+        match = difflib.get_close_matches(key, self._names, n=1, cutoff=0.85)
+        return self.table[match[0]] if match else None
+
+    def _lookup_external(self, name):
+        entry = self._disk_cache.get(name)
+        if entry and self.clock() - entry.get("resolved_at", 0) < self.ttl:
+            return entry.get("geo_id")
+        if self.external is None:
+            return None
+        try:
+            geo_id = self.external(name)
+        except Exception as e:
+            logging.error(f"Error getting Geo IP location: {e}")
+            return None
+        self._disk_cache[name] = {"geo_id": geo_id, "resolved_at": self.clock()}
+        self._save_cache()
+        return geo_id
+
+    def resolve(self, location_name, default=WORLDWIDE):
+        if location_name in self._memo:
+            return self._memo[location_name] or default
+        name = normalize(location_name)
+        if not name:
+            return default
+        with self._lock:
+            geo_id = self.lookup_table(name) or self._lookup_external(name)
+            self._memo[location_name] = geo_id
+        return geo_id or default
+
+
+_default_resolver = None
+
+
+# Build a resolver from settings; pass offline=True to never touch the network
+def make_resolver(offline=False, cache_path=DEFAULT_CACHE_FILE):
+    table = load_geo_table()
+    external = None if offline else nominatim_lookup(table)
+    return GeoResolver(table, external, cache_path)
+
+
+# Process-wide resolver, built with the defaults unless configure_resolver()
+# or set_default_resolver() installed one first
+def default_resolver():
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = make_resolver()
+    return _default_resolver
+
+
+def configure_resolver(offline=False, cache_path=DEFAULT_CACHE_FILE):
+    resolver = make_resolver(offline, cache_path)
+    set_default_resolver(resolver)
+    return resolver
+
+
+def set_default_resolver(resolver):
+    global _default_resolver
+    _default_resolver = resolver
@@ -0,0 +1,115 @@
+import os
+import re
+import sys
+import gzip
+import json
+import argparse
+from datetime import datetime
+
+from activity_log import DEFAULT_LOG_FILE, ROTATED_TIME_FORMAT, rotated_files
+
+# Every line starts with {"time": "<ISO timestamp>", written by JsonFormatter
+TIME_PREFIX = '{"time": "'
+TIME_START = len(TIME_PREFIX)
+TIME_END = TIME_START + len("2026-01-01T00:00:00.000")
+
+# Example: python logquery.py --since 2026-10-01 --until 2026-10-18 --company acme --outcome applied
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Filter the JSON activity log, including rotated .gz files.")
+    parser.add_argument("--log", default=DEFAULT_LOG_FILE, help="active log file; rotated files are found next to it")
+    parser.add_argument("--since", help="first date or timestamp to include (ISO, e.g. 2026-10-01)")
+    parser.add_argument("--until", help="last date or timestamp to include (ISO, inclusive)")
+    parser.add_argument("--company", help="company name, case-insensitive substring")
+    parser.add_argument("--outcome", action="append", default=[], help="outcome to include (repeatable)")
+    parser.add_argument("--event", help="event type, e.g. job")
+    parser.add_argument("--grep", help="case-insensitive regex on the raw line")
+    parser.add_argument("--count", action="store_true", help="print counts per outcome instead of the events")
+    return parser.parse_args(argv)
+
+
+# The log files that can hold events between since and until, oldest first.
+# A rotated file ends at the time in its name and starts where the previous one ended.
+def files_in_range(log, since=None, until=None):
+    files = []
+    previous_end = ""
+    for path in rotated_files(log):
+        stamp = os.path.basename(path)[len(os.path.basename(log)) + 1:-len(".gz")]
+        try:
+            end = datetime.strptime(stamp, ROTATED_TIME_FORMAT).isoformat()
+        except ValueError:
+            continue
+        if not (since and end < since) and not (until and previous_end[:len(until)] > until):
+            files.append(path)
+        previous_end = end
+    if os.path.exists(log) and not (until and previous_end[:len(until)] > until):
+        files.append(log)
+    return files
+
+
+def open_log(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+# Yield matching events. Timestamps and substrings are checked on the raw
+# line first, so only candidate lines are JSON-decoded.
+def query(log=DEFAULT_LOG_FILE, since=None, until=None, company=None, outcomes=(), event=None, grep=None):
+    needles = []
+    if company:
+        needles.append(re.compile(re.escape(company), re.IGNORECASE))
+    if grep:
+        needles.append(re.compile(grep, re.IGNORECASE))
+    outcome_needles = [f'"outcome": "{outcome}"' for outcome in outcomes]
+    event_needle = f'"event": "{event}"' if event else None
+    company = company.lower() if company else None
+
+    for path in files_in_range(log, since, until):
+        with open_log(path) as file:
+            for line in file:
+                if line.startswith(TIME_PREFIX):
+                    stamp = line[TIME_START:TIME_END]
+                    if since and stamp < since:
+                        continue
+                    if until and stamp[:len(until)] > until:
+                        continue
+                elif since or until:
+                    continue
+                if event_needle and event_needle not in line:
+                    continue
+                if outcome_needles and not any(needle in line for needle in outcome_needles):
+                    continue
+                if any(not needle.search(line) for needle in needles):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if company and company not in str(record.get("company", "")).lower():
+                    continue
+                yield record
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    records = query(args.log, args.since, args.until, args.company, args.outcome, args.event, args.grep)
+    if args.count:
+        counts = {}
+        for record in records:
+            key = record.get("outcome") or record.get("event") or record.get("level")
+            counts[key] = counts.get(key, 0) + 1
+        for key, count in sorted(counts.items(), key=lambda item: -item[1]):
+            print(f"{key:<20}{count:>10}")
+        return 0
+    try:
+        for record in records:
+            sys.stdout.write(json.dumps(record) + "\n")
+    except BrokenPipeError:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
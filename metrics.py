@@ -0,0 +1,296 @@
+import json
+import time
+import random
+import logging
+import inspect
+import threading
+import functools
+from datetime import datetime
+
+# In-process timing and counters for the hot path. Stages are timed with
+# @timed / with span(...), WebDriver commands are counted per stage through
+# instrument_driver, and the whole run can be summarized as a table, JSONL
+# span records or Prometheus text exposition.
+
+_lock = threading.Lock()
+_local = threading.local()
+_stats = {}
+_span_file = None
+# Durations kept per stage for percentiles. Totals and means stay exact; the
+# percentiles come from a uniform sample, so a daemon's memory stays flat.
+RESERVOIR_SIZE = 1024
+_random = random.Random()
+
+
+def _stage_stats(stage):
+    stats = _stats.get(stage)
+    if stats is None:
+        stats = _stats[stage] = {"count": 0, "ok": 0, "failed": 0, "retries": 0, "round_trips": 0,
+                                 "seconds": 0.0, "samples": []}
+    return stats
+
+
+# Reservoir sampling: the n-th duration replaces a random sample with probability size/n
+def _add_duration(stats, duration):
+    stats["seconds"] += duration
+    samples = stats["samples"]
+    if len(samples) < RESERVOIR_SIZE:
+        samples.append(duration)
+    else:
+        index = _random.randrange(stats["count"])
+        if index < RESERVOIR_SIZE:
+            samples[index] = duration
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+# Write every finished span to a JSONL file as it completes
+def open_span_log(path):
+    global _span_file
+    close_span_log()
+    _span_file = open(path, "a") if path else None
+
+
+def close_span_log():
+    global _span_file
+    if _span_file:
+        _span_file.close()
+        _span_file = None
+
+
+class Span:
+    def __init__(self, stage, **fields):
+        self.stage = stage
+        self.fields = fields
+        self.ok = True
+        self.error = None
+        self.retries = 0
+        self.round_trips = 0
+        self.duration = 0.0
+        self._started = None
+
+    def __enter__(self):
+        self.started_at = datetime.now().isoformat(timespec="milliseconds")
+        self._started = time.perf_counter()
+        _stack().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration += time.perf_counter() - self._started
+        _stack().pop()
+        if exc is not None and not isinstance(exc, GeneratorExit):
+            self.fail(exc)
+        self.finish()
+        return False
+
+    def fail(self, error=None):
+        self.ok = False
+        self.error = str(error) if error is not None else self.error
+
+    def finish(self):
+        with _lock:
+            stats = _stage_stats(self.stage)
+            stats["count"] += 1
+            stats["ok" if self.ok else "failed"] += 1
+            stats["retries"] += self.retries
+            stats["round_trips"] += self.round_trips
+            _add_duration(stats, self.duration)
+            if _span_file:
+                record = {"time": self.started_at, "stage": self.stage, "duration": round(self.duration, 4),
+                          "ok": self.ok, "round_trips": self.round_trips, "retries": self.retries,
+                          "thread": threading.current_thread().name}
+                if self.error:
+                    record["error"] = self.error
+                record.update(self.fields)
+                _span_file.write(json.dumps(record) + "\n")
+                _span_file.flush()
+
+
+def span(stage, **fields):
+    return Span(stage, **fields)
+
+
+def current_span():
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+# Mark the innermost active stage as failed (for code that catches its own errors)
+def mark_failed(error=None):
+    current = current_span()
+    if current:
+        current.fail(error)
+
+
+def record_retry(count=1):
+    current = current_span()
+    if current:
+        current.retries += count
+
+
+# Attach extra fields (e.g. a step count) to the innermost active stage's span record
+def annotate(**fields):
+    current = current_span()
+    if current:
+        current.fields.update(fields)
+
+
+# Record a duration that was not measured with a span (e.g. a deliberate sleep)
+def record(stage, duration, ok=True):
+    with _lock:
+        stats = _stage_stats(stage)
+        stats["count"] += 1
+        stats["ok" if ok else "failed"] += 1
+        _add_duration(stats, duration)
+
+
+# Decorator timing a function as one stage. Generator functions are timed
+# only while they run, not while the consumer is working on their output.
+def timed(stage):
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                current = Span(stage)
+                current.started_at = datetime.now().isoformat(timespec="milliseconds")
+                generator = func(*args, **kwargs)
+                try:
+                    while True:
+                        started = time.perf_counter()
+                        _stack().append(current)
+                        try:
+                            item = next(generator)
+                        except StopIteration:
+                            return
+                        finally:
+                            _stack().pop()
+                            current.duration += time.perf_counter() - started
+                        yield item
+                except GeneratorExit:
+                    generator.close()
+                    raise
+                except Exception as e:
+                    current.fail(e)
+                    raise
+                finally:
+                    current.finish()
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Count and time every WebDriver command sent by this driver
+def instrument_driver(driver):
+    if getattr(driver, "_metrics_instrumented", False):
+        return driver
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        started = time.perf_counter()
+        ok = True
+        try:
+            return original(driver_command, params)
+        except Exception:
+            ok = False
+            raise
+        finally:
+            record(f"webdriver:{driver_command}", time.perf_counter() - started, ok)
+            for active in _stack():
+                active.round_trips += 1
+
+    driver.execute = execute
+    driver._metrics_instrumented = True
+    return driver
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summary_rows():
+    with _lock:
+        items = [(stage, dict(stats, samples=list(stats["samples"]))) for stage, stats in _stats.items()]
+    rows = []
+    for stage, stats in sorted(items, key=lambda item: -item[1]["seconds"]):
+        samples = stats["samples"]
+        rows.append({
+            "stage": stage,
+            "count": stats["count"],
+            "ok": stats["ok"],
+            "failed": stats["failed"],
+            "retries": stats["retries"],
+            "round_trips": stats["round_trips"],
+            "total": stats["seconds"],
+            "mean": stats["seconds"] / stats["count"] if stats["count"] else 0.0,
+            "p50": _percentile(samples, 0.5),
+            "p95": _percentile(samples, 0.95),
+        })
+    return rows
+
+
+def format_summary():
+    header = f"{'stage':<34}{'count':>7}{'ok':>6}{'fail':>6}{'retry':>7}{'rtrips':>8}{'total s':>10}{'mean s':>9}{'p95 s':>9}"
+    lines = [header, "-" * len(header)]
+    for row in summary_rows():
+        lines.append(f"{row['stage'][:33]:<34}{row['count']:>7}{row['ok']:>6}{row['failed']:>6}{row['retries']:>7}"
+                     f"{row['round_trips']:>8}{row['total']:>10.2f}{row['mean']:>9.3f}{row['p95']:>9.3f}")
+    return "\n".join(lines)
+
+
+def print_summary():
+    print("\nRun timing summary:")
+    print(format_summary())
+
+
+def format_prometheus(prefix="linkedinapply"):
+    rows = summary_rows()
+    families = [
+        ("stage_seconds_total", "total", "{:.6f}"),
+        ("stage_calls_total", "count", "{}"),
+        ("stage_failures_total", "failed", "{}"),
+        ("stage_retries_total", "retries", "{}"),
+        ("stage_round_trips_total", "round_trips", "{}"),
+    ]
+    lines = []
+    for name, field, fmt in families:
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        for row in rows:
+            label = row["stage"].replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{prefix}_{name}{{stage="{label}"}} ' + fmt.format(row[field]))
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    with open(path, "w") as file:
+        file.write(format_prometheus())
+    logging.info(f"Wrote Prometheus metrics to {path}.")
+
+
+# Configure the span log from settings ("metrics_file")
+def configure_metrics(settings):
+    open_span_log(settings.get("metrics_file"))
+
+
+# End-of-run report: summary table, plus Prometheus text when configured
+def finish_run(settings):
+    print_summary()
+    if settings.get("prometheus_file"):
+        write_prometheus(settings["prometheus_file"])
+    close_span_log()
+
+
+def reset():
+    with _lock:
+        _stats.clear()
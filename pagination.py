@@ -0,0 +1,207 @@
+import logging
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from selenium.webdriver.support.ui import WebDriverWait
+from waits import wait_for_job_cards, human_pause
+from extract import extract_job_cards
+from resilience import load_page, check_throttled, RateLimitedError, THROTTLE_URL_MARKERS
+from ratelimit import default_limiter, PAGE_LOAD
+from recording import record
+
+# LinkedIn shows 25 results per search page and pages with the start= offset
+PAGE_SIZE = 25
+MAX_PAGES = 40
+
+# Date-posted filter (f_TPR=r<seconds>) for incremental searches. Posting
+# times on LinkedIn are approximate, so the window reaches back an extra hour;
+# past 30 days the filter is dropped and only the seen-jobs stop applies.
+POSTED_WINDOW_MARGIN = 3600
+MAX_POSTED_WINDOW = 30 * 24 * 3600
+
+
+# One result page's job records, with the start= offset it was read from
+class ResultPage(list):
+    def __init__(self, jobs=(), start=0):
+        super().__init__(jobs)
+        self.start = start
+
+
+# Return the search URL with its start= offset replaced
+def page_url(base_url, start):
+    parts = urlparse(base_url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    query.pop("refresh", None)
+    if start:
+        query["start"] = [str(start)]
+    else:
+        query.pop("start", None)
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+
+# Query parameters that limit a search to jobs posted since last_run (ISO
+# timestamp), newest first; empty when the window is too long to be useful
+def posted_since_params(last_run, now=None):
+    now = now or datetime.now()
+    seconds = int((now - datetime.fromisoformat(last_run)).total_seconds()) + POSTED_WINDOW_MARGIN
+    if seconds > MAX_POSTED_WINDOW:
+        return "&sortBy=DD"
+    return f"&f_TPR=r{max(seconds, POSTED_WINDOW_MARGIN)}&sortBy=DD"
+
+
+# Wait until the tab has actually navigated to the page at this offset, or
+# was sent to a challenge page instead
+def _wait_for_offset(driver, start, timeout=10):
+    marker = f"start={start}" if start else None
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: any(throttle in d.current_url for throttle in THROTTLE_URL_MARKERS)
+            or ((marker is None or marker in d.current_url)
+                and d.execute_script("return document.readyState") == "complete")
+        )
+        return True
+    except Exception:
+        return False
+
+
+# Second tab that loads the next page while the current one is being read
+class _Prefetcher:
+    def __init__(self, driver):
+        self.driver = driver
+        self.tabs = [driver.current_window_handle]
+        driver.switch_to.new_window("tab")
+        self.tabs.append(driver.current_window_handle)
+        driver.switch_to.window(self.tabs[0])
+        self.current = 0
+
+    # Start loading url in the other tab without waiting for it; the load
+    # counts against the page budget like any other
+    def request(self, url):
+        default_limiter().acquire(PAGE_LOAD)
+        self.driver.switch_to.window(self.tabs[1 - self.current])
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+        self.driver.switch_to.window(self.tabs[self.current])
+
+    # Make the prefetched tab the current one
+    def advance(self):
+        self.current = 1 - self.current
+        self.driver.switch_to.window(self.tabs[self.current])
+
+    # Close the spare tab and stay on the page we ended on
+    def close(self):
+        try:
+            self.driver.switch_to.window(self.tabs[1 - self.current])
+            self.driver.close()
+        except Exception as e:
+            logging.warning(f"Could not close prefetch tab: {e}")
+        self.driver.switch_to.window(self.tabs[self.current])
+
+
+# Walk the search results by start= offset and yield each page's new job
+# records as a list, de-duplicated by job id. Paging stops once
+# roles_to_display jobs were yielded, a page is empty or brings nothing new,
+# or every job on a page had already been applied to (is_applied is an
+# optional job_id -> bool check). With prefetch the next page loads in a
+# second tab while the consumer works on the current one. A page is yielded
+# while it is still displayed, so a consumer can click its cards right away.
+# seen(job_ids) -> set of ids found by earlier runs; paging stops at the first
+# of them, which assumes results sorted newest first. While job ids in
+# pending (jobs waiting for a retry) have not been listed yet, seen jobs are
+# skipped instead, and paging stops once the last of them was reached.
+# first_start resumes a walk at a later offset. extract(driver) reads the job
+# records off the displayed page.
+def iter_pages(driver, base_url, roles_to_display=None, is_applied=None, prefetch=False, max_pages=MAX_PAGES,
+               seen=None, first_start=0, pending=None, extract=extract_job_cards):
+    yielded = 0
+    listed = set()
+    pending = {str(job_id) for job_id in pending or ()}
+    prefetcher = None
+    if prefetch:
+        try:
+            prefetcher = _Prefetcher(driver)
+        except Exception as e:
+            logging.warning(f"Prefetch tab unavailable, paging in one tab: {e}")
+
+    restarts = getattr(driver, "restarts", 0)
+    try:
+        start = first_start
+        load_page(driver, page_url(base_url, start))
+        for page in range(max_pages):
+            next_start = start + PAGE_SIZE
+            if prefetcher and page + 1 < max_pages:
+                prefetcher.request(page_url(base_url, next_start))
+
+            wait_for_job_cards(driver)
+            page_jobs = extract(driver)
+            record("search_page", driver)
+            new_jobs = []
+            for job in page_jobs:
+                key = job.get("Job ID") or (job.get("Job Title"), job.get("Company"))
+                if key in listed:
+                    continue
+                listed.add(key)
+                new_jobs.append(job)
+
+            reached_seen = False
+            skipped = 0
+            if seen and new_jobs:
+                job_ids = [job.get("Job ID") for job in new_jobs]
+                already_seen = seen(job_ids)
+                if pending:
+                    # A job waiting for a retry can be listed after seen ones
+                    pending.difference_update(str(job_id) for job_id in job_ids)
+                    fresh = [job for job in new_jobs if job.get("Job ID") not in already_seen]
+                    skipped = len(new_jobs) - len(fresh)
+                    reached_seen = skipped > 0 and not pending
+                    new_jobs = fresh
+                else:
+                    for position, job in enumerate(new_jobs):
+                        if job.get("Job ID") in already_seen:
+                            new_jobs = new_jobs[:position]
+                            reached_seen = True
+                            break
+
+            logging.info(f"Search page {page + 1} (start={start}): {len(page_jobs)} cards, {len(new_jobs)} new.")
+            if not new_jobs and not (skipped and pending):
+                if reached_seen:
+                    logging.info("Reached jobs seen by an earlier run, stopping.")
+                break
+
+            if new_jobs:
+                # Checked before the consumer gets the page, since it may apply to these jobs
+                all_applied = is_applied and all(is_applied(job.get("Job ID")) for job in new_jobs)
+                if roles_to_display:
+                    new_jobs = new_jobs[:roles_to_display - yielded]
+                yield ResultPage(new_jobs, start)
+                yielded += len(new_jobs)
+                if roles_to_display and yielded >= roles_to_display:
+                    return
+                if all_applied:
+                    logging.info("Every job on this page was already applied to, stopping early.")
+                    break
+            if reached_seen:
+                logging.info("Reached jobs seen by an earlier run, stopping.")
+                break
+
+            human_pause()
+            start = next_start
+            if prefetcher and getattr(driver, "restarts", 0) != restarts:
+                # A restarted session no longer has the prefetch tab
+                prefetcher = None
+            if prefetcher:
+                prefetcher.advance()
+                ready = _wait_for_offset(driver, start)
+                try:
+                    check_throttled(driver)
+                except RateLimitedError as e:
+                    # The prefetched tab landed on a challenge page; slow down
+                    # and let load_page retry with backoff
+                    default_limiter().throttled(e)
+                    ready = False
+                if not ready:
+                    load_page(driver, page_url(base_url, start))
+            else:
+                load_page(driver, page_url(base_url, start))
+    finally:
+        if prefetcher:
+            prefetcher.close()
+
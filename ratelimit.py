@@ -0,0 +1,133 @@
+import time
+import logging
+import threading
+import metrics
+
+# Action types with their own budget
+PAGE_LOAD = "page_load"
+CLICK = "click"
+APPLY_SUBMIT = "apply_submit"
+SEARCH = "search"
+
+# Allowed actions per minute and burst size for each action type. Override
+# any of them with "rate_limits" in settings.json; null means unlimited.
+DEFAULT_BUDGETS = {
+    PAGE_LOAD: {"per_minute": 20, "burst": 3},
+    CLICK: {"per_minute": 40, "burst": 5},
+    APPLY_SUBMIT: {"per_minute": 3, "burst": 1},
+    SEARCH: {"per_minute": 6, "burst": 2},
+}
+
+# Throttling halves every rate down to this fraction of the budget; each
+# RECOVERY_SECONDS without another throttling signal gives RECOVERY_STEP back.
+MIN_FACTOR = 0.125
+RECOVERY_SECONDS = 300
+RECOVERY_STEP = 0.25
+
+
+# Token bucket refilled continuously at per_minute / 60 tokens per second
+class TokenBucket:
+    def __init__(self, per_minute, burst=1, clock=time.monotonic):
+        self.rate = per_minute / 60.0
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self, factor):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate * factor)
+        self.updated = now
+
+    # Take a token and return how long to wait for it. The balance can go
+    # negative, so concurrent callers are spaced out in arrival order.
+    def reserve(self, factor=1.0):
+        self._refill(factor)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / (self.rate * factor)
+
+    # Drop any saved-up burst
+    def drain(self):
+        self.tokens = min(self.tokens, 0.0)
+
+
+# One token bucket per action type, shared by every session in the process.
+# throttled() (called on 429s and challenge pages) halves all rates and
+# drops saved-up bursts; calm periods restore them step by step. clock and
+# sleep are injectable so the schedule can be checked with a fake clock.
+class RateLimiter:
+    def __init__(self, budgets=None, clock=time.monotonic, sleep=time.sleep, recovery_seconds=RECOVERY_SECONDS):
+        budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
+        self.buckets = {action: TokenBucket(budget["per_minute"], budget.get("burst", 1), clock)
+                        for action, budget in budgets.items() if budget and budget.get("per_minute")}
+        self.clock = clock
+        self.sleep = sleep
+        self.recovery_seconds = recovery_seconds
+        self.factor = 1.0
+        self.throttle_count = 0
+        self._calm_since = clock()
+        self._lock = threading.Lock()
+
+    def _recover(self):
+        now = self.clock()
+        if self.factor < 1.0 and now - self._calm_since >= self.recovery_seconds:
+            self.factor = min(1.0, self.factor + RECOVERY_STEP)
+            self._calm_since = now
+            logging.info(f"No throttling for {self.recovery_seconds}s, pacing back to {self.factor:.0%} of budget.")
+
+    # Seconds to wait before doing `action` (reserves the slot); 0 when unlimited
+    def reserve(self, action):
+        with self._lock:
+            self._recover()
+            bucket = self.buckets.get(action)
+            return bucket.reserve(self.factor) if bucket else 0.0
+
+    # Block until `action` is allowed; returns the time waited
+    def acquire(self, action):
+        delay = self.reserve(action)
+        if delay > 0:
+            self.sleep(delay)
+        metrics.record(f"rate_limit:{action}", delay)
+        return delay
+
+    def throttled(self, reason=None):
+        with self._lock:
+            self.factor = max(MIN_FACTOR, self.factor / 2)
+            self._calm_since = self.clock()
+            self.throttle_count += 1
+            for bucket in self.buckets.values():
+                bucket.drain()
+        logging.warning(f"Throttling detected ({reason}), pacing down to {self.factor:.0%} of budget.")
+
+
+# A limiter that never waits, for benchmarks against local fixtures
+def unlimited_limiter():
+    return RateLimiter({action: None for action in DEFAULT_BUDGETS})
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+# Process-wide limiter shared by all sessions and worker threads
+def default_limiter():
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
+
+
+def set_default_limiter(limiter):
+    global _default_limiter
+    with _default_lock:
+        _default_limiter = limiter
+
+
+# Build the process-wide limiter from settings["rate_limits"]
+def configure_rate_limits(settings):
+    limiter = RateLimiter(settings.get("rate_limits"))
+    set_default_limiter(limiter)
+    return limiter
@@ -0,0 +1,109 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from urllib.parse import urlparse, parse_qs
+
+# Query parameters that identify a search; everything else (refresh,
+# currentJobId, tracking ids) is ignored when matching a replayed request
+SEARCH_KEYS = ("keywords", "geoId", "f_WT", "f_AL", "f_TPR")
+
+# Static copy of the page: scripts are dropped so a replayed page only runs
+# the replay server's own script
+SNAPSHOT_PAGE_JS = r"""
+var copy = document.documentElement.cloneNode(true);
+copy.querySelectorAll("script, noscript, iframe").forEach(function (el) { el.remove(); });
+return "<!DOCTYPE html>\n" + copy.outerHTML;
+"""
+
+SNAPSHOT_ELEMENT_JS = r"""
+var el = document.querySelector(arguments[0]);
+if (!el) {
+    return null;
+}
+var copy = el.cloneNode(true);
+copy.querySelectorAll("script, noscript, iframe").forEach(function (node) { node.remove(); });
+return copy.outerHTML;
+"""
+
+DETAILS_SELECTOR = ".jobs-search__job-details--container, .jobs-details"
+MODAL_SELECTOR = ".jobs-easy-apply-modal, .artdeco-modal"
+
+
+# (spec, start offset) for a search URL; spec keeps only the SEARCH_KEYS
+def search_spec(url):
+    query = parse_qs(urlparse(url).query)
+    spec = {key: query[key][0] for key in SEARCH_KEYS if key in query}
+    start = int(query.get("start", ["0"])[0] or 0)
+    return spec, start
+
+
+def spec_key(spec):
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+# Writes snapshots of the pages a real run encounters, for replay_server.py:
+#   searches/<spec key>/spec.json and start-<offset>.html
+#   jobs/<job id>.html          (job details pane)
+#   apply/<job id>/step-<n>.html (Easy Apply modal, one file per step)
+# Snapshots contain whatever LinkedIn showed, including personal details,
+# so keep the directory private.
+class Recorder:
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _write(self, relative, content):
+        if not content:
+            return
+        path = os.path.join(self.directory, relative)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(content)
+
+    def search_page(self, driver):
+        spec, start = search_spec(driver.current_url)
+        key = spec_key(spec)
+        self._write(os.path.join("searches", key, "spec.json"), json.dumps(spec, indent=4))
+        self._write(os.path.join("searches", key, f"start-{start}.html"), driver.execute_script(SNAPSHOT_PAGE_JS))
+
+    def job_details(self, driver, job_id):
+        if job_id:
+            self._write(os.path.join("jobs", f"{job_id}.html"),
+                        driver.execute_script(SNAPSHOT_ELEMENT_JS, DETAILS_SELECTOR))
+
+    def apply_step(self, driver, job_id, step):
+        if job_id:
+            self._write(os.path.join("apply", str(job_id), f"step-{step}.html"),
+                        driver.execute_script(SNAPSHOT_ELEMENT_JS, MODAL_SELECTOR))
+
+
+_recorder = None
+
+
+# Process-wide recorder, or None when recording is off
+def active_recorder():
+    return _recorder
+
+
+# Turn recording on when settings["record_dir"] is set
+def configure_recording(settings):
+    global _recorder
+    directory = settings.get("record_dir")
+    _recorder = Recorder(directory) if directory else None
+    if _recorder:
+        logging.info(f"Recording visited pages to {directory}.")
+    return _recorder
+
+
+# Call one of the Recorder methods if recording is on; a failed snapshot never breaks the run
+def record(method, driver, *args):
+    if _recorder is None:
+        return
+    try:
+        getattr(_recorder, method)(driver, *args)
+    except Exception as e:
+        logging.warning(f"Could not record {method}: {e}")
@@ -0,0 +1,209 @@
+import os
+import re
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from extract import JOB_ID_JS
+from recording import search_spec, spec_key
+
+# Injected into every replayed search page. It stands in for LinkedIn's own
+# scripts: clicking a card loads the recorded details pane, the Easy Apply
+# button and the modal's Next/Review/Submit buttons load the recorded steps,
+# and Dismiss/Discard close the modal.
+REPLAY_JS = JOB_ID_JS + r"""
+(function () {
+    var current = null;
+    var step = 0;
+    var host = null;
+
+    function load(url, done) {
+        fetch(url).then(function (r) { return r.ok ? r.text() : ""; }).then(done);
+    }
+    function pane() {
+        var el = document.querySelector(".jobs-search__job-details--container, .jobs-details");
+        if (!el) {
+            el = document.createElement("div");
+            el.className = "jobs-search__job-details--container";
+            document.body.appendChild(el);
+        }
+        return el;
+    }
+    function closeModal() {
+        if (host) {
+            host.remove();
+            host = null;
+        }
+    }
+    function showModal(html) {
+        closeModal();
+        host = document.createElement("div");
+        host.innerHTML = html;
+        document.body.appendChild(host);
+    }
+    function showStep(n, submitted) {
+        load("/replay/apply/" + current + "/" + n, function (html) {
+            if (html) {
+                step = n;
+                showModal(html);
+            } else if (submitted || n > 0) {
+                showModal('<div class="jobs-easy-apply-modal artdeco-modal">' +
+                    '<button class="artdeco-modal__dismiss" aria-label="Dismiss">x</button>' +
+                    '<h3>Your application was sent</h3></div>');
+            }
+        });
+    }
+
+    document.addEventListener("click", function (event) {
+        var card = event.target.closest(".job-card-container");
+        if (card) {
+            event.preventDefault();
+            current = jobId(card);
+            load("/replay/job/" + current, function (html) {
+                var target = pane();
+                if (html) {
+                    target.outerHTML = html;
+                } else {
+                    target.innerHTML = '<button class="jobs-apply-button">Easy Apply</button>';
+                }
+            });
+            return;
+        }
+        if (event.target.closest(".jobs-apply-button")) {
+            event.preventDefault();
+            showStep(0, false);
+            return;
+        }
+        var button = event.target.closest(".artdeco-modal button");
+        if (!button) {
+            return;
+        }
+        event.preventDefault();
+        var label = (button.getAttribute("aria-label") || button.innerText || "").trim();
+        if (button.classList.contains("artdeco-modal__dismiss") || /^(dismiss|discard)/i.test(label)) {
+            closeModal();
+        } else if (/^submit/i.test(label)) {
+            showStep(step + 1, true);
+        } else if (/^(review|continue|next)/i.test(label)) {
+            showStep(step + 1, false);
+        }
+    }, true);
+})();
+"""
+
+EMPTY_PAGE = "<!DOCTYPE html><html><body><p>Not recorded.</p></body></html>"
+
+
+# Serves a recording directory written by recording.Recorder, adding
+# latency (plus optional jitter) to every response.
+class ReplayHandler(BaseHTTPRequestHandler):
+    recordings = "."
+    latency = 0.0
+    jitter = 0.0
+
+    def log_message(self, format, *args):
+        logging.debug("replay: " + format % args)
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read(self, *parts):
+        path = os.path.join(self.recordings, *parts)
+        if not os.path.isfile(path):
+            return None
+        with open(path, "r", encoding="utf-8") as file:
+            return file.read()
+
+    def do_GET(self):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+        path = self.path.split("?")[0]
+        if path.startswith("/jobs/search"):
+            return self._search()
+        # Jobs without their own snapshot fall back to jobs/default.html and apply/default/
+        match = re.fullmatch(r"/replay/job/(\d+)", path)
+        if match:
+            body = self._read("jobs", f"{match.group(1)}.html") or self._read("jobs", "default.html")
+            return self._send(200 if body else 404, body or "")
+        match = re.fullmatch(r"/replay/apply/(\d+)/(\d+)", path)
+        if match:
+            job_id, step = match.groups()
+            if not os.path.isdir(os.path.join(self.recordings, "apply", job_id)):
+                job_id = "default"
+            body = self._read("apply", job_id, f"step-{step}.html")
+            return self._send(200 if body else 404, body or "")
+        # Images, fonts and tracking calls in the recorded markup
+        self.send_response(204)
+        self.end_headers()
+
+    # The recorded page for this search and offset. Offsets past the end get
+    # the last page again, like LinkedIn, so pagination stops on no new jobs.
+    def _search(self):
+        spec, start = search_spec(self.path)
+        searches = os.path.join(self.recordings, "searches")
+        key = spec_key(spec)
+        if not os.path.isdir(os.path.join(searches, key)):
+            recorded = sorted(os.listdir(searches)) if os.path.isdir(searches) else []
+            if not recorded:
+                return self._send(404, EMPTY_PAGE)
+            key = recorded[0]
+        offsets = sorted(int(name[len("start-"):-len(".html")])
+                         for name in os.listdir(os.path.join(searches, key)) if name.startswith("start-"))
+        if not offsets:
+            return self._send(404, EMPTY_PAGE)
+        offset = max([value for value in offsets if value <= start] or offsets[:1])
+        body = self._read("searches", key, f"start-{offset}.html")
+        script = f"<script>{REPLAY_JS}</script>"
+        body = body.replace("</body>", script + "</body>") if "</body>" in body else body + script
+        self._send(200, body)
+
+
+def start_replay_server(recordings, port=0, latency_ms=0, jitter_ms=0):
+    handler = type("Handler", (ReplayHandler,), {
+        "recordings": os.path.abspath(recordings),
+        "latency": latency_ms / 1000.0,
+        "jitter": jitter_ms / 1000.0,
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Base search URL for a recorded search spec (the first one by default)
+def replay_search_url(server, recordings, key=None):
+    searches = os.path.join(recordings, "searches")
+    key = key or sorted(os.listdir(searches))[0]
+    with open(os.path.join(searches, key, "spec.json"), "r") as file:
+        spec = json.load(file)
+    query = "&".join(f"{name}={value}" for name, value in spec.items())
+    return f"http://127.0.0.1:{server.server_port}/jobs/search/?{query}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve recorded LinkedIn pages for offline runs.")
+    parser.add_argument("recordings", help="directory written with record_dir")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0, help="added latency per response, in ms")
+    parser.add_argument("--jitter", type=float, default=0, help="random extra latency up to this many ms")
+    args = parser.parse_args(argv)
+    server = start_replay_server(args.recordings, args.port, args.latency, args.jitter)
+    print(f"Replaying {args.recordings} at {replay_search_url(server, args.recordings)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
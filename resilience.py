@@ -0,0 +1,228 @@
+import re
+import time
+import random
+import logging
+from collections import deque
+from selenium.common.exceptions import (
+    StaleElementReferenceException, TimeoutException, InvalidSessionIdException, NoSuchWindowException,
+    WebDriverException,
+)
+import metrics
+from ratelimit import default_limiter, PAGE_LOAD, CLICK
+from waits import wait_for_job_details
+from extract import find_job_card
+from recording import record
+
+# Failure classes for WebDriver errors
+STALE = "stale_element"
+TIMEOUT = "timeout"
+SESSION_LOST = "session_lost"
+RATE_LIMITED = "rate_limited"
+OTHER = "other"
+
+DEFAULT_ATTEMPTS = 3
+BASE_DELAY = 0.5
+MAX_DELAY = 8.0
+# Backoff for throttling starts this many times higher than for flaky elements
+RATE_LIMIT_FACTOR = 4
+
+SESSION_LOST_MARKERS = ("invalid session id", "chrome not reachable", "disconnected", "no such window",
+                        "target window already closed", "session deleted", "connection refused",
+                        "max retries exceeded")
+RATE_LIMIT_PATTERN = re.compile(r"\b429\b|too many requests", re.IGNORECASE)
+# LinkedIn sends throttled or suspicious sessions to these pages
+THROTTLE_URL_MARKERS = ("/checkpoint/challenge", "/authwall", "/checkpoint/lg/")
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+
+
+class RateLimitedError(Exception):
+    pass
+
+
+# Raised when a session keeps failing after max_restarts fresh sessions
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+# Map an exception from a WebDriver call onto one of the failure classes
+def classify(error):
+    if isinstance(error, RateLimitedError):
+        return RATE_LIMITED
+    if isinstance(error, StaleElementReferenceException):
+        return STALE
+    if isinstance(error, TimeoutException):
+        return TIMEOUT
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return SESSION_LOST
+    message = str(error).lower()
+    if RATE_LIMIT_PATTERN.search(message):
+        return RATE_LIMITED
+    if isinstance(error, WebDriverException) or type(error).__module__.startswith("urllib3"):
+        if any(marker in message for marker in SESSION_LOST_MARKERS):
+            return SESSION_LOST
+    return OTHER
+
+
+# Raise RateLimitedError when LinkedIn has redirected to a challenge page
+def check_throttled(driver):
+    url = driver.current_url or ""
+    if any(marker in url for marker in THROTTLE_URL_MARKERS):
+        raise RateLimitedError(f"LinkedIn challenge page: {url}")
+
+
+# Full-jitter exponential backoff, bounded by cap
+def backoff_delay(attempt, kind=None, base=BASE_DELAY, cap=MAX_DELAY):
+    if kind == RATE_LIMITED:
+        base *= RATE_LIMIT_FACTOR
+        cap *= RATE_LIMIT_FACTOR
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+# Call func until it succeeds, retrying only the failure classes in retry_on.
+# on_retry(kind, error) runs before each backoff sleep, e.g. to re-find a
+# stale element. Only use this for steps that are safe to repeat.
+def retry(func, attempts=DEFAULT_ATTEMPTS, retry_on=(STALE, TIMEOUT), on_retry=None, sleep=time.sleep):
+    for attempt in range(attempts):
+        try:
+            return func()
+        except Exception as e:
+            kind = classify(e)
+            if kind not in retry_on or attempt + 1 >= attempts:
+                raise
+            if kind == RATE_LIMITED:
+                default_limiter().throttled(e)
+            delay = backoff_delay(attempt, kind)
+            logging.info(f"Retrying after {kind} ({attempt + 1}/{attempts - 1}) in {delay:.2f}s: {e}")
+            metrics.record_retry()
+            if on_retry:
+                on_retry(kind, e)
+            sleep(delay)
+
+
+# Failure rate over the last `window` outcomes; a lost session trips it at once
+class CircuitBreaker:
+    def __init__(self, window=10, threshold=0.5, min_calls=4):
+        self.outcomes = deque(maxlen=window)
+        self.threshold = threshold
+        self.min_calls = min_calls
+
+    def record(self, ok):
+        self.outcomes.append(bool(ok))
+
+    def failure_rate(self):
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def tripped(self, kind=None):
+        if kind == SESSION_LOST:
+            return True
+        return len(self.outcomes) >= self.min_calls and self.failure_rate() >= self.threshold
+
+    def reset(self):
+        self.outcomes.clear()
+
+
+# Stands in for a WebDriver and swaps in a fresh, logged-in session from
+# start() when the circuit breaker trips. Everything holding this object
+# keeps working after a restart; the last page loaded with get() is reopened.
+class RecoverableDriver:
+    def __init__(self, start, breaker=None, max_restarts=3):
+        self._start = start
+        self._breaker = breaker or CircuitBreaker()
+        self._last_url = None
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self._driver = start()
+
+    def __getattr__(self, name):
+        if name == "_driver":
+            raise AttributeError(name)
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        self._last_url = url
+        return self._driver.get(url)
+
+    def record_success(self):
+        self._breaker.record(True)
+
+    # Count a failed step; restart the session if the breaker trips. Returns the failure class.
+    def record_failure(self, error):
+        kind = classify(error)
+        if kind == RATE_LIMITED:
+            default_limiter().throttled(error)
+        self._breaker.record(False)
+        if self._breaker.tripped(kind):
+            self.restart(kind)
+        return kind
+
+    def restart(self, reason=None):
+        if self.restarts >= self.max_restarts:
+            raise CircuitOpenError(f"Session failed again after {self.restarts} restarts ({reason}).")
+        logging.warning(f"Restarting the browser session ({reason}, "
+                        f"failure rate {self._breaker.failure_rate():.0%}).")
+        with metrics.span("session_restart", reason=reason):
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logging.info(f"Old session did not quit cleanly: {e}")
+            self._driver = self._start()
+            self.restarts += 1
+            self._breaker.reset()
+            if self._last_url:
+                self._driver.get(self._last_url)
+
+
+# Breaker hooks that also accept a plain WebDriver
+def record_success(driver):
+    recorder = getattr(driver, "record_success", None)
+    if recorder:
+        recorder()
+
+
+def record_failure(driver, error):
+    recorder = getattr(driver, "record_failure", None)
+    return recorder(error) if recorder else classify(error)
+
+
+# Load a page, retrying timeouts, throttling and lost sessions
+def load_page(driver, url):
+    def load():
+        default_limiter().acquire(PAGE_LOAD)
+        driver.get(url)
+        check_throttled(driver)
+
+    def on_retry(kind, error):
+        if kind == SESSION_LOST:
+            record_failure(driver, error)
+
+    retry(load, retry_on=(TIMEOUT, RATE_LIMITED, SESSION_LOST), on_retry=on_retry)
+
+
+# Click a job card and wait for its details, re-finding the card by job id if it went stale
+def open_job_card(driver, card, job_id):
+    holder = {"card": card}
+
+    def click():
+        default_limiter().acquire(CLICK)
+        holder["card"].click()
+        if wait_for_job_details(driver, job_id) is None:
+            raise TimeoutException(f"Details of job {job_id} did not load.")
+
+    def on_retry(kind, error):
+        if kind == SESSION_LOST:
+            record_failure(driver, error)
+        holder["card"] = find_job_card(driver, job_id) or holder["card"]
+
+    retry(click, retry_on=(STALE, TIMEOUT, SESSION_LOST), on_retry=on_retry)
+    record("job_details", driver, job_id)
+    return holder["card"]
+
+
+# Open a job on its own page, for jobs whose card is not on the current result page
+def open_job_page(driver, job_id):
+    load_page(driver, JOB_VIEW_URL.format(job_id))
+    if wait_for_job_details(driver, job_id) is None:
+        raise TimeoutException(f"Job page {job_id} did not load.")
+    record("job_details", driver, job_id)
@@ -0,0 +1,195 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+import metrics
+
+# LinkedIn rejects Easy Apply uploads above 2 MB
+MAX_RESUME_BYTES = 2 * 1024 * 1024
+DEFAULT_DOCUMENTS_FILE = "resume_documents.json"
+# How long LinkedIn gets to list and select a document after an upload
+UPLOAD_TIMEOUT = 15
+
+# Documents LinkedIn already holds for the account, as listed on the resume
+# step of the Easy Apply form, with the one currently selected. "id" is the
+# document's URN when the card exposes one.
+LIST_DOCUMENTS_JS = r"""
+var cards = document.querySelectorAll(
+    ".jobs-document-upload-redesign-card__container, .jobs-resume-picker__resume, [data-test-document-card]");
+var docs = [];
+for (var i = 0; i < cards.length; i++) {
+    var card = cards[i];
+    var name = card.querySelector(".jobs-document-upload-redesign-card__file-name, " +
+        ".jobs-resume-picker__resume-name, h3");
+    var radio = card.querySelector("input[type='radio']");
+    card.setAttribute("data-resume-card", i);
+    docs.push({
+        "index": i,
+        "id": card.getAttribute("data-document-urn") || card.getAttribute("data-id") ||
+            (radio && radio.value !== "on" ? radio.value : "") || (radio ? radio.id : ""),
+        "name": (name ? name.innerText : card.innerText).trim().split("\n")[0],
+        "selected": /--selected/.test(card.className) || card.getAttribute("aria-checked") === "true" ||
+            Boolean(radio && radio.checked)
+    });
+}
+return docs;
+"""
+
+SELECT_DOCUMENT_JS = r"""
+var card = document.querySelector("[data-resume-card='" + arguments[0] + "']");
+if (!card) {
+    return false;
+}
+(card.querySelector("input[type='radio'], label, button") || card).click();
+return true;
+"""
+
+
+class ResumeError(ValueError):
+    pass
+
+
+# A resume PDF that passed validation; sha256 identifies its content
+class Resume:
+    def __init__(self, path, size, pages, sha256):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.size = size
+        self.pages = pages
+        self.sha256 = sha256
+
+    def __repr__(self):
+        return f"Resume({self.name!r}, {self.pages} pages, {self.size} bytes, {self.sha256[:12]})"
+
+
+# Page count through pypdf when it is installed, otherwise from the page objects
+def count_pages(path, data):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return len(re.findall(rb"/Type\s*/Page\b", data))
+    try:
+        return len(PdfReader(path).pages)
+    except Exception as e:
+        raise ResumeError(f"{path} is not a readable PDF: {e}")
+
+
+_validated = {}
+_validated_lock = threading.Lock()
+
+
+# Check size, PDF structure and page count once per file version
+def validate_resume(path):
+    if not (path or "").strip():
+        raise ResumeError("No resume path given.")
+    path = os.path.abspath(os.path.expanduser(path.strip()))
+    if not os.path.isfile(path):
+        raise ResumeError(f"Resume not found: {path}")
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _validated_lock:
+        if key in _validated:
+            return _validated[key]
+
+    if stat.st_size == 0:
+        raise ResumeError(f"{path} is empty.")
+    if stat.st_size > MAX_RESUME_BYTES:
+        raise ResumeError(f"{path} is {stat.st_size} bytes; LinkedIn accepts at most {MAX_RESUME_BYTES}.")
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(b"%PDF-") or b"%%EOF" not in data[-1024:]:
+        raise ResumeError(f"{path} is not a complete PDF file.")
+    pages = count_pages(path, data)
+    if pages < 1:
+        raise ResumeError(f"{path} has no pages.")
+
+    resume = Resume(path, stat.st_size, pages, hashlib.sha256(data).hexdigest())
+    logging.info(f"Validated {resume}.")
+    with _validated_lock:
+        _validated[key] = resume
+    return resume
+
+
+# What identifies a listed document: its URN, or its name when the card has none
+def document_identity(doc):
+    return doc.get("id") or f"name:{doc['name']}"
+
+
+# Resumes for a run: a default PDF plus optional per-keyword PDFs, all
+# validated up front. attach() picks a document LinkedIn already holds only
+# when it is one we uploaded for the same content (identities are kept by
+# sha256 in documents_file across runs), and uploads the file otherwise.
+class ResumeManager:
+    def __init__(self, default=None, by_keyword=None, documents_file=None, upload_timeout=UPLOAD_TIMEOUT):
+        self.default = validate_resume(default) if default else None
+        self.by_keyword = {keyword.lower(): validate_resume(path) for keyword, path in (by_keyword or {}).items()}
+        self.documents_file = documents_file
+        self.upload_timeout = upload_timeout
+        # Identities of the LinkedIn documents holding each uploaded content, keyed by sha256
+        self._documents = {}
+        self._lock = threading.Lock()
+        self.uploads = 0
+        if documents_file and os.path.exists(documents_file):
+            try:
+                with open(documents_file, "r") as file:
+                    self._documents = {sha256: set(ids) for sha256, ids in json.load(file).items()}
+            except (OSError, ValueError) as e:
+                logging.warning(f"Could not read resume documents {documents_file}: {e}")
+
+    # Resume for a search ("keyword / location"): the first keyword found in it, else the default
+    def for_search(self, search=None):
+        text = (search or "").lower()
+        for keyword, resume in self.by_keyword.items():
+            if keyword in text:
+                return resume
+        return self.default
+
+    def _known(self, resume):
+        with self._lock:
+            return set(self._documents.get(resume.sha256, ()))
+
+    def _remember(self, resume, identity):
+        with self._lock:
+            self._documents.setdefault(resume.sha256, set()).add(identity)
+            if not self.documents_file:
+                return
+            try:
+                with open(self.documents_file, "w") as file:
+                    json.dump({sha256: sorted(ids) for sha256, ids in self._documents.items()}, file, indent=4)
+            except OSError as e:
+                logging.warning(f"Could not save resume documents {self.documents_file}: {e}")
+
+    # Make sure the resume is the selected document; upload_selector is the file input
+    def attach(self, driver, resume, upload_selector):
+        known = self._known(resume)
+        docs = driver.execute_script(LIST_DOCUMENTS_JS) or []
+        identities = [document_identity(doc) for doc in docs]
+        for doc, identity in zip(docs, identities):
+            # A name shared by several documents does not tell which one holds this content
+            if identity not in known or identities.count(identity) > 1:
+                continue
+            if doc["selected"]:
+                logging.info(f"{resume.name} is already selected on LinkedIn.")
+                return "selected"
+            if driver.execute_script(SELECT_DOCUMENT_JS, doc["index"]):
+                logging.info(f"Selected the existing LinkedIn copy of {resume.name}.")
+                return "picked"
+
+        with metrics.span("resume_upload", bytes=resume.size):
+            driver.find_element(By.CSS_SELECTOR, upload_selector).send_keys(resume.path)
+        with self._lock:
+            self.uploads += 1
+        # The new document's card renders a moment later, selected; remember which one it is
+        try:
+            uploaded = WebDriverWait(driver, self.upload_timeout, poll_frequency=0.25).until(
+                lambda d: next((doc for doc in d.execute_script(LIST_DOCUMENTS_JS) or []
+                                if doc["selected"] and document_identity(doc) not in identities), None))
+            self._remember(resume, document_identity(uploaded))
+        except Exception as e:
+            logging.warning(f"Uploaded {resume.name} but could not tell which LinkedIn document it became: {e}")
+        logging.info(f"Uploaded {resume.name} ({resume.size} bytes).")
+        return "uploaded"
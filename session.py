@@ -0,0 +1,170 @@
+import os
+import json
+import logging
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+import metrics
+
+DRIVER_CACHE_FILE = ".chromedriver_cache.json"
+DEFAULT_COOKIE_FILE = "linkedin_cookies.json"
+FEED_URL = "https://www.linkedin.com/feed/"
+
+
+# Resolve the chromedriver path, calling the driver manager only when the
+# cached path is missing or no longer exists on disk
+@metrics.timed("chromedriver_path")
+def chromedriver_path(cache_file=DRIVER_CACHE_FILE, refresh=False):
+    if not refresh and os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r") as file:
+                path = json.load(file).get("chromedriver")
+            if path and os.path.exists(path):
+                return path
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable chromedriver cache: {e}")
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    with open(cache_file, "w") as file:
+        json.dump({"chromedriver": path}, file)
+    logging.info(f"Cached chromedriver path: {path}")
+    return path
+
+
+# Start Chrome with the cached driver; re-resolve once if it no longer matches the browser
+def launch_chrome(chrome_options):
+    try:
+        return webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+    except Exception as e:
+        logging.warning(f"Cached chromedriver failed to start, resolving it again: {e}")
+        return webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=chrome_options)
+
+
+# Third-party analytics/tracking plus font and media files, blocked in performance mode
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com/li.lms-analytics*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/realtime/*",
+    "*bat.bing.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8",
+]
+PERFORMANCE_WINDOW_SIZE = "1280,800"
+
+
+# Headless, image-free Chrome with a fixed viewport and eager page loads
+def apply_performance_options(chrome_options):
+    chrome_options.arguments[:] = [arg for arg in chrome_options.arguments if arg != "--start-maximized"]
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument(f"--window-size={PERFORMANCE_WINDOW_SIZE}")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+    })
+    chrome_options.page_load_strategy = "eager"
+    return chrome_options
+
+
+# Block analytics, fonts and media by URL pattern through CDP
+def block_urls(driver, patterns=None):
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns or BLOCKED_URL_PATTERNS)})
+    except Exception as e:
+        logging.warning(f"Could not set blocked URLs: {e}")
+    return driver
+
+
+# The cookies are a logged-in session, so the file is readable by the owner only
+def save_cookies(driver, path=DEFAULT_COOKIE_FILE):
+    try:
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as file:
+            json.dump(driver.get_cookies(), file)
+        os.replace(tmp_path, path)
+        logging.info(f"Saved session cookies to {path}.")
+    except Exception as e:
+        logging.warning(f"Could not save session cookies: {e}")
+
+
+# Add saved cookies to the browser; the driver has to be on linkedin.com first
+def load_cookies(driver, path=DEFAULT_COOKIE_FILE):
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, "r") as file:
+            cookies = json.load(file)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not read saved cookies: {e}")
+        return False
+
+    loaded = 0
+    for cookie in cookies:
+        if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+            cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+            loaded += 1
+        except Exception:
+            pass
+    return loaded > 0
+
+
+# Quick check: does the feed open without being bounced to a login page?
+def session_is_valid(driver, timeout=8):
+    driver.get(FEED_URL)
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: "/feed" in d.current_url or "login" in d.current_url or "authwall" in d.current_url
+            or "checkpoint" in d.current_url
+        )
+    except Exception:
+        return False
+    return "/feed" in driver.current_url
+
+
+# Reuse the Chrome profile / saved cookies when they are still logged in;
+# returns True when no fresh login is needed
+@metrics.timed("restore_session")
+def restore_session(driver, cookie_path=DEFAULT_COOKIE_FILE):
+    try:
+        if session_is_valid(driver):
+            logging.info("Reused existing LinkedIn session from the Chrome profile.")
+            return True
+        if load_cookies(driver, cookie_path) and session_is_valid(driver):
+            logging.info("Restored LinkedIn session from saved cookies.")
+            return True
+    except Exception as e:
+        logging.warning(f"Could not restore LinkedIn session: {e}")
+    return False
+
+
+# Raised when a login does not end in a valid session
+class LoginError(RuntimeError):
+    pass
+
+
+# Full login, then persist the cookies once the feed is reachable
+def login_and_save(driver, username, password, login, cookie_path=DEFAULT_COOKIE_FILE, timeout=15):
+    login(driver, username, password)
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: "/login" not in d.current_url)
+    except Exception:
+        logging.warning("Still on the login page after submitting credentials.")
+    if session_is_valid(driver):
+        save_cookies(driver, cookie_path)
+        return True
+    return False
+
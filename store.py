@@ -0,0 +1,211 @@
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+
+DEFAULT_DB_PATH = "applied_jobs.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applied_jobs (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT UNIQUE,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    search TEXT,
+    status TEXT NOT NULL DEFAULT 'applied',
+    applied_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applied_jobs_company ON applied_jobs (company);
+CREATE INDEX IF NOT EXISTS idx_applied_jobs_applied_at ON applied_jobs (applied_at);
+CREATE INDEX IF NOT EXISTS idx_applied_jobs_search ON applied_jobs (search);
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    search_key TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (search_key, job_id)
+);
+CREATE TABLE IF NOT EXISTS search_runs (
+    search_key TEXT PRIMARY KEY,
+    last_run_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS retry_jobs (
+    job_id TEXT PRIMARY KEY,
+    outcome TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+# Stable key for a search spec in the seen-jobs index
+def search_key(keyword, geo_id, work_type, easy_apply):
+    return f"keywords={(keyword or '').strip().lower()}&geoId={geo_id}&f_WT={work_type}&f_AL={easy_apply}"
+
+
+# Synthetic job id for a company imported from the legacy applied_companies list
+def legacy_job_id(company):
+    return "legacy:" + " ".join(company.lower().split())
+
+
+# Applied-jobs history in an embedded SQLite database (WAL mode). Every
+# application is committed as it happens, and lookups go through the unique
+# job_id index, so startup cost does not grow with the size of the history.
+class AppliedJobsStore:
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    # Has this job id already been applied to?
+    def has_applied(self, job_id):
+        if not job_id:
+            return False
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM applied_jobs WHERE job_id = ?", (str(job_id),)).fetchone()
+        return row is not None
+
+    # Subset of job_ids already applied to, in one query
+    def applied_ids(self, job_ids):
+        job_ids = [str(job_id) for job_id in job_ids if job_id]
+        found = set()
+        with self._lock:
+            for offset in range(0, len(job_ids), 500):
+                chunk = job_ids[offset:offset + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(row[0] for row in self._conn.execute(
+                    f"SELECT job_id FROM applied_jobs WHERE job_id IN ({placeholders})", chunk))
+        return found
+
+    # Subset of job_ids already seen by earlier runs of this search. Jobs
+    # waiting for a retry are left out, so the search does not stop at them.
+    def seen_ids(self, key, job_ids):
+        job_ids = [str(job_id) for job_id in job_ids if job_id]
+        found = set()
+        with self._lock:
+            for offset in range(0, len(job_ids), 500):
+                chunk = job_ids[offset:offset + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(row[0] for row in self._conn.execute(
+                    f"SELECT job_id FROM seen_jobs WHERE search_key = ? AND job_id IN ({placeholders}) "
+                    f"AND job_id NOT IN (SELECT job_id FROM retry_jobs)",
+                    [key] + chunk))
+        return found
+
+    def mark_seen(self, key, job_ids, seen_at=None):
+        seen_at = seen_at or datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO seen_jobs (search_key, job_id, first_seen, last_seen) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(search_key, job_id) DO UPDATE SET last_seen = excluded.last_seen",
+                [(key, str(job_id), seen_at, seen_at) for job_id in job_ids if job_id],
+            )
+            self._conn.commit()
+
+    # Remember a job whose outcome (failed, needs_answers, ...) should be tried again
+    def mark_retry(self, job_id, outcome, updated_at=None):
+        if not job_id:
+            return
+        updated_at = updated_at or datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO retry_jobs (job_id, outcome, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET outcome = excluded.outcome, updated_at = excluded.updated_at",
+                (str(job_id), outcome, updated_at),
+            )
+            self._conn.commit()
+
+    # The job reached a final outcome; nothing left to retry
+    def clear_retry(self, job_id):
+        if not job_id:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM retry_jobs WHERE job_id = ?", (str(job_id),))
+            self._conn.commit()
+
+    # Jobs this search listed before that are still waiting for a retry
+    def retry_ids(self, key):
+        with self._lock:
+            return {row[0] for row in self._conn.execute(
+                "SELECT job_id FROM seen_jobs WHERE search_key = ? "
+                "AND job_id IN (SELECT job_id FROM retry_jobs)", (key,))}
+
+    # When this search first listed the oldest job still waiting for a retry, or None
+    def oldest_retry(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(first_seen) FROM seen_jobs WHERE search_key = ? "
+                "AND job_id IN (SELECT job_id FROM retry_jobs)", (key,)).fetchone()
+        return row[0] if row else None
+
+    # When this search last ran to completion (ISO timestamp), or None
+    def last_search_run(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT last_run_at FROM search_runs WHERE search_key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def record_search_run(self, key, run_at):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO search_runs (search_key, last_run_at) VALUES (?, ?) "
+                "ON CONFLICT(search_key) DO UPDATE SET last_run_at = excluded.last_run_at",
+                (key, run_at),
+            )
+            self._conn.commit()
+
+    # Record one application; job is a dict using the search result keys
+    def record(self, job, search=None, status="applied", applied_at=None):
+        applied_at = applied_at or datetime.now().isoformat(timespec="seconds")
+        job_id = job.get("Job ID")
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO applied_jobs (job_id, title, company, location, search, status, applied_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET status = excluded.status, applied_at = excluded.applied_at",
+                (str(job_id) if job_id else None, job.get("Job Title"), job.get("Company"),
+                 job.get("Location"), search, status, applied_at),
+            )
+            self._conn.commit()
+
+    # Distinct companies applied to, optionally only since an ISO timestamp
+    def companies(self, since=None):
+        query = "SELECT DISTINCT company FROM applied_jobs WHERE status = 'applied'"
+        params = ()
+        if since:
+            query += " AND applied_at >= ?"
+            params = (since,)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query + " ORDER BY company", params)]
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0]
+
+    # Move the legacy settings["applied_companies"] list into the store. Each
+    # company gets the synthetic job id "legacy:<company>", so importing the
+    # same list again (e.g. settings.json was not saved) adds nothing. Returns
+    # how many entries were taken out of settings.
+    def import_legacy_companies(self, settings):
+        companies = settings.pop("applied_companies", None) or []
+        if not companies:
+            return 0
+        applied_at = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT INTO applied_jobs (job_id, company, status, applied_at) VALUES (?, ?, 'applied', ?) "
+                "ON CONFLICT(job_id) DO NOTHING",
+                [(legacy_job_id(company), company, applied_at) for company in companies if company],
+            )
+            imported = self._conn.total_changes - before
+            self._conn.commit()
+        logging.info(f"Imported {imported} applied companies from settings.json into {self.path}.")
+        return len(companies)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,28 @@
+# Lazy stages for job record streams (any iterable of search result dicts).
+# Each stage pulls one record at a time, so chaining them keeps memory flat
+# and lets the apply stage start before the search has finished paging.
+
+
+# Call callback(job) for every record as it passes through
+def tap(jobs, callback):
+    for job in jobs:
+        callback(job)
+        yield job
+
+
+# Set flags["exhausted"] once the upstream has been read to the end
+def mark_exhausted(jobs, flags):
+    yield from jobs
+    flags["exhausted"] = True
+
+
+# Stop pulling records once done() is true. It is checked before each pull,
+# so a limit reached on the last record loads no further page upstream.
+def until(jobs, done):
+    iterator = iter(jobs)
+    while not done():
+        try:
+            job = next(iterator)
+        except StopIteration:
+            return
+        yield job
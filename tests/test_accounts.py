@@ -0,0 +1,58 @@
+import sys
+import pathlib
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import accounts
+
+
+class FakeProcess:
+    def __init__(self, target=None, name=None, args=()):
+        self.name = name
+        self.pid = 1000
+        self.exitcode = None
+        self.alive = False
+
+    def start(self):
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.processes = []
+
+    def Process(self, **kwargs):
+        process = FakeProcess(**kwargs)
+        self.processes.append(process)
+        return process
+
+
+def job(name, searches=1):
+    return {"name": name, "settings": {}, "batch": {"searches": [{}] * searches}, "directory": "."}
+
+
+def test_interrupt_stops_running_accounts(monkeypatch):
+    context = FakeContext()
+    stopped = []
+
+    def stop(process):
+        process.alive = False
+        process.exitcode = -15
+        stopped.append(process.name)
+
+    def interrupt(seconds):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(accounts.multiprocessing, "get_context", lambda method: context)
+    monkeypatch.setattr(accounts, "_stop", stop)
+    monkeypatch.setattr(accounts.time, "sleep", interrupt)
+    finished = accounts.run_accounts([job("alice", 2), job("bob"), job("carol")], workers=2)
+
+    assert sorted(stopped) == ["account-alice", "account-bob"]
+    assert finished["alice"]["status"] == finished["bob"]["status"] == "interrupted"
+    assert finished["carol"] == {"status": "not_started", "exitcode": None, "seconds": 0}
@@ -0,0 +1,128 @@
+import sys
+import gzip
+import json
+import logging
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import logquery
+from activity_log import CompressingRotatingHandler, JsonFormatter, rotated_files
+
+
+def make_record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def handler_for(path, backup_count):
+    handler = CompressingRotatingHandler(str(path), max_bytes=200, backup_count=backup_count, daily=False)
+    handler.setFormatter(JsonFormatter())
+    return handler
+
+
+def test_rotation_compresses_and_prunes(tmp_path):
+    path = tmp_path / "activity.log"
+    handler = handler_for(path, backup_count=2)
+    for index in range(20):
+        handler.emit(make_record(f"event {index:02d} " + "x" * 40))
+    handler.close()
+
+    rotated = rotated_files(str(path))
+    assert len(rotated) == 2
+    assert not list(tmp_path.glob("*.rotating"))
+    with gzip.open(rotated[-1], "rt", encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file]
+    assert lines and all(line["message"].startswith("event") for line in lines)
+    # The newest events are in the active file, the oldest were pruned
+    active = [json.loads(line)["message"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert active[-1].startswith("event 19")
+
+
+def test_zero_backup_count_keeps_no_history(tmp_path):
+    path = tmp_path / "activity.log"
+    handler = handler_for(path, backup_count=0)
+    for index in range(20):
+        handler.emit(make_record(f"event {index:02d} " + "x" * 40))
+    handler.close()
+
+    assert rotated_files(str(path)) == []
+    active = [json.loads(line)["message"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert active[-1].startswith("event 19")
+    assert len(active) < 20
+
+
+def write_lines(path, events):
+    lines = "".join(json.dumps(event) + "\n" for event in events)
+    if str(path).endswith(".gz"):
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(lines)
+    else:
+        path.write_text(lines, encoding="utf-8")
+
+
+def job(time, company, outcome):
+    return {"time": time, "level": "INFO", "message": f"{outcome}: Engineer at {company}", "event": "job",
+            "company": company, "outcome": outcome}
+
+
+@pytest.fixture
+def log(tmp_path):
+    path = tmp_path / "activity.log"
+    write_lines(tmp_path / "activity.log.20261001-000000-000000.gz", [
+        job("2026-09-30T10:00:00.000", "Acme", "applied"),
+        job("2026-09-30T11:00:00.000", "Globex", "skipped"),
+    ])
+    write_lines(tmp_path / "activity.log.20261010-000000-000000.gz", [
+        job("2026-10-05T10:00:00.000", "Acme", "needs_answers"),
+        job("2026-10-09T10:00:00.000", "Initech", "applied"),
+    ])
+    write_lines(path, [
+        job("2026-10-12T10:00:00.000", "ACME Corp", "applied"),
+        {"time": "2026-10-12T11:00:00.000", "level": "WARNING", "message": "Rate limited"},
+    ])
+    with open(path, "a", encoding="utf-8") as file:
+        file.write("Traceback without a timestamp\n")
+    return str(path)
+
+
+def times(records):
+    return [record["time"][:10] for record in records]
+
+
+def test_files_in_range_skips_rotated_segments(log):
+    names = [pathlib.Path(path).name for path in logquery.files_in_range(log, since="2026-10-02")]
+    assert names == ["activity.log.20261010-000000-000000.gz", "activity.log"]
+    names = [pathlib.Path(path).name for path in logquery.files_in_range(log, until="2026-09-30")]
+    assert names == ["activity.log.20261001-000000-000000.gz"]
+
+
+def test_query_reads_gz_segments(log):
+    records = list(logquery.query(log))
+    assert times(records) == ["2026-09-30", "2026-09-30", "2026-10-05", "2026-10-09", "2026-10-12", "2026-10-12"]
+
+
+def test_query_filters_on_time_prefix(log):
+    assert times(logquery.query(log, since="2026-10-05", until="2026-10-09")) == ["2026-10-05", "2026-10-09"]
+    # A date-only until includes the whole day
+    assert times(logquery.query(log, until="2026-09-30")) == ["2026-09-30", "2026-09-30"]
+
+
+def test_query_never_decodes_lines_outside_the_range(log, monkeypatch):
+    decoded = []
+    loads = json.loads
+
+    def counting_loads(line):
+        decoded.append(line)
+        return loads(line)
+
+    monkeypatch.setattr(logquery.json, "loads", counting_loads)
+    assert times(logquery.query(log, since="2026-10-12")) == ["2026-10-12", "2026-10-12"]
+    assert len(decoded) == 2
+
+
+def test_query_filters_company_and_outcome(log):
+    records = list(logquery.query(log, company="acme", outcomes=["applied"]))
+    assert [record["company"] for record in records] == ["Acme", "ACME Corp"]
+    records = list(logquery.query(log, event="job", outcomes=["needs_answers", "skipped"]))
+    assert [record["company"] for record in records] == ["Globex", "Acme"]
@@ -0,0 +1,104 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import app2
+import core
+from ratelimit import unlimited_limiter
+from workers import build_search_specs
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    started = []
+
+    def start_session(*args, **kwargs):
+        started.append(FakeDriver(len(started)))
+        return started[-1]
+
+    def iter_pages(driver, url, *args):
+        if "keywords=bad" in url:
+            raise TimeoutError("results did not load")
+        keyword = url.split("keywords=", 1)[1].split("&", 1)[0]
+        yield [{"Job ID": f"{keyword}-1", "Job Title": "Engineer", "Company": "Acme"}]
+
+    limiter = unlimited_limiter()
+    monkeypatch.setattr(app2, "start_session", start_session)
+    monkeypatch.setattr(core, "iter_pages", iter_pages)
+    monkeypatch.setattr(core, "default_limiter", lambda: limiter)
+    monkeypatch.setattr(core, "get_geo_ip", lambda location, default=None: "1")
+    monkeypatch.setattr(core, "export_searched", lambda jobs, search=None: None)
+    return started
+
+
+def test_failed_search_is_isolated_and_replaces_the_session(sessions, capsys):
+    specs = build_search_specs(["bad", "python", "rust"], ["Jakarta"], True, "remote")
+    jobs = app2.search_in_parallel(specs, {"search_workers": 1}, "user", "secret")
+
+    assert sorted(job["Job ID"] for job in jobs) == ["python-1", "rust-1"]
+    assert "Search failed for 'bad' in 'Jakarta': results did not load" in capsys.readouterr().out
+    assert len(sessions) == 2 and sessions[0].quit_called
+
+
+class FakeStore:
+    def applied_ids(self, job_ids):
+        return {"2"}
+
+
+def test_screen_drops_applied_jobs_without_rules():
+    jobs = [{"Job ID": "1"}, {"Job ID": "2"}, {"Job ID": "3"}]
+    assert [job["Job ID"] for job in app2.screen(jobs, None, FakeStore())] == ["1", "3"]
+
+
+def test_apply_to_passes_only_the_confirmed_job(monkeypatch):
+    calls = []
+    monkeypatch.setattr(app2, "apply_jobs", lambda *args, **kwargs: calls.append(kwargs["jobs"]))
+    answers = iter(["n", "y"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+    jobs = [{"Job ID": "1", "Job Title": "A", "Company": "X"}, {"Job ID": "2", "Job Title": "B", "Company": "Y"}]
+    app2.apply_to(object(), jobs, False, True, None, {}, FakeStore(), "python / Jakarta", None)
+    assert calls == [[jobs[1]]]
+
+
+class MainStore(FakeStore):
+    def import_legacy_companies(self, settings):
+        return 0
+
+    def close(self):
+        pass
+
+
+def test_single_search_applies_page_by_page(monkeypatch):
+    events = []
+    pages = [[{"Job ID": "1", "Job Title": "A", "Company": "X"}],
+             [{"Job ID": "2", "Job Title": "B", "Company": "Y"}, {"Job ID": "3", "Job Title": "C", "Company": "Z"}]]
+
+    def stream_job_pages(driver, keyword, location, easy_apply, job_type, **kwargs):
+        for number, page in enumerate(pages):
+            events.append(("page", number))
+            yield page
+
+    answers = iter(["python", "Jakarta", "y", "remote", "", "y", "y", "n"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+    monkeypatch.setattr(app2, "load_settings", lambda: {"username": "user", "password": "secret"})
+    monkeypatch.setattr(app2, "configure", lambda settings: None)
+    monkeypatch.setattr(app2, "AppliedJobsStore", lambda path: MainStore())
+    monkeypatch.setattr(app2, "start_session", lambda *args, **kwargs: FakeDriver(0))
+    monkeypatch.setattr(app2, "finish_run", lambda settings: None)
+    monkeypatch.setattr(app2, "stream_job_pages", stream_job_pages)
+    monkeypatch.setattr(app2, "apply_jobs", lambda *args, **kwargs: events.append(
+        ("apply", [job["Job ID"] for job in kwargs["jobs"]], kwargs["decide"](None))))
+    app2.main()
+
+    assert events == [("page", 0), ("apply", ["1"], True), ("page", 1), ("apply", ["3"], True)]
@@ -0,0 +1,77 @@
+import sys
+import asyncio
+import pathlib
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from async_driver import AsyncWebDriver, AsyncElement, ELEMENT_KEY, login_linkedin
+
+
+# Stand-in for chromedriver: answers every command with the next canned value
+class FakeConnection:
+    def __init__(self, values):
+        self.values = list(values)
+        self.requests = []
+
+    async def request(self, method, path, payload=None):
+        self.requests.append((method, path, payload))
+        return 200, {"value": self.values.pop(0)}
+
+
+def driver_with(*values):
+    driver = AsyncWebDriver("http://localhost:9515")
+    driver.connection = FakeConnection(values)
+    driver.session_id = "s1"
+    return driver
+
+
+def test_find_element_returns_element():
+    driver = driver_with({ELEMENT_KEY: "e1"})
+    element = asyncio.run(driver.find_element("css selector", ".job"))
+    assert isinstance(element, AsyncElement) and element.id == "e1"
+
+
+def test_nested_find_element_returns_element():
+    driver = driver_with({ELEMENT_KEY: "e1"}, {ELEMENT_KEY: "e2"})
+
+    async def nested():
+        card = await driver.find_element("css selector", ".job")
+        return await card.find_element("css selector", "a")
+
+    element = asyncio.run(nested())
+    assert isinstance(element, AsyncElement) and element.id == "e2"
+    assert driver.connection.requests[-1][1] == "/session/s1/element/e1/element"
+
+
+def test_login_unchecks_remember_me():
+    driver = driver_with(None, {ELEMENT_KEY: "user"}, None, {ELEMENT_KEY: "pass"}, None,
+                         {ELEMENT_KEY: "remember"}, True, None, {ELEMENT_KEY: "submit"}, None)
+
+    async def no_pause(seconds):
+        pass
+
+    asyncio.run(login_linkedin(driver, "me@example.com", "secret", pause=no_pause))
+    paths = [path for method, path, payload in driver.connection.requests]
+    assert "/session/s1/element/remember/selected" in paths
+    assert paths[-3:] == ["/session/s1/element/remember/click", "/session/s1/element",
+                          "/session/s1/element/submit/click"]
+
+
+# chromedriver's answer when the page has no Remember Me checkbox
+class NoRememberMe(FakeConnection):
+    async def request(self, method, path, payload=None):
+        if payload and payload.get("value") == "//input[@id='remember-me']":
+            self.requests.append((method, path, payload))
+            return 404, {"value": {"error": "no such element", "message": "remember-me"}}
+        return await super().request(method, path, payload)
+
+
+def test_login_without_remember_me():
+    driver = driver_with()
+    driver.connection = NoRememberMe([None, {ELEMENT_KEY: "user"}, None, {ELEMENT_KEY: "pass"}, None,
+                                      {ELEMENT_KEY: "submit"}, None])
+
+    async def no_pause(seconds):
+        pass
+
+    asyncio.run(login_linkedin(driver, "me@example.com", "secret", pause=no_pause))
+    assert driver.connection.requests[-1][1] == "/session/s1/element/submit/click"
@@ -0,0 +1,125 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import batch
+from checkpoint import Checkpoint
+from resilience import CircuitOpenError
+
+
+class FakeDriver:
+    quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Events:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, **fields):
+        self.events.append(dict(fields, event=event))
+
+    def named(self, event):
+        return [record for record in self.events if record["event"] == event]
+
+
+class FakeStore:
+    def has_applied(self, job_id):
+        return False
+
+    def applied_ids(self, job_ids):
+        return set()
+
+    def mark_retry(self, job_id, outcome):
+        pass
+
+    def clear_retry(self, job_id):
+        pass
+
+
+BATCH = {"searches": [{"keyword": "python", "location": "Jakarta", "easy_apply": True, "job_type": "remote"},
+                      {"keyword": "rust", "location": "Jakarta", "easy_apply": True, "job_type": "remote"}],
+         "apply": {}}
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    driver = FakeDriver()
+    monkeypatch.setattr(batch, "start_session", lambda *args, **kwargs: driver)
+    return driver
+
+
+def test_open_circuit_stops_the_batch(monkeypatch, driver, tmp_path):
+    searched = []
+
+    def stream_job_pages(driver, keyword, location, easy_apply, job_type, **kwargs):
+        searched.append(keyword)
+        raise CircuitOpenError("Session failed again after 3 restarts")
+        yield
+
+    monkeypatch.setattr(batch, "stream_job_pages", stream_job_pages)
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.start(BATCH)
+    results = Events()
+    batch.run_batch(BATCH, {}, FakeStore(), results, checkpoint)
+
+    assert searched == ["python"]
+    assert [record["message"] for record in results.named("error")] == ["Session failed again after 3 restarts"]
+    assert not checkpoint.state["finished"] and checkpoint.state["search"] == 0
+    assert driver.quit_called
+
+
+def test_max_applications_counts_applied_outcomes(monkeypatch, driver):
+    outcomes = ["failed", "applied", "needs_answers", "applied", "applied"]
+    pulled = []
+
+    def stream_job_pages(driver, keyword, location, easy_apply, job_type, **kwargs):
+        yield [{"Job ID": str(index), "Job Title": "Engineer", "Company": "Acme"} for index in range(5)]
+
+    def apply_jobs(driver, use_existing_resume, pdf_path, settings, store, search, decide, report, jobs, resumes):
+        for job in jobs:
+            pulled.append(job["Job ID"])
+            report(job, outcomes[len(pulled) - 1])
+        return []
+
+    monkeypatch.setattr(batch, "stream_job_pages", stream_job_pages)
+    monkeypatch.setattr(batch, "apply_jobs", apply_jobs)
+    results = Events()
+    spec = dict(BATCH, apply={"enabled": True, "max_applications": 2})
+    applied = batch.run_batch(spec, {}, FakeStore(), results)
+
+    assert applied == 2
+    assert pulled == ["0", "1", "2", "3"]
+    assert len(results.named("limit")) == 1
+
+
+def test_rejected_jobs_are_logged_and_exported(monkeypatch, driver):
+    import core
+    logged, exported = [], []
+
+    def stream_job_pages(driver, keyword, location, easy_apply, job_type, **kwargs):
+        yield [{"Job ID": "1", "Job Title": "Engineer", "Company": "Acme"},
+               {"Job ID": "2", "Job Title": "Intern", "Company": "Acme"}]
+
+    def apply_jobs(driver, use_existing_resume, pdf_path, settings, store, search, decide, report, jobs, resumes):
+        for job in jobs:
+            core.record_outcome(job, "applied", search)
+            report(job, "applied")
+        return []
+
+    monkeypatch.setattr(batch, "stream_job_pages", stream_job_pages)
+    monkeypatch.setattr(batch, "apply_jobs", apply_jobs)
+    monkeypatch.setattr(core, "log_job", lambda job, outcome, stage, search=None, started=None:
+                        logged.append((job["Job ID"], outcome, stage)))
+    monkeypatch.setattr(core, "export_outcome", lambda job, outcome, search=None:
+                        exported.append((job["Job ID"], outcome, search)))
+    spec = {"searches": BATCH["searches"][:1], "apply": {"enabled": True, "title_exclude": ["intern"]}}
+    batch.run_batch(spec, {}, FakeStore(), Events())
+
+    assert ("2", "skipped", "job_filter") in logged
+    assert ("2", "skipped", "python / Jakarta") in exported
+    assert ("1", "applied", "python / Jakarta") in exported
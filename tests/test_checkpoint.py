@@ -0,0 +1,97 @@
+import sys
+import json
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from checkpoint import Checkpoint, checkpointed, batch_fingerprint, LISTED
+
+BATCH = {"searches": [{"keywords": "python", "location": "Berlin"}, {"keywords": "rust", "location": "Remote"}]}
+
+
+# A result page as pagination yields it: a list of jobs with its start= offset
+class Page(list):
+    def __init__(self, start, ids):
+        super().__init__({"Job ID": job_id} for job_id in ids)
+        self.start = start
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "checkpoint.json")
+
+
+def test_round_trip(path):
+    checkpoint = Checkpoint(path)
+    checkpoint.start(BATCH)
+    checkpoint.begin_search(0, BATCH["searches"][0])
+    checkpoint.job_done("1", "applied")
+    checkpoint.search_done(0)
+    checkpoint.begin_search(1, BATCH["searches"][1])
+    checkpoint.at_page(25)
+    checkpoint.job_done("2", "skipped")
+
+    resumed = Checkpoint(path)
+    assert resumed.resume(BATCH)
+    assert resumed.state == checkpoint.state
+    assert resumed.completed(0) and not resumed.completed(1)
+    assert resumed.offset(1) == 25 and resumed.offset(0) == 0
+    assert resumed.processed("1") and resumed.processed(2) and not resumed.processed("3")
+    assert resumed.state["applied"] == 1
+
+
+def test_only_resumes_the_same_unfinished_batch(path):
+    checkpoint = Checkpoint(path)
+    checkpoint.start(BATCH)
+    assert not Checkpoint(path).resume({"searches": BATCH["searches"][:1]})
+    checkpoint.finish()
+    assert not Checkpoint(path).resume(BATCH)
+    assert batch_fingerprint(BATCH) == batch_fingerprint(json.loads(json.dumps(BATCH)))
+
+
+def test_unreadable_checkpoint_starts_over(path):
+    pathlib.Path(path).write_text('{"batch": ')
+    assert not Checkpoint(path).resume(BATCH)
+
+
+def test_stale_tmp_file_from_a_crash_is_ignored(path):
+    checkpoint = Checkpoint(path)
+    checkpoint.start(BATCH)
+    checkpoint.job_done("1", "applied")
+    # A crash during the next save leaves a truncated temporary file behind
+    pathlib.Path(f"{path}.tmp").write_text('{"batch": "trunc')
+
+    resumed = Checkpoint(path)
+    assert resumed.resume(BATCH)
+    assert resumed.processed("1")
+    resumed.job_done("2", "applied")
+    assert not pathlib.Path(f"{path}.tmp").exists()
+    assert json.loads(pathlib.Path(path).read_text())["processed"] == {"1": "applied", "2": "applied"}
+
+
+def test_resume_after_crash_mid_page(path):
+    checkpoint = Checkpoint(path)
+    checkpoint.start(BATCH)
+    checkpoint.begin_search(0, BATCH["searches"][0])
+    pages = checkpointed(iter([Page(0, ["1", "2"]), Page(25, ["3", "4", "5"])]), checkpoint)
+
+    # Search-only on the first page, then a crash after job 3 of the second
+    next(pages)
+    page = next(pages)
+    checkpoint.job_done(page[0]["Job ID"], "applied")
+    del pages
+
+    resumed = Checkpoint(path)
+    assert resumed.resume(BATCH)
+    assert resumed.state["processed"] == {"1": LISTED, "2": LISTED, "3": "applied"}
+    assert resumed.offset(0) == 25
+
+    # The restarted search begins at the saved page and only offers what is left
+    replay = checkpointed(iter([Page(25, ["3", "4", "5"]), Page(50, ["6"])]), resumed)
+    assert [job["Job ID"] for job in next(replay)] == ["4", "5"]
+    resumed.job_done("4", "needs_answers")
+    assert [job["Job ID"] for job in next(replay)] == ["6"]
+    assert resumed.state["processed"]["5"] == LISTED
+    assert resumed.state["processed"]["4"] == "needs_answers"
+    assert resumed.state["start"] == 50
@@ -0,0 +1,90 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import core
+from ratelimit import unlimited_limiter
+from resilience import CircuitOpenError
+
+
+class FakeStore:
+    def has_applied(self, job_id):
+        return False
+
+    def mark_retry(self, job_id, outcome):
+        pass
+
+    def clear_retry(self, job_id):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    limiter = unlimited_limiter()
+    monkeypatch.setattr(core, "default_limiter", lambda: limiter)
+    monkeypatch.setattr(core, "get_geo_ip", lambda location, default=None: "1")
+    monkeypatch.setattr(core, "export_searched", lambda jobs, search=None: None)
+    monkeypatch.setattr(core, "log_job", lambda *args: None)
+    monkeypatch.setattr(core, "export_outcome", lambda *args: None)
+    monkeypatch.setattr(core, "notify_error", lambda message: None)
+
+
+def circuit_open(*args, **kwargs):
+    raise CircuitOpenError("Session failed again after 3 restarts")
+    yield
+
+
+def test_search_reraises_open_circuit(monkeypatch):
+    errors = []
+    monkeypatch.setattr(core, "iter_pages", circuit_open)
+    with pytest.raises(CircuitOpenError):
+        list(core.stream_job_pages(object(), "python", "Jakarta", True, "remote", on_error=errors.append))
+    assert errors == []
+
+
+def test_apply_reraises_open_circuit():
+    with pytest.raises(CircuitOpenError):
+        core.apply_jobs(object(), True, None, {}, FakeStore(), decide=lambda job: True, jobs=circuit_open())
+
+
+def test_apply_opens_jobs_missing_from_the_page_on_their_own_page(monkeypatch):
+    opened, outcomes = [], []
+    monkeypatch.setattr(core, "find_job_card", lambda driver, job_id: None)
+    monkeypatch.setattr(core, "open_job_page", lambda driver, job_id: opened.append(job_id))
+    monkeypatch.setattr(core, "human_pause", lambda: None)
+    jobs = [{"Job ID": "5", "Job Title": "Engineer", "Company": "Acme"}]
+    core.apply_jobs(object(), True, None, {}, FakeStore(), decide=lambda job: False,
+                    report=lambda job, outcome: outcomes.append(outcome), jobs=jobs)
+    assert opened == ["5"] and outcomes == ["skipped"]
+
+
+class SessionDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.mark.parametrize("logged_in", [True, False])
+def test_start_session_checks_the_login(monkeypatch, logged_in):
+    drivers = []
+    asked = []
+    monkeypatch.setattr(core, "setup_driver", lambda *args: drivers.append(SessionDriver()) or drivers[-1])
+    monkeypatch.setattr(core, "restore_session", lambda driver, cookie_file: False)
+    monkeypatch.setattr(core, "login_and_save", lambda driver, username, password, login, cookie_file: logged_in)
+
+    def credentials():
+        asked.append(True)
+        return "me@example.com", "secret"
+
+    if logged_in:
+        driver = core.start_session(None, None, credentials=credentials)
+        assert driver._driver is drivers[0] and not drivers[0].quit_called
+    else:
+        with pytest.raises(core.LoginError):
+            core.start_session(None, None, credentials=credentials)
+        assert drivers[0].quit_called
+    assert asked == [True]
@@ -0,0 +1,140 @@
+import sys
+import json
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import easy_apply
+from easy_apply import (EasyApplyForm, AnswerCache, normalize_label, READ_STEP_JS, FILL_FIELDS_JS, CLICK_JS,
+                        DISCARD_JS, SUBMITTED, UNCONFIRMED, NEEDS_ANSWERS, STUCK, NO_FORM)
+
+
+def step(fields=(), submit=None, review=None, next=None, progress="0", errors=(), done=False):
+    return {"fields": list(fields), "submit": submit, "review": review, "next": next, "progress": progress,
+            "heading": "Contact info", "errors": list(errors), "done": done}
+
+
+def field(index, label, required=True, filled=False, kind="text"):
+    return {"index": index, "kind": kind, "label": label, "required": required, "filled": filled, "options": []}
+
+
+# Plays a scripted modal: each click on a button moves to the next step,
+# None meaning the modal is gone
+class FakeDriver:
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.current = 0
+        self.clicks = []
+        self.filled = {}
+        self.discarded = 0
+
+    def execute_script(self, script, *args):
+        if script == READ_STEP_JS:
+            return self.steps[self.current] if self.current < len(self.steps) else None
+        if script == FILL_FIELDS_JS:
+            self.filled.update(args[0])
+            return list(args[0])
+        if script == CLICK_JS:
+            self.clicks.append(args[0])
+            if args[0] != ".artdeco-modal__dismiss":
+                self.current += 1
+            return True
+        if script == DISCARD_JS:
+            self.discarded += 1
+            return True
+
+
+class NoLimit:
+    def acquire(self, action):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_limits(monkeypatch):
+    monkeypatch.setattr(easy_apply, "default_limiter", lambda: NoLimit())
+    monkeypatch.setattr(easy_apply.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def answers(tmp_path):
+    cache = AnswerCache(str(tmp_path / "answers.json"))
+    cache.set("Years of experience with Python?", "5")
+    return cache
+
+
+def run(steps, answers):
+    driver = FakeDriver(steps)
+    form = EasyApplyForm(driver, answers, resumes=object(), step_timeout=0.5)
+    return form.run(), form, driver
+
+
+def test_no_modal_is_no_form(answers):
+    outcome, form, driver = run([], answers)
+    assert outcome == NO_FORM
+    assert driver.clicks == []
+
+
+def test_submitted_only_after_confirmation(answers):
+    steps = [step([field(0, "Years of experience with Python? *")], next="next", progress="50"),
+             step(submit="submit", progress="100"),
+             step(done=True, progress="100")]
+    outcome, form, driver = run(steps, answers)
+    assert outcome == SUBMITTED
+    assert driver.filled == {"0": "5"}
+    assert driver.clicks == ["next", "submit", ".artdeco-modal__dismiss"]
+
+
+def test_modal_closing_after_submit_is_unconfirmed(answers):
+    outcome, form, driver = run([step(submit="submit")], answers)
+    assert outcome == UNCONFIRMED
+    assert driver.clicks == ["submit"]
+
+
+def test_submit_without_progress_is_unconfirmed(answers):
+    steps = [step(submit="submit"), step(submit="submit", progress="1")]
+    outcome, form, driver = run(steps, answers)
+    assert outcome == UNCONFIRMED
+
+
+def test_unknown_required_question_needs_answers(answers):
+    outcome, form, driver = run([step([field(0, "Are you authorized to work? *")], next="next")], answers)
+    assert outcome == NEEDS_ANSWERS
+    assert form.missing == ["Are you authorized to work? *"]
+    assert driver.clicks == []
+    assert driver.discarded == 2
+    saved = json.loads(pathlib.Path(answers.path).read_text())
+    assert saved["are you authorized to work"] is None
+
+
+def test_step_without_buttons_is_stuck(answers):
+    outcome, form, driver = run([step()], answers)
+    assert outcome == STUCK
+    assert driver.discarded == 2
+
+
+def test_validation_errors_are_stuck(answers):
+    steps = [step([field(0, "Phone", filled=True)], next="next"),
+             step([field(0, "Phone")], next="next", progress="1", errors=["Enter a valid phone number"])]
+    outcome, form, driver = run(steps, answers)
+    assert outcome == STUCK
+    assert form.missing == ["Phone"]
+
+
+def test_normalize_label():
+    assert normalize_label("Years of experience with Python? *") == "years of experience with python"
+    assert normalize_label("Phone (required)\nEnter your number") == "phone"
+    assert normalize_label(None) == ""
+
+
+def test_answer_cache_normalizes_and_keeps_answers(tmp_path):
+    path = tmp_path / "answers.json"
+    cache = AnswerCache(str(path))
+    cache.set("Years of experience with Python? *", "5")
+    assert cache.get("years of experience  with python") == "5"
+    cache.add_unknown("YEARS OF EXPERIENCE WITH PYTHON")
+    cache.add_unknown("Notice period?")
+    cache.save()
+    assert json.loads(path.read_text()) == {"notice period": None, "years of experience with python": "5"}
+    assert AnswerCache(str(path)).get("Notice period *") is None
+    assert AnswerCache(str(path)).get("Years of experience with Python") == "5"
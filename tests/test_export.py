@@ -0,0 +1,124 @@
+import sys
+import pathlib
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import export
+import analytics
+from export import ResultExporter, export_row, new_run_id, SEARCHED, OUTCOME
+
+pd = pytest.importorskip("pandas")
+
+
+def job(job_id, title="Engineer", company="Acme"):
+    return {"Job ID": job_id, "Job Title": title, "Company": company, "Location": "Berlin", "Easy Apply": True}
+
+
+@pytest.fixture
+def csv_only(monkeypatch):
+    monkeypatch.setattr(export, "parquet_available", lambda: False)
+
+
+def parts(directory):
+    return sorted(str(path.relative_to(directory)) for path in pathlib.Path(directory).rglob("part-*"))
+
+
+def test_run_ids_are_unique_within_a_second():
+    ids = {new_run_id("a-") for _ in range(50)}
+    assert len(ids) > 1
+    assert all(analytics.PARTITION.search(f"date=2026-10-18/run={run}/part-00000.csv") for run in ids)
+
+
+def test_falls_back_to_csv_without_pyarrow(tmp_path, csv_only):
+    exporter = ResultExporter(str(tmp_path), "parquet", batch_size=2, run="r1")
+    assert exporter.format == "csv"
+    exporter.searched([job("1"), job("2"), job("3")], "python / Berlin")
+    day = datetime.now().strftime("%Y-%m-%d")
+    assert parts(tmp_path) == [f"date={day}/run=r1/part-00000.csv"]
+    exporter.outcome(job("1"), "applied", "python / Berlin")
+    exporter.close()
+    assert parts(tmp_path) == [f"date={day}/run=r1/part-00000.csv", f"date={day}/run=r1/part-00001.csv"]
+    assert exporter.rows == 4
+
+    frame = analytics.load_results(str(tmp_path))
+    assert list(frame["job_id"]) == ["1", "2", "3", "1"]
+    assert set(frame["run"]) == {"r1"}
+    assert list(frame["keyword"].astype(str)) == ["python"] * 4
+
+
+def test_run_crossing_midnight_writes_both_days(tmp_path, csv_only):
+    exporter = ResultExporter(str(tmp_path), "csv", run="r1")
+    exporter._add([export_row(SEARCHED, job("1"), run="r1", at=datetime(2026, 10, 17, 23, 59)),
+                   export_row(SEARCHED, job("2"), run="r1", at=datetime(2026, 10, 18, 0, 1))])
+    exporter.new_run("r2")
+    exporter.outcome(job("2"), "applied")
+    exporter.close()
+    day = datetime.now().strftime("%Y-%m-%d")
+    assert parts(tmp_path) == sorted(["date=2026-10-17/run=r1/part-00000.csv", "date=2026-10-18/run=r1/part-00000.csv",
+                                      f"date={day}/run=r2/part-00000.csv"])
+    assert list(analytics.load_results(str(tmp_path), until="2026-10-17")["job_id"]) == ["1"]
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    exporter = ResultExporter(str(tmp_path), "parquet", run="r1")
+    exporter.searched([job("1"), job("2")], "python / Berlin")
+    exporter.close()
+    assert all(path.endswith(".parquet") for path in parts(tmp_path))
+    assert list(analytics.load_results(str(tmp_path))["job_id"]) == ["1", "2"]
+
+
+def frame_of(rows):
+    frame = pd.DataFrame(rows, columns=["time", "event", "keyword", "job_id", "title", "company", "outcome", "run"])
+    return frame.fillna("")
+
+
+def searched(time, keyword, job_id, title="Engineer", company="Acme", run="r1"):
+    return [time, SEARCHED, keyword, job_id, title, company, None, run]
+
+
+def outcome(keyword, job_id, result, company="Acme", run="r1"):
+    return ["2026-10-18T10:00:00", OUTCOME, keyword, job_id, "Engineer", company, result, run]
+
+
+def test_keyword_hit_rates():
+    frame = frame_of([
+        searched("2026-10-18T09:00:00", "python", "1"),
+        searched("2026-10-18T09:00:00", "python", "2"),
+        searched("2026-10-19T09:00:00", "python", "1", run="r2"),
+        searched("2026-10-18T09:00:00", "rust", "3"),
+        outcome("python", "1", "applied"),
+        outcome("python", "2", "needs_answers"),
+    ])
+    report = analytics.keyword_hit_rates(frame)
+    assert list(report.index) == ["python", "rust"]
+    assert report.loc["python"].to_dict() == {"runs": 2, "results": 3, "unique_jobs": 2, "applied": 1, "hit_rate": 0.5}
+    assert report.loc["rust", "applied"] == 0 and report.loc["rust", "hit_rate"] == 0
+
+
+def test_company_success_counts_attempts_only():
+    frame = frame_of([
+        outcome("python", "1", "applied"),
+        outcome("python", "2", "failed"),
+        outcome("python", "3", "skipped"),
+        outcome("python", "4", "applied", company="Globex"),
+    ])
+    report = analytics.company_success(frame)
+    assert report.loc["Acme"].to_dict() == {"attempts": 2, "applied": 1, "success_rate": 0.5}
+    assert report.loc["Globex", "success_rate"] == 1.0
+    assert list(analytics.company_success(frame, min_attempts=2).index) == ["Acme"]
+
+
+def test_duplicate_postings_ignore_case_and_spacing():
+    frame = frame_of([
+        searched("2026-10-18T09:00:00", "python", "1", title="Data  Engineer", company="Acme"),
+        searched("2026-10-19T09:00:00", "python", "2", title="data engineer", company="ACME"),
+        searched("2026-10-19T09:00:00", "python", "2", title="data engineer", company="ACME"),
+        searched("2026-10-19T09:00:00", "python", "3", title="Data Engineer", company="Globex"),
+    ])
+    report = analytics.duplicate_postings(frame)
+    assert len(report) == 1
+    row = report.iloc[0]
+    assert (row["postings"], row["first_seen"], row["last_seen"]) == (2, "2026-10-18T09:00:00", "2026-10-19T09:00:00")
@@ -0,0 +1,68 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from filters import JobFilter
+from store import AppliedJobsStore
+
+pytest.importorskip("pandas")
+
+JOBS = [
+    {"Job ID": "1", "Job Title": "Senior Software Engineer", "Company": "Acme", "Location": "Remote"},
+    {"Job ID": "2", "Job Title": "Data Analyst Intern", "Company": "Globex", "Location": "Jakarta"},
+    {"Job ID": "3", "Job Title": "Security Engineer", "Company": " GLOBEX ", "Location": "Berlin"},
+    {"Job ID": "4", "Job Title": "Junior Python Developer", "Company": "Initech", "Location": "Remote"},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AppliedJobsStore(str(tmp_path / "applied_jobs.db"))
+    yield store
+    store.close()
+
+
+def ids(jobs):
+    return [job["Job ID"] for job in jobs]
+
+
+def test_no_rules_keeps_everything():
+    assert ids(JobFilter().filter(JOBS)) == ["1", "2", "3", "4"]
+    assert JobFilter().filter([]) == []
+
+
+def test_title_include_and_exclude():
+    job_filter = JobFilter({"title_include": ["engineer", "developer"], "title_exclude": ["senior|principal"]})
+    assert ids(job_filter.filter(JOBS)) == ["3", "4"]
+    assert ids(JobFilter({"title_include": ["ANALYST"]}).filter(JOBS)) == ["2"]
+
+
+def test_company_blacklist_ignores_case_and_spaces():
+    rejected = []
+    kept = JobFilter({"company_exclude": ["globex"]}).filter(JOBS, on_reject=rejected.append)
+    assert ids(kept) == ["1", "4"]
+    assert ids(rejected) == ["2", "3"]
+
+
+def test_scores_and_min_score():
+    rules = {"seniority_weights": {"senior": -2, "junior": 1}, "location_weights": {"remote": 2},
+             "keyword_weights": {"security|python": 1}, "min_score": 1}
+    kept = JobFilter(rules).filter(JOBS)
+    assert {job["Job ID"]: job["Score"] for job in kept} == {"3": 1.0, "4": 4.0}
+
+
+def test_applied_jobs_are_dropped(store):
+    store.record(JOBS[0])
+    store.record(JOBS[2], status="failed")
+    kept = JobFilter({}, store).filter(JOBS)
+    assert ids(kept) == ["2", "4"]
+    # exclude_applied false keeps them
+    assert ids(JobFilter({"exclude_applied": False}, store).filter(JOBS)) == ["1", "2", "3", "4"]
+
+
+def test_filter_pages_streams_page_by_page(store):
+    store.record(JOBS[1])
+    pages = iter([JOBS[:2], JOBS[2:]])
+    assert ids(JobFilter({"title_exclude": ["security"]}, store).filter_pages(pages)) == ["1", "4"]
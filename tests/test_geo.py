@@ -0,0 +1,103 @@
+import sys
+import json
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import geo
+from geo import GeoResolver, WORLDWIDE
+
+TABLE = {"united states": "103644278", "united kingdom": "101165590", "germany": "101282230",
+         "worldwide": WORLDWIDE}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+# External lookup that counts its calls
+class External:
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def __call__(self, name):
+        self.calls.append(name)
+        if isinstance(self.answers, Exception):
+            raise self.answers
+        return self.answers.get(name)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "geo_cache.json")
+
+
+def test_exact_and_alias_lookup():
+    resolver = GeoResolver(TABLE, cache_path=None)
+    assert resolver.resolve("Germany") == "101282230"
+    assert resolver.resolve("USA") == "103644278"
+    assert resolver.resolve("UK") == "101165590"
+    assert resolver.resolve("Remote") == WORLDWIDE
+
+
+def test_fuzzy_match_respects_cutoff():
+    resolver = GeoResolver(TABLE, cache_path=None)
+    assert resolver.resolve("Germnay") == "101282230"
+    assert resolver.resolve("Gerald") == WORLDWIDE
+    assert resolver.resolve("Gerald", default="fallback") == "fallback"
+
+
+def test_offline_falls_back_to_default(cache_path):
+    resolver = GeoResolver(TABLE, external=None, cache_path=cache_path)
+    assert resolver.resolve("Berlin") == WORLDWIDE
+    assert resolver.resolve("", default="x") == "x"
+    assert not pathlib.Path(cache_path).exists()
+
+
+def test_external_results_are_cached_on_disk(cache_path, clock):
+    external = External({"berlin": "101282230"})
+    resolver = GeoResolver(TABLE, external, cache_path, ttl=60, clock=clock)
+    assert resolver.resolve("Berlin") == "101282230"
+    assert resolver.resolve("Berlin") == "101282230"
+    assert external.calls == ["berlin"]
+    assert json.loads(pathlib.Path(cache_path).read_text())["berlin"]["geo_id"] == "101282230"
+
+    # A fresh resolver reads the disk cache instead of calling out again
+    again = GeoResolver(TABLE, External({}), cache_path, ttl=60, clock=clock)
+    assert again.resolve("Berlin") == "101282230"
+    assert again.external.calls == []
+
+
+def test_disk_cache_entries_expire(cache_path, clock):
+    GeoResolver(TABLE, External({"berlin": "1"}), cache_path, ttl=60, clock=clock).resolve("Berlin")
+    clock.now += 61
+    external = External({"berlin": "2"})
+    assert GeoResolver(TABLE, external, cache_path, ttl=60, clock=clock).resolve("Berlin") == "2"
+    assert external.calls == ["berlin"]
+
+
+def test_external_errors_fall_back_to_default(cache_path, clock):
+    resolver = GeoResolver(TABLE, External(OSError("offline")), cache_path, clock=clock)
+    assert resolver.resolve("Berlin", default="fallback") == "fallback"
+    assert not pathlib.Path(cache_path).exists()
+
+
+def test_configure_resolver_replaces_default(monkeypatch, cache_path):
+    monkeypatch.setattr(geo, "_default_resolver", None)
+    monkeypatch.setattr(geo, "load_geo_table", lambda: dict(TABLE))
+    online = geo.default_resolver()
+    assert online.external is not None
+    offline = geo.configure_resolver(offline=True, cache_path=cache_path)
+    assert offline is geo.default_resolver() and offline is not online
+    assert offline.external is None and offline.cache_path == cache_path
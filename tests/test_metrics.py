@@ -0,0 +1,42 @@
+import sys
+import json
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.close_span_log()
+    metrics.reset()
+
+
+def test_annotate_adds_fields_to_span_record(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    metrics.open_span_log(str(path))
+
+    @metrics.timed("easy_apply")
+    def run():
+        metrics.annotate(steps=4)
+
+    run()
+    metrics.close_span_log()
+    record = json.loads(path.read_text().splitlines()[-1])
+    assert record["stage"] == "easy_apply" and record["steps"] == 4
+    assert [row["stage"] for row in metrics.summary_rows()] == ["easy_apply"]
+
+
+def test_durations_are_bounded_but_totals_exact():
+    count = metrics.RESERVOIR_SIZE * 3
+    for index in range(count):
+        metrics.record("human_pause", 0.5)
+    row = metrics.summary_rows()[0]
+    assert len(metrics._stats["human_pause"]["samples"]) == metrics.RESERVOIR_SIZE
+    assert row["count"] == count
+    assert row["total"] == pytest.approx(0.5 * count)
+    assert row["mean"] == pytest.approx(0.5) and row["p95"] == 0.5
@@ -0,0 +1,215 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import pagination
+from store import AppliedJobsStore
+
+TOTAL = 60
+
+
+# Stand-in for the browser: load_page records the start= offset and
+# extract_job_cards returns that page's records
+@pytest.fixture
+def pages(monkeypatch):
+    state = {"start": 0, "loads": []}
+
+    def load_page(driver, url):
+        query = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+        state["start"] = int(query.get("start", 0))
+        state["loads"].append(state["start"])
+
+    def extract_job_cards(driver):
+        start = min(state["start"], (TOTAL - 1) // pagination.PAGE_SIZE * pagination.PAGE_SIZE)
+        return [{"Job ID": str(index), "Job Title": f"Engineer {index}", "Company": "Acme"}
+                for index in range(start, min(start + pagination.PAGE_SIZE, TOTAL))]
+
+    monkeypatch.setattr(pagination, "load_page", load_page)
+    monkeypatch.setattr(pagination, "extract_job_cards", extract_job_cards)
+    monkeypatch.setattr(pagination, "wait_for_job_cards", lambda driver: None)
+    monkeypatch.setattr(pagination, "human_pause", lambda: None)
+    monkeypatch.setattr(pagination, "record", lambda *args: None)
+    return state
+
+
+URL = "https://www.linkedin.com/jobs/search/?keywords=python&geoId=1"
+
+
+def all_jobs(driver=None, **kwargs):
+    kwargs.setdefault("extract", pagination.extract_job_cards)
+    return [job for page in pagination.iter_pages(driver or object(), URL, **kwargs) for job in page]
+
+
+def test_walks_every_page(pages):
+    jobs = all_jobs()
+    assert [job["Job ID"] for job in jobs] == [str(index) for index in range(TOTAL)]
+    assert pages["loads"] == [0, 25, 50, 75]
+
+
+def test_stops_at_first_seen_job(pages):
+    asked = []
+
+    def seen(job_ids):
+        asked.append(list(job_ids))
+        return {"30", "40"}
+
+    jobs = all_jobs(seen=seen)
+    assert [job["Job ID"] for job in jobs] == [str(index) for index in range(30)]
+    assert asked[0] == [str(index) for index in range(25)]
+    assert pages["loads"] == [0, 25]
+
+
+def test_seen_job_on_first_card_yields_nothing(pages):
+    assert all_jobs(seen=lambda job_ids: {"0"}) == []
+    assert pages["loads"] == [0]
+
+
+# Two-tab browser for prefetching: each tab keeps its own URL
+class TabsDriver:
+    def __init__(self, challenge_at=None):
+        self.urls = {"tab0": "about:blank"}
+        self.current_window_handle = "tab0"
+        self.challenge_at = challenge_at
+        self.switch_to = self
+
+    def new_window(self, kind):
+        self.current_window_handle = f"tab{len(self.urls)}"
+        self.urls[self.current_window_handle] = "about:blank"
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        pass
+
+    def navigate(self, url):
+        if self.challenge_at is not None and f"start={self.challenge_at}" in url:
+            url, self.challenge_at = "https://www.linkedin.com/checkpoint/challenge/x", None
+        self.urls[self.current_window_handle] = url
+
+    def execute_script(self, script, *args):
+        if "location.href" in script:
+            self.navigate(args[0])
+        return "complete"
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.acquired = []
+        self.throttles = []
+
+    def acquire(self, action):
+        self.acquired.append(action)
+        return 0.0
+
+    def throttled(self, reason=None):
+        self.throttles.append(reason)
+
+
+@pytest.fixture
+def tabs(monkeypatch):
+    state = {"loads": []}
+    limiter = RecordingLimiter()
+
+    def load_page(driver, url):
+        state["loads"].append(url)
+        driver.navigate(url)
+
+    def extract_job_cards(driver):
+        query = dict(part.split("=", 1) for part in driver.current_url.split("?", 1)[1].split("&"))
+        start = min(int(query.get("start", 0)), (TOTAL - 1) // pagination.PAGE_SIZE * pagination.PAGE_SIZE)
+        return [{"Job ID": str(index)} for index in range(start, min(start + pagination.PAGE_SIZE, TOTAL))]
+
+    monkeypatch.setattr(pagination, "load_page", load_page)
+    monkeypatch.setattr(pagination, "extract_job_cards", extract_job_cards)
+    monkeypatch.setattr(pagination, "wait_for_job_cards", lambda driver: None)
+    monkeypatch.setattr(pagination, "human_pause", lambda: None)
+    monkeypatch.setattr(pagination, "record", lambda *args: None)
+    monkeypatch.setattr(pagination, "default_limiter", lambda: limiter)
+    state["limiter"] = limiter
+    return state
+
+
+def test_prefetch_counts_against_page_budget(tabs):
+    jobs = all_jobs(TabsDriver(), prefetch=True)
+    assert [job["Job ID"] for job in jobs] == [str(index) for index in range(TOTAL)]
+    assert len(tabs["loads"]) == 1
+    assert tabs["limiter"].acquired == [pagination.PAGE_LOAD] * 4
+
+
+def test_prefetched_challenge_page_throttles_and_reloads(tabs):
+    jobs = all_jobs(TabsDriver(challenge_at=25), prefetch=True)
+    assert [job["Job ID"] for job in jobs] == [str(index) for index in range(TOTAL)]
+    assert len(tabs["limiter"].throttles) == 1
+    assert [url.endswith("start=25") for url in tabs["loads"]] == [False, True]
+
+
+# Result pages given as lists of job ids, one list per start= offset
+@pytest.fixture
+def listing(monkeypatch):
+    state = {"pages": [], "start": 0, "loads": []}
+
+    def load_page(driver, url):
+        query = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+        state["start"] = int(query.get("start", 0))
+        state["loads"].append(state["start"])
+
+    def extract_job_cards(driver):
+        index = state["start"] // pagination.PAGE_SIZE
+        ids = state["pages"][index] if index < len(state["pages"]) else []
+        return [{"Job ID": job_id, "Job Title": "Engineer", "Company": "Acme"} for job_id in ids]
+
+    monkeypatch.setattr(pagination, "load_page", load_page)
+    monkeypatch.setattr(pagination, "extract_job_cards", extract_job_cards)
+    monkeypatch.setattr(pagination, "wait_for_job_cards", lambda driver: None)
+    monkeypatch.setattr(pagination, "human_pause", lambda: None)
+    monkeypatch.setattr(pagination, "record", lambda *args: None)
+    return state
+
+
+KEY = "keywords=python&geoId=1&f_WT=2&f_AL=true"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AppliedJobsStore(str(tmp_path / "applied_jobs.db"))
+    store.mark_seen(KEY, ["A", "B", "C"])
+    store.mark_retry("B", "needs_answers")
+    yield store
+    store.close()
+
+
+def walk(store):
+    pages = pagination.iter_pages(object(), URL, seen=lambda job_ids: store.seen_ids(KEY, job_ids),
+                                  pending=store.retry_ids(KEY), extract=pagination.extract_job_cards)
+    return [[job["Job ID"] for job in page] for page in pages]
+
+
+def test_retry_job_listed_after_a_seen_job_is_reached(listing, store):
+    listing["pages"] = [["D", "A", "B", "C"], ["E"]]
+    assert walk(store) == [["D", "B"]]
+    assert listing["loads"] == [0]
+
+
+def test_pages_past_seen_jobs_until_retry_job_is_listed(listing, store):
+    listing["pages"] = [["D", "A"], ["C", "B"], ["E"]]
+    assert walk(store) == [["D"], ["B"]]
+    assert listing["loads"] == [0, 25]
+
+
+def test_without_retries_stops_at_first_seen_job(listing, store):
+    store.clear_retry("B")
+    listing["pages"] = [["D", "A", "B", "C"], ["E"]]
+    assert walk(store) == [["D"]]
+
+
+def test_extract_strategy_is_pluggable(listing):
+    listing["pages"] = [["A", "B"]]
+    pages = pagination.iter_pages(object(), URL, extract=lambda driver: [{"Job ID": "X"}])
+    assert [[job["Job ID"] for job in page] for page in pages] == [["X"]]
@@ -0,0 +1,92 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from ratelimit import RateLimiter, TokenBucket, PAGE_LOAD, CLICK, APPLY_SUBMIT, SEARCH, MIN_FACTOR
+
+
+# Clock that only moves when something sleeps on it
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def limiter(clock, per_minute=60, burst=2, recovery_seconds=300):
+    budgets = {PAGE_LOAD: {"per_minute": per_minute, "burst": burst}, CLICK: None, APPLY_SUBMIT: None, SEARCH: None}
+    return RateLimiter(budgets, clock=clock, sleep=clock.sleep, recovery_seconds=recovery_seconds)
+
+
+def test_burst_then_steady_rate(clock):
+    pages = limiter(clock)
+    delays = [pages.acquire(PAGE_LOAD) for _ in range(5)]
+    assert delays == [0.0, 0.0, pytest.approx(1.0), pytest.approx(1.0), pytest.approx(1.0)]
+    assert clock.now == pytest.approx(3.0)
+
+
+def test_idle_time_refills_up_to_burst(clock):
+    bucket = TokenBucket(60, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+
+def test_reservations_queue_callers_in_order(clock):
+    pages = limiter(clock, burst=1)
+    assert [pages.reserve(PAGE_LOAD) for _ in range(4)] == [0.0, pytest.approx(1.0), pytest.approx(2.0),
+                                                            pytest.approx(3.0)]
+
+
+def test_unlimited_actions_never_wait(clock):
+    pages = limiter(clock)
+    assert [pages.acquire(CLICK) for _ in range(100)] == [0.0] * 100
+    assert clock.sleeps == []
+
+
+def test_throttling_halves_rate_and_drops_burst(clock):
+    pages = limiter(clock)
+    pages.throttled("429")
+    assert pages.factor == 0.5
+    assert pages.acquire(PAGE_LOAD) == pytest.approx(2.0)
+    assert pages.acquire(PAGE_LOAD) == pytest.approx(2.0)
+
+
+def test_throttling_bottoms_out(clock):
+    pages = limiter(clock)
+    for _ in range(10):
+        pages.throttled()
+    assert pages.factor == MIN_FACTOR
+    assert pages.throttle_count == 10
+
+
+def test_calm_periods_restore_rate_stepwise(clock):
+    pages = limiter(clock, recovery_seconds=300)
+    pages.throttled()
+    pages.throttled()
+    assert pages.factor == 0.25
+    clock.now += 299
+    pages.reserve(PAGE_LOAD)
+    assert pages.factor == 0.25
+    clock.now += 1
+    pages.reserve(PAGE_LOAD)
+    assert pages.factor == 0.5
+    clock.now += 300
+    pages.reserve(PAGE_LOAD)
+    clock.now += 300
+    pages.reserve(PAGE_LOAD)
+    assert pages.factor == 1.0
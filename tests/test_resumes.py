@@ -0,0 +1,110 @@
+import sys
+import json
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import resumes
+from resumes import ResumeManager, ResumeError, LIST_DOCUMENTS_JS, SELECT_DOCUMENT_JS
+
+
+# Documents LinkedIn holds for the account; an upload adds one and selects it
+class FakeDriver:
+    def __init__(self, docs):
+        self.docs = [dict(doc, selected=False) for doc in docs]
+        self.sent = []
+
+    def execute_script(self, script, *args):
+        if script == LIST_DOCUMENTS_JS:
+            return [dict(doc, index=index) for index, doc in enumerate(self.docs)]
+        if script == SELECT_DOCUMENT_JS:
+            for index, doc in enumerate(self.docs):
+                doc["selected"] = index == args[0]
+            return True
+
+    def find_element(self, by, selector):
+        return self
+
+    def send_keys(self, path):
+        self.sent.append(path)
+        for doc in self.docs:
+            doc["selected"] = False
+        self.docs.append({"id": f"urn:li:document:{len(self.docs)}", "name": pathlib.Path(path).name,
+                          "selected": True})
+
+
+@pytest.fixture
+def resume_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(resumes, "count_pages", lambda path, data: 1)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF-1.4\n% resume\n%%EOF\n")
+    return str(path)
+
+
+def test_same_name_document_is_not_reused(resume_file, tmp_path):
+    manager = ResumeManager(resume_file, documents_file=str(tmp_path / "documents.json"))
+    driver = FakeDriver([{"id": "urn:li:document:0", "name": "resume.pdf"}])
+    assert manager.attach(driver, manager.default, "input") == "uploaded"
+    assert driver.sent == [resume_file]
+
+
+def test_uploaded_document_is_reused_across_runs(resume_file, tmp_path):
+    documents = str(tmp_path / "documents.json")
+    driver = FakeDriver([{"id": "urn:li:document:0", "name": "resume.pdf"}])
+    first = ResumeManager(resume_file, documents_file=documents)
+    assert first.attach(driver, first.default, "input") == "uploaded"
+    assert first.attach(driver, first.default, "input") == "selected"
+    assert json.load(open(documents)) == {first.default.sha256: ["urn:li:document:1"]}
+
+    driver.execute_script(SELECT_DOCUMENT_JS, 0)
+    second = ResumeManager(resume_file, documents_file=documents)
+    assert second.attach(driver, second.default, "input") == "picked"
+    assert driver.docs[1]["selected"] and len(driver.sent) == 1
+
+
+def test_name_shared_by_several_documents_is_ambiguous(resume_file):
+    manager = ResumeManager(resume_file)
+    manager._remember(manager.default, "name:resume.pdf")
+    driver = FakeDriver([{"name": "resume.pdf"}, {"name": "resume.pdf"}])
+    assert manager.attach(driver, manager.default, "input") == "uploaded"
+
+
+def test_empty_path_is_not_a_resume():
+    with pytest.raises(ResumeError):
+        resumes.validate_resume("")
+
+
+# The uploaded document's card only renders after a few polls
+class SlowDriver(FakeDriver):
+    def __init__(self, docs, polls=3):
+        super().__init__(docs)
+        self.hidden_polls = 0
+        self.polls = polls
+
+    def send_keys(self, path):
+        super().send_keys(path)
+        self.hidden_polls = self.polls
+
+    def execute_script(self, script, *args):
+        if script == LIST_DOCUMENTS_JS and self.hidden_polls:
+            self.hidden_polls -= 1
+            return [dict(doc, index=index) for index, doc in enumerate(self.docs[:-1])]
+        return super().execute_script(script, *args)
+
+
+def test_upload_is_recorded_once_its_card_renders(resume_file, tmp_path):
+    documents = str(tmp_path / "documents.json")
+    driver = SlowDriver([{"id": "urn:li:document:0", "name": "resume.pdf"}])
+    manager = ResumeManager(resume_file, documents_file=documents)
+    assert manager.attach(driver, manager.default, "input") == "uploaded"
+    assert driver.hidden_polls == 0
+    assert json.load(open(documents)) == {manager.default.sha256: ["urn:li:document:1"]}
+
+
+def test_upload_without_a_new_card_is_not_recorded(resume_file, tmp_path):
+    documents = str(tmp_path / "documents.json")
+    driver = SlowDriver([], polls=1000)
+    manager = ResumeManager(resume_file, documents_file=documents, upload_timeout=0.5)
+    assert manager.attach(driver, manager.default, "input") == "uploaded"
+    assert not pathlib.Path(documents).exists()
@@ -0,0 +1,22 @@
+import os
+import sys
+import json
+import stat
+import pathlib
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import session
+
+
+class FakeDriver:
+    def get_cookies(self):
+        return [{"name": "li_at", "value": "secret"}]
+
+
+def test_save_cookies_is_owner_only(tmp_path):
+    path = tmp_path / "cookies.json"
+    path.write_text("[]")
+    path.chmod(0o644)
+    session.save_cookies(FakeDriver(), str(path))
+    assert json.loads(path.read_text()) == [{"name": "li_at", "value": "secret"}]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
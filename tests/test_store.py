@@ -0,0 +1,87 @@
+import sys
+import pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import core
+from store import AppliedJobsStore
+
+KEY = "keywords=python&geoId=1&f_WT=2&f_AL=true"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AppliedJobsStore(str(tmp_path / "applied_jobs.db"))
+    yield store
+    store.close()
+
+
+def test_jobs_waiting_for_retry_are_not_seen(store):
+    store.mark_seen(KEY, ["1", "2", "3"], seen_at="2026-10-01T09:00:00")
+    store.mark_retry("2", "needs_answers")
+    assert store.seen_ids(KEY, ["1", "2", "3", "4"]) == {"1", "3"}
+    store.clear_retry("2")
+    assert store.seen_ids(KEY, ["1", "2", "3", "4"]) == {"1", "2", "3"}
+
+
+def test_oldest_retry_is_when_the_search_first_listed_it(store):
+    store.mark_seen(KEY, ["1"], seen_at="2026-10-01T09:00:00")
+    store.mark_seen(KEY, ["2"], seen_at="2026-10-05T09:00:00")
+    store.mark_seen("other", ["1"], seen_at="2026-09-01T09:00:00")
+    assert store.oldest_retry(KEY) is None
+    store.mark_retry("2", "failed")
+    assert store.oldest_retry(KEY) == "2026-10-05T09:00:00"
+    store.mark_retry("1", "error")
+    assert store.oldest_retry(KEY) == "2026-10-01T09:00:00"
+
+
+@pytest.mark.parametrize("outcome, retried", [
+    ("needs_answers", True), ("failed", True), ("error", True),
+    ("applied", False), ("unconfirmed", False), ("skipped", False), ("already_applied", False),
+])
+def test_record_outcome_tracks_retryable_jobs(monkeypatch, store, outcome, retried):
+    monkeypatch.setattr(core, "log_job", lambda *args: None)
+    monkeypatch.setattr(core, "export_outcome", lambda *args: None)
+    store.mark_seen(KEY, ["7"])
+    store.mark_retry("7", "failed")
+    core.record_outcome({"Job ID": "7"}, outcome, "python / Jakarta", store=store)
+    assert (store.seen_ids(KEY, ["7"]) == set()) == retried
+
+
+def test_retry_ids_are_the_search_s_pending_jobs(store):
+    store.mark_seen(KEY, ["1", "2"])
+    store.mark_seen("other", ["3"])
+    store.mark_retry("2", "failed")
+    store.mark_retry("3", "failed")
+    assert store.retry_ids(KEY) == {"2"}
+
+
+def test_has_applied_and_applied_ids(store):
+    store.record({"Job ID": 11, "Job Title": "Engineer", "Company": "Acme"})
+    store.record({"Job ID": "12", "Company": "Globex"}, status="failed")
+    assert store.has_applied("11") and store.has_applied(11)
+    assert not store.has_applied("13") and not store.has_applied(None)
+    assert store.applied_ids(["11", 12, "13", None]) == {"11", "12"}
+    assert store.applied_ids([str(n) for n in range(1200)] + ["11"]) == {"11", "12"}
+
+
+def test_record_updates_an_existing_job(store):
+    store.record({"Job ID": "11", "Company": "Acme"}, status="failed", applied_at="2026-10-01T09:00:00")
+    store.record({"Job ID": "11", "Company": "Acme"}, applied_at="2026-10-02T09:00:00")
+    assert store.count() == 1
+    assert store.companies(since="2026-10-02") == ["Acme"]
+
+
+def test_legacy_companies_import_once(store):
+    settings = {"applied_companies": ["Acme", "Globex", "acme "]}
+    assert store.import_legacy_companies(settings) == 3
+    assert "applied_companies" not in settings
+    assert store.companies() == ["Acme", "Globex"]
+    assert store.count() == 2
+
+    # settings.json was not saved, so the next run sees the same list
+    assert store.import_legacy_companies({"applied_companies": ["Acme", "Globex"]}) == 2
+    assert store.count() == 2
+    assert store.import_legacy_companies({}) == 0
+    assert not store.has_applied(None)
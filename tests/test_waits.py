@@ -0,0 +1,34 @@
+import sys
+import pathlib
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+import waits
+
+
+# Detail pane that switches to the clicked job after a few polls
+class PaneDriver:
+    def __init__(self, shows, after=2):
+        self.shows = shows
+        self.after = after
+        self.polls = []
+
+    def execute_script(self, script, selector, job_id):
+        self.polls.append(job_id)
+        if len(self.polls) <= self.after:
+            return None
+        return {"pane": self.shows} if job_id in (None, self.shows) else None
+
+
+def test_waits_for_the_clicked_job():
+    driver = PaneDriver("42")
+    assert waits.wait_for_job_details(driver, "42", timeout=2) == {"pane": "42"}
+    assert driver.polls == ["42", "42", "42"]
+
+
+def test_previous_job_still_shown_times_out():
+    driver = PaneDriver("41", after=0)
+    assert waits.wait_for_job_details(driver, "42", timeout=0.2) is None
+
+
+def test_without_job_id_any_visible_pane_will_do():
+    assert waits.wait_for_job_details(PaneDriver("41", after=0), timeout=0.2) == {"pane": "41"}
@@ -0,0 +1,106 @@
+import time
+import random
+import logging
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import metrics
+
+# Default timeout for every DOM condition, in seconds
+DEFAULT_TIMEOUT = 10
+
+# Human-like pacing budget (min, max) in seconds, added on top of the DOM waits.
+# Set "human_delay": [0, 0] in settings.json to disable it entirely.
+DEFAULT_HUMAN_DELAY = (0.3, 1.2)
+_human_delay = DEFAULT_HUMAN_DELAY
+
+# Selectors for the page states we wait on
+JOB_CARD = (By.CLASS_NAME, "job-card-container")
+JOB_DETAILS = (By.CSS_SELECTOR, ".jobs-search__job-details--container, .jobs-details, .jobs-unified-top-card")
+EASY_APPLY_BUTTON = (By.CLASS_NAME, "jobs-apply-button")
+APPLY_MODAL = (By.CSS_SELECTOR, ".jobs-easy-apply-modal, .artdeco-modal")
+LOGIN_USERNAME = (By.ID, "username")
+
+# The detail pane, once it is visible and shows this job id (from the URL's
+# currentJobId, a /jobs/view/ page, or the pane's own link or data-job-id);
+# without an id any visible pane will do
+JOB_DETAILS_SHOWN_JS = r"""
+var pane = document.querySelector(arguments[0]);
+if (!pane || pane.getClientRects().length === 0) {
+    return null;
+}
+var id = arguments[1];
+if (!id) {
+    return pane;
+}
+var url = window.location.href;
+if (url.indexOf("currentJobId=" + id) >= 0 || url.indexOf("/jobs/view/" + id) >= 0 ||
+        pane.querySelector("a[href*='/jobs/view/" + id + "'], [data-job-id='" + id + "']")) {
+    return pane;
+}
+return null;
+"""
+
+
+# Configure the jitter budget from settings (expects "human_delay": [min, max])
+def configure_jitter(settings):
+    global _human_delay
+    delay = settings.get("human_delay", DEFAULT_HUMAN_DELAY)
+    try:
+        low, high = float(delay[0]), float(delay[1])
+        _human_delay = (max(0.0, min(low, high)), max(0.0, low, high))
+    except (TypeError, ValueError, IndexError):
+        logging.warning(f"Invalid human_delay setting {delay!r}, using default {DEFAULT_HUMAN_DELAY}.")
+        _human_delay = DEFAULT_HUMAN_DELAY
+    return _human_delay
+
+
+# Sleep for a random slice of the jitter budget to keep the pacing human-like
+def human_pause(scale=1.0):
+    low, high = _human_delay
+    if high <= 0:
+        return 0.0
+    delay = random.uniform(low, high) * scale
+    time.sleep(delay)
+    metrics.record("human_pause", delay)
+    return delay
+
+
+# Wait until the locator is present and return the element
+def wait_present(driver, locator, timeout=DEFAULT_TIMEOUT):
+    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+
+# Wait until the locator is clickable and return the element
+def wait_clickable(driver, locator, timeout=DEFAULT_TIMEOUT):
+    return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
+
+
+# Wait until the job result list has rendered at least one card
+@metrics.timed("wait:job_cards")
+def wait_for_job_cards(driver, timeout=DEFAULT_TIMEOUT):
+    try:
+        return WebDriverWait(driver, timeout).until(EC.presence_of_all_elements_located(JOB_CARD))
+    except Exception as e:
+        logging.info(f"No job cards appeared within {timeout}s: {e}")
+        return []
+
+
+# Wait until the detail pane is visible and shows job_id. The pane stays in
+# the page between clicks, so its presence alone says nothing about which
+# job it shows. Returns the pane, or None on timeout.
+@metrics.timed("wait:job_details")
+def wait_for_job_details(driver, job_id=None, timeout=DEFAULT_TIMEOUT):
+    try:
+        return WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script(JOB_DETAILS_SHOWN_JS, JOB_DETAILS[1], str(job_id) if job_id else None))
+    except Exception as e:
+        logging.info(f"Job details pane did not show job {job_id} within {timeout}s: {e}")
+        return None
+
+
+# Wait until the Easy Apply modal is open
+@metrics.timed("wait:apply_modal")
+def wait_for_apply_modal(driver, timeout=DEFAULT_TIMEOUT):
+    return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(APPLY_MODAL))
+
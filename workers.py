@@ -0,0 +1,97 @@
+import queue
+import logging
+import threading
+import itertools
+
+
+# Build one search spec per keyword x location combination
+def build_search_specs(keywords, locations, easy_apply, job_type, roles_to_display=None):
+    specs = []
+    for keyword, location in itertools.product(keywords, locations):
+        spec = {"keyword": keyword, "location": location, "easy_apply": easy_apply, "job_type": job_type}
+        if roles_to_display:
+            spec["roles_to_display"] = roles_to_display
+        specs.append(spec)
+    return specs
+
+
+# Key used to merge results from different searches into one job set
+def job_key(job):
+    if job.get("Job ID"):
+        return job["Job ID"]
+    return (job.get("Job Title"), job.get("Company"))
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        logging.warning(f"Could not quit worker browser: {e}")
+
+
+# One worker: owns a browser session and pulls specs until the queue is empty
+def _search_worker(worker_id, specs, make_driver, search, results, failures, lock):
+    driver = None
+    while True:
+        try:
+            spec = specs.get_nowait()
+        except queue.Empty:
+            break
+
+        try:
+            if driver is None:
+                driver = make_driver()
+                logging.info(f"Search worker {worker_id} started a browser session.")
+            jobs = search(driver, **spec)
+            with lock:
+                results.append((spec, jobs))
+            logging.info(f"Search worker {worker_id} found {len(jobs)} jobs for "
+                         f"'{spec['keyword']}' in '{spec['location']}'.")
+        except Exception as e:
+            logging.error(f"Search worker {worker_id} failed on '{spec['keyword']}' in "
+                          f"'{spec['location']}': {e}")
+            with lock:
+                failures.append((spec, str(e)))
+            # Start from a fresh session for the next spec
+            if driver is not None:
+                _quit(driver)
+                driver = None
+        finally:
+            specs.task_done()
+
+    if driver is not None:
+        _quit(driver)
+
+
+# Run every spec on a pool of browser sessions and merge the results into one
+# de-duplicated job list. make_driver returns a ready (logged in) driver and
+# search is called as search(driver, **spec). Returns (jobs, failures).
+def run_search_pool(specs, make_driver, search, workers=2):
+    work = queue.Queue()
+    for spec in specs:
+        work.put(spec)
+
+    results, failures = [], []
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(
+            target=_search_worker,
+            args=(worker_id, work, make_driver, search, results, failures, lock),
+            name=f"search-worker-{worker_id}",
+            daemon=True,
+        )
+        for worker_id in range(1, max(1, min(workers, len(specs))) + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    merged = {}
+    for spec, jobs in results:
+        for job in jobs:
+            key = job_key(job)
+            if key not in merged:
+                merged[key] = dict(job, Search=f"{spec['keyword']} / {spec['location']}")
+
+    return list(merged.values()), failures